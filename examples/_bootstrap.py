@@ -0,0 +1,14 @@
+"""
+Examples Bootstrap
+
+Makes the realman_teleop package importable when the examples are run
+from a source checkout. Importing this module more than once is harmless.
+"""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
@@ -7,21 +7,27 @@ Demonstrates basic usage of the realman_teleop library.
 
 import sys
 import argparse
-from pathlib import Path
+import numpy as np
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    from . import _bootstrap  # noqa: F401  (adds the repo root to sys.path)
+except ImportError:
+    import _bootstrap  # noqa: F401  (run as a script from examples/)
 
 from realman_teleop import RobotController
 from realman_teleop.config_loader import ConfigLoader
-import time
+
+
+def format_joints(joints):
+    """Format joint angles with two decimals."""
+    return np.array2string(np.asarray(joints, dtype=float), precision=2, separator=', ')
 
 
 def main():
     """Demonstrate basic robot control."""
     
     # Load configured settings from .env file
-    config = ConfigLoader.load_env_config()
-    robot_config = config.get('robot', {})
+    robot_config = ConfigLoader.prewarm()
     
     parser = argparse.ArgumentParser(
         description="Basic RealMan Robot Control Example",
@@ -30,21 +36,21 @@ def main():
     parser.add_argument(
         '--ip',
         type=str,
-        default=robot_config.get('ip', '192.168.10.18'),
-        help=f"Robot IP address (default from .env: {robot_config.get('ip', '192.168.10.18')})"
+        default=robot_config.ip,
+        help=f"Robot IP address (default from .env: {robot_config.ip})"
     )
     parser.add_argument(
         '--model',
         type=str,
-        default=robot_config.get('model', 'RM65'),
+        default=robot_config.model,
         choices=['RM65', 'RM75', 'RML63', 'ECO65', 'GEN72', 'R1D2'],
-        help=f"Robot model (default from .env: {robot_config.get('model', 'RM65')})"
+        help=f"Robot model (default from .env: {robot_config.model})"
     )
     parser.add_argument(
         '--port',
         type=int,
-        default=robot_config.get('port', 8080),
-        help=f"Robot port (default from .env: {robot_config.get('port', 8080)})"
+        default=robot_config.port,
+        help=f"Robot port (default from .env: {robot_config.port})"
     )
     parser.add_argument(
         '--dof',
@@ -52,29 +58,40 @@ def main():
         choices=[6, 7],
         help='Robot degrees of freedom (6 or 7). Auto-detects if not specified.'
     )
+    parser.add_argument(
+        '--verify',
+        action='store_true',
+        help='Read joint angles back after the joint move to check the return position'
+    )
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Print detailed joint and pose values at each step'
+    )
     
     args = parser.parse_args()
     
     # Get DOF from args, config, or let it auto-detect
-    dof = args.dof or robot_config.get('dof', None)
+    dof = args.dof or robot_config.dof
     
-    # Create robot controller
-    print("=" * 60)
-    print("RealMan Robot - Basic API Example")
-    print("=" * 60)
-    print(f"Robot IP: {args.ip}")
-    print(f"Robot Model: {args.model}")
-    print(f"Robot Port: {args.port}")
-    if dof:
-        print(f"Robot DOF: {dof} (configured)")
-    else:
-        print(f"Robot DOF: Auto-detect")
-    print()
-    print("ℹ️  Settings loaded from .env file")
-    print("   To change defaults, run: python setup_robot.py")
-    print("=" * 60)
-    print()
+    # Print the banner with a single write
+    banner = [
+        "=" * 60,
+        "RealMan Robot - Basic API Example",
+        "=" * 60,
+        f"Robot IP: {args.ip}",
+        f"Robot Model: {args.model}",
+        f"Robot Port: {args.port}",
+        f"Robot DOF: {dof} (configured)" if dof else "Robot DOF: Auto-detect",
+        "",
+        "ℹ️  Settings loaded from .env file",
+        "   To change defaults, run: python setup_robot.py",
+        "=" * 60,
+        "",
+    ]
+    sys.stdout.write("\n".join(banner) + "\n")
     
+    # Create robot controller
     print("Creating robot controller...")
     robot = RobotController(
         ip=args.ip,
@@ -93,52 +110,56 @@ def main():
     
     try:
         # Get current state
-        print("\n--- Current Robot State ---")
-        joints = robot.get_current_joint_angles()
-        print(f"Joint angles: {joints}")
-        
-        pose = robot.get_current_pose()
-        print(f"End-effector pose: {pose}")
+        state = robot.get_arm_state() or {}
+        joints = state.get('joint_angles')
+        pose = state.get('pose')
+        if args.verbose:
+            print("\n--- Current Robot State ---")
+            print(f"Joint angles: {joints}")
+            print(f"End-effector pose: {pose}")
         
         if not joints or not pose:
             print("Error: Could not read robot state")
             return 1
         
-        # Move joints by small offset (safer than absolute positions)
-        print("\n--- Moving joints by +5 degrees ---")
-        target_joints = [j + 5.0 for j in joints]
-        print(f"Current: {[f'{j:.2f}' for j in joints]}")
-        print(f"Target:  {[f'{j:.2f}' for j in target_joints]}")
-        robot.movej(target_joints, velocity=20, block=True)
-        time.sleep(1)
+        # Move joints by small offset and back (safer than absolute positions).
+        # Both waypoints go out as one connected trajectory.
+        print("\n--- Moving joints by +5 degrees and back ---")
+        original_joints = np.asarray(joints, dtype=float)
+        target_joints = original_joints + 5.0
+        if args.verbose:
+            print(f"Current: {format_joints(original_joints)}")
+            print(f"Target:  {format_joints(target_joints)}")
+        robot.movej_sequence(
+            [target_joints.tolist(), original_joints.tolist()],
+            velocity=20,
+            block=True
+        )
         
-        # Move back by reading current and subtracting
-        print("\n--- Moving joints by -5 degrees (back to start) ---")
-        current_joints = robot.get_current_joint_angles()
-        if current_joints:
-            target_joints = [j - 5.0 for j in current_joints]
-            print(f"Current: {[f'{j:.2f}' for j in current_joints]}")
-            print(f"Target:  {[f'{j:.2f}' for j in target_joints]}")
-            robot.movej(target_joints, velocity=20, block=True)
-            time.sleep(1)
+        if args.verify:
+            returned_joints = robot.get_current_joint_angles()
+            if returned_joints:
+                error = np.abs(np.asarray(returned_joints, dtype=float) - original_joints).max()
+                print(f"Returned: {format_joints(returned_joints)} (max error {error:.2f}°)")
         
         # Move in Cartesian space by small offset
         print("\n--- Moving in Cartesian space ---")
         current_pose = robot.get_current_pose()
         if current_pose:
             # Move 5cm up (in Z direction) - safer than X/Y movement
-            target_pose = current_pose.copy()
+            target_pose = np.array(current_pose, dtype=float)
             target_pose[2] += 0.05  # 5cm up
-            print(f"Current Z: {current_pose[2]:.4f}m")
-            print(f"Target Z:  {target_pose[2]:.4f}m (+5cm)")
-            robot.movel(target_pose, velocity=20, block=True)
-            time.sleep(1)
+            if args.verbose:
+                print(f"Current Z: {current_pose[2]:.4f}m")
+                print(f"Target Z:  {target_pose[2]:.4f}m (+5cm)")
+            robot.movel(target_pose.tolist(), velocity=20, block=True)
             
             # Move back down
             print("\n--- Moving back down ---")
             target_pose[2] -= 0.05  # Back down
-            print(f"Target Z:  {target_pose[2]:.4f}m")
-            robot.movel(target_pose, velocity=20, block=True)
+            if args.verbose:
+                print(f"Target Z:  {target_pose[2]:.4f}m")
+            robot.movel(target_pose.tolist(), velocity=20, block=True)
         
         print("\n--- Success! ---")
         
@@ -6,10 +6,12 @@ Simple script to test gripper open/close functionality.
 """
 
 import sys
-import time
-from pathlib import Path
+import argparse
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    from . import _bootstrap  # noqa: F401  (adds the repo root to sys.path)
+except ImportError:
+    import _bootstrap  # noqa: F401  (run as a script from examples/)
 
 from realman_teleop import RobotController
 from realman_teleop.config_loader import ConfigLoader
@@ -17,25 +19,34 @@ from realman_teleop.config_loader import ConfigLoader
 
 def main():
     """Test gripper control."""
+    parser = argparse.ArgumentParser(description="RealMan Robot Gripper Control Test")
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Print the full gripper state before and after the test'
+    )
+    args = parser.parse_args()
     
     # Load configuration
-    config = ConfigLoader.load_env_config()
-    robot_config = config.get('robot', {})
+    robot_config = ConfigLoader.prewarm()
     
-    print("=" * 60)
-    print("RealMan Robot - Gripper Control Test")
-    print("=" * 60)
-    print(f"Robot IP: {robot_config.get('ip', '192.168.10.18')}")
-    print(f"Robot Model: {robot_config.get('model', 'R1D2')}")
-    print("=" * 60)
-    print()
+    banner = [
+        "=" * 60,
+        "RealMan Robot - Gripper Control Test",
+        "=" * 60,
+        f"Robot IP: {robot_config.ip}",
+        f"Robot Model: {robot_config.model}",
+        "=" * 60,
+        "",
+    ]
+    sys.stdout.write("\n".join(banner) + "\n")
     
     # Create robot controller
     robot = RobotController(
-        ip=robot_config.get('ip', '192.168.10.18'),
-        port=robot_config.get('port', 8080),
-        model=robot_config.get('model', 'R1D2'),
-        dof=robot_config.get('dof')
+        ip=robot_config.ip,
+        port=robot_config.port,
+        model=robot_config.model,
+        dof=robot_config.dof
     )
     
     # Connect to robot
@@ -48,58 +59,46 @@ def main():
     
     try:
         # Get initial gripper state
-        print("--- Initial Gripper State ---")
-        state = robot.gripper_get_state()
-        if state:
-            print(f"Gripper state: {state}")
-        print()
-        
-        # Test 1: Open gripper
-        print("--- Test 1: Opening Gripper ---")
-        result = robot.gripper_open(speed=500)
-        if result == 0:
-            print("✓ Gripper opened successfully")
-        else:
-            print(f"⚠ Gripper open returned code: {result}")
-        time.sleep(2)
-        print()
-        
-        # Test 2: Close gripper with force control
-        print("--- Test 2: Closing Gripper (Force Control) ---")
-        result = robot.gripper_close(speed=500, force=300)
-        if result == 0:
-            print("✓ Gripper closed successfully")
-        else:
-            print(f"⚠ Gripper close returned code: {result}")
-        time.sleep(2)
-        print()
+        if args.verbose:
+            print("--- Initial Gripper State ---")
+            state = robot.gripper_get_state()
+            if state:
+                print(f"Gripper state: {state}")
+            print()
         
-        # Test 3: Set specific position (half open)
-        print("--- Test 3: Setting Gripper to Half Open (500) ---")
-        result = robot.gripper_set_position(500)
-        if result == 0:
-            print("✓ Gripper position set successfully")
-        else:
-            print(f"⚠ Gripper set position returned code: {result}")
-        time.sleep(2)
-        print()
+        # Submit each command without blocking and poll the gripper until
+        # it settles, instead of waiting a fixed time per step
+        steps = [
+            ("Test 1: Opening Gripper", "Gripper opened successfully",
+             lambda: robot.gripper_open(speed=500, block=False)),
+            ("Test 2: Closing Gripper (Force Control)", "Gripper closed successfully",
+             lambda: robot.gripper_close(speed=500, force=300, block=False)),
+            ("Test 3: Setting Gripper to Half Open (500)", "Gripper position set successfully",
+             lambda: robot.gripper_set_position(500, block=False)),
+            ("Test 4: Fully Opening Gripper", "Gripper fully opened",
+             lambda: robot.gripper_open(speed=800, block=False)),
+        ]
         
-        # Test 4: Fully open again
-        print("--- Test 4: Fully Opening Gripper ---")
-        result = robot.gripper_open(speed=800)
-        if result == 0:
-            print("✓ Gripper fully opened")
-        else:
-            print(f"⚠ Gripper open returned code: {result}")
-        print()
+        for title, success_message, command in steps:
+            print(f"--- {title} ---")
+            result = command()
+            if result != 0:
+                print(f"⚠ Gripper command returned code: {result}")
+            elif robot.gripper_wait_idle(timeout=3.0):
+                print(f"✓ {success_message}")
+            else:
+                print("⚠ Gripper did not settle within 3 s")
+            print()
         
         # Get final gripper state
-        print("--- Final Gripper State ---")
-        state = robot.gripper_get_state()
-        if state:
-            print(f"Gripper state: {state}")
+        if args.verbose:
+            print("--- Final Gripper State ---")
+            state = robot.gripper_get_state()
+            if state:
+                print(f"Gripper state: {state}")
+            print()
         
-        print("\n--- Test Complete! ---")
+        print("--- Test Complete! ---")
         
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -8,13 +8,34 @@ Control RealMan robot with gamepad/joystick.
 import sys
 import argparse
 import logging
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    from . import _bootstrap  # noqa: F401  (adds the repo root to sys.path)
+except ImportError:
+    import _bootstrap  # noqa: F401  (run as a script from examples/)
 
-from realman_teleop import RobotController, JoystickTeleop
-from realman_teleop.config_loader import ConfigLoader
-from realman_teleop.utils import setup_logging
+CONTROL_HELP = """\
+============================================================
+JOYSTICK CONTROLS
+============================================================
+Left Stick:
+  Horizontal: Move left/right
+  Vertical: Move forward/backward
+
+Right Stick:
+  Controls rotation and vertical movement
+
+Buttons:
+  LB/L1: Hold to enable motion (DEADMAN SWITCH)
+  RB/R1: Hold for turbo speed
+  Back/Select: Emergency stop
+  Start: Switch mode (Cartesian/Joint)
+  B/Circle: Move to home position
+============================================================
+
+⚠️  WARNING: Robot will move when LB/L1 is held!
+Press Ctrl+C or emergency stop button to quit
+"""
 
 
 def main():
@@ -53,7 +74,18 @@ def main():
         '--rate',
         type=float,
         default=100.0,
-        help='Control update rate in Hz (default: 100)'
+        help='Maximum control update rate in Hz (default: 100); '
+             'the loop waits for input events while idle'
+    )
+    parser.add_argument(
+        '--async-commands',
+        action='store_true',
+        help='Send motion commands from a background thread'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Stream targets to the arm without per-command trajectory planning'
     )
     parser.add_argument(
         '--log-level',
@@ -65,8 +97,14 @@ def main():
     
     args = parser.parse_args()
     
-    # Setup logging
-    setup_logging(args.log_level)
+    # Deferred so --help and argument errors don't load pygame or the robot SDK
+    from realman_teleop import RobotController, JoystickTeleop
+    from realman_teleop.config_loader import ConfigLoader
+    from realman_teleop.utils import setup_logging
+    
+    # Setup logging; records are written from a background thread so the
+    # control loop never waits on the terminal
+    setup_logging(args.log_level, minimal_records=True)
     logger = logging.getLogger(__name__)
     
     # Load configuration
@@ -77,14 +115,17 @@ def main():
     robot_ip = args.ip or config['robot']['ip']
     robot_model = args.model or config['robot']['model']
     
-    logger.info("=" * 60)
-    logger.info("RealMan Robot Joystick Teleoperation")
-    logger.info("=" * 60)
-    logger.info(f"Robot IP: {robot_ip}")
-    logger.info(f"Robot Model: {robot_model}")
-    logger.info(f"Joystick Device: {args.device}")
-    logger.info(f"Update Rate: {args.rate} Hz")
-    logger.info("=" * 60)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n".join([
+            "=" * 60,
+            "RealMan Robot Joystick Teleoperation",
+            "=" * 60,
+            f"Robot IP: {robot_ip}",
+            f"Robot Model: {robot_model}",
+            f"Joystick Device: {args.device}",
+            f"Update Rate: up to {args.rate} Hz (event-driven while idle)",
+            "=" * 60,
+        ]))
     
     # Create robot controller
     robot = RobotController(
@@ -109,25 +150,12 @@ def main():
             deadzone=joy_config.get('joystick', {}).get('deadzone', 0.1),
             normal_speed=joy_config.get('speeds', {}).get('normal', {}).get('linear', 0.1),
             turbo_speed=joy_config.get('speeds', {}).get('turbo', {}).get('linear', 0.3),
+            event_driven=True,
+            async_commands=args.async_commands,
+            stream_commands=args.stream,
         )
         
-        logger.info("\n" + "=" * 60)
-        logger.info("JOYSTICK CONTROLS")
-        logger.info("=" * 60)
-        logger.info("Left Stick:")
-        logger.info("  Horizontal: Move left/right")
-        logger.info("  Vertical: Move forward/backward")
-        logger.info("\nRight Stick:")
-        logger.info("  Controls rotation and vertical movement")
-        logger.info("\nButtons:")
-        logger.info("  LB/L1: Hold to enable motion (DEADMAN SWITCH)")
-        logger.info("  RB/R1: Hold for turbo speed")
-        logger.info("  Back/Select: Emergency stop")
-        logger.info("  Start: Switch mode (Cartesian/Joint)")
-        logger.info("  B/Circle: Move to home position")
-        logger.info("=" * 60)
-        logger.info("\n⚠️  WARNING: Robot will move when LB/L1 is held!")
-        logger.info("Press Ctrl+C or emergency stop button to quit\n")
+        logger.info("\n%s", CONTROL_HELP)
         
         # Run teleoperation
         teleop.run()
@@ -136,7 +164,7 @@ def main():
         logger.info("\nShutting down...")
     
     except Exception as e:
-        logger.error(f"Error: {e}", exc_info=True)
+        logger.error("Error: %s", e, exc_info=True)
         return 1
     
     finally:
@@ -8,15 +8,42 @@ Basic example of controlling RealMan robot with keyboard.
 import sys
 import argparse
 import logging
-from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    from . import _bootstrap  # noqa: F401  (adds the repo root to sys.path)
+except ImportError:
+    import _bootstrap  # noqa: F401  (run as a script from examples/)
 
 from realman_teleop import RobotController, KeyboardTeleop
 from realman_teleop.config_loader import ConfigLoader
 from realman_teleop.utils import setup_logging
 
+CONTROL_HELP = """\
+============================================================
+KEYBOARD CONTROLS
+============================================================
+Movement:
+  W/S: Forward/Backward
+  A/D: Left/Right
+  Q/E: Up/Down
+
+Rotation:
+  I/K: Pitch
+  J/L: Roll
+  U/O: Yaw
+
+Control:
+  SHIFT: Hold to enable motion (DEADMAN SWITCH)
+  SPACE: Emergency stop
+  TAB: Switch mode (Cartesian/Joint)
+  +/-: Increase/Decrease speed
+  H: Move to home position
+============================================================
+
+⚠️  WARNING: Robot will move when SHIFT is held!
+Press Ctrl+C to quit
+"""
+
 
 def main():
     """Main function."""
@@ -48,7 +75,18 @@ def main():
         '--rate',
         type=float,
         default=100.0,
-        help='Control update rate in Hz (default: 100)'
+        help='Maximum control update rate in Hz (default: 100); '
+             'the loop waits for key events while idle'
+    )
+    parser.add_argument(
+        '--async-commands',
+        action='store_true',
+        help='Send motion commands from a background thread'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Stream targets to the arm without per-command trajectory planning'
     )
     parser.add_argument(
         '--log-level',
@@ -60,8 +98,9 @@ def main():
     
     args = parser.parse_args()
     
-    # Setup logging
-    setup_logging(args.log_level)
+    # Setup logging; records are written from a background thread so the
+    # control loop never waits on the terminal
+    setup_logging(args.log_level, minimal_records=True)
     logger = logging.getLogger(__name__)
     
     # Load configuration
@@ -71,14 +110,17 @@ def main():
     robot_ip = args.ip or config['robot']['ip']
     robot_model = args.model or config['robot']['model']
     
-    logger.info("=" * 60)
-    logger.info("RealMan Robot Keyboard Teleoperation")
-    logger.info("=" * 60)
-    logger.info(f"Robot IP: {robot_ip}")
-    logger.info(f"Robot Model: {robot_model}")
-    logger.info(f"Update Rate: {args.rate} Hz")
-    logger.info(f"Speed: {args.speed}")
-    logger.info("=" * 60)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n".join([
+            "=" * 60,
+            "RealMan Robot Keyboard Teleoperation",
+            "=" * 60,
+            f"Robot IP: {robot_ip}",
+            f"Robot Model: {robot_model}",
+            f"Update Rate: up to {args.rate} Hz (event-driven while idle)",
+            f"Speed: {args.speed}",
+            "=" * 60,
+        ]))
     
     # Create robot controller
     robot = RobotController(
@@ -99,28 +141,12 @@ def main():
             update_rate=args.rate,
             linear_speed=args.speed,
             angular_speed=args.speed * 3.0,  # Angular typically faster
+            event_driven=True,
+            async_commands=args.async_commands,
+            stream_commands=args.stream,
         )
         
-        logger.info("\n" + "=" * 60)
-        logger.info("KEYBOARD CONTROLS")
-        logger.info("=" * 60)
-        logger.info("Movement:")
-        logger.info("  W/S: Forward/Backward")
-        logger.info("  A/D: Left/Right")
-        logger.info("  Q/E: Up/Down")
-        logger.info("\nRotation:")
-        logger.info("  I/K: Pitch")
-        logger.info("  J/L: Roll")
-        logger.info("  U/O: Yaw")
-        logger.info("\nControl:")
-        logger.info("  SHIFT: Hold to enable motion (DEADMAN SWITCH)")
-        logger.info("  SPACE: Emergency stop")
-        logger.info("  TAB: Switch mode (Cartesian/Joint)")
-        logger.info("  +/-: Increase/Decrease speed")
-        logger.info("  H: Move to home position")
-        logger.info("=" * 60)
-        logger.info("\n⚠️  WARNING: Robot will move when SHIFT is held!")
-        logger.info("Press Ctrl+C to quit\n")
+        logger.info("\n%s", CONTROL_HELP)
         
         # Run teleoperation
         teleop.run()
@@ -129,7 +155,7 @@ def main():
         logger.info("\nShutting down...")
     
     except Exception as e:
-        logger.error(f"Error: {e}", exc_info=True)
+        logger.error("Error: %s", e, exc_info=True)
         return 1
     
     finally:
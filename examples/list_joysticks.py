@@ -6,11 +6,11 @@ Lists all available joystick/gamepad devices.
 """
 
 import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from realman_teleop.joystick_teleop import list_joysticks
+try:
+    from . import _bootstrap  # noqa: F401  (adds the repo root to sys.path)
+except ImportError:
+    import _bootstrap  # noqa: F401  (run as a script from examples/)
 
 
 def main():
@@ -19,6 +19,8 @@ def main():
     print("RealMan Robot - Joystick Device Listing")
     print("=" * 60)
     
+    # Deferred so pygame and the robot SDK are only loaded when listing
+    from realman_teleop.joystick_teleop import list_joysticks
     list_joysticks()
     
     print("\n" + "=" * 60)
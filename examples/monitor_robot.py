@@ -9,10 +9,13 @@ Safe way to verify connection before teleoperation.
 import sys
 import argparse
 import logging
+import threading
 import time
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    from . import _bootstrap  # noqa: F401  (adds the repo root to sys.path)
+except ImportError:
+    import _bootstrap  # noqa: F401  (run as a script from examples/)
 
 from realman_teleop import RobotController
 from realman_teleop.config_loader import ConfigLoader
@@ -28,99 +31,266 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
+
+POSE_TEMPLATE = "Pos: [%6.3f, %6.3f, %6.3f] m\n     Rot: [%6.3f, %6.3f, %6.3f] rad"
+
 
 def format_joint_angles(joints):
     """Format joint angles for display."""
     if joints is None:
         return "N/A"
-    return ", ".join([f"{j:7.2f}°" for j in joints])
+    return ", ".join("%7.2f°" % j for j in joints)
 
 
 def format_pose(pose):
     """Format pose for display."""
     if pose is None:
         return "N/A"
-    pos = f"[{pose[0]:6.3f}, {pose[1]:6.3f}, {pose[2]:6.3f}] m"
-    rot = f"[{pose[3]:6.3f}, {pose[4]:6.3f}, {pose[5]:6.3f}] rad"
-    return f"Pos: {pos}\n     Rot: {rot}"
+    return POSE_TEMPLATE % tuple(pose[:6])
 
 
 def format_velocities(velocities):
     """Format velocities for display."""
     if velocities is None:
         return "N/A"
-    return ", ".join([f"{v:7.2f}°/s" for v in velocities])
+    return ", ".join("%7.2f°/s" % v for v in velocities)
+
+
+class FormatCache:
+    """
+    Format a vector of floats, re-formatting only entries that changed.
+    
+    The robot reports identical values for long stretches while idle, so
+    the last values and their strings are kept and reused.
+    """
+    
+    def __init__(self, formats):
+        """
+        Initialize the cache.
+        
+        Args:
+            formats: One %-format string per vector entry
+        """
+        self.formats = tuple(formats)
+        self.values = ()
+        self.strings = []
+    
+    def format(self, values):
+        """
+        Format values, reusing cached strings for unchanged entries.
+        
+        Args:
+            values: Sequence of floats
+            
+        Returns:
+            List of formatted strings (shared, do not modify)
+        """
+        values = tuple(values)
+        last = self.values
+        if values == last:
+            return self.strings
+        
+        formats = self.formats
+        if len(values) != len(last):
+            self.strings = [formats[i] % v for i, v in enumerate(values)]
+        else:
+            strings = self.strings
+            for i, v in enumerate(values):
+                if v != last[i]:
+                    strings[i] = formats[i] % v
+        self.values = values
+        return self.strings
+
+
+POSE_ROWS = (
+    ("Position X", "m"),
+    ("Position Y", "m"),
+    ("Position Z", "m"),
+    ("Rotation RX", "rad"),
+    ("Rotation RY", "rad"),
+    ("Rotation RZ", "rad"),
+)
+
+SEPARATOR = "=" * 80
+FOOTER_LINES = ["", SEPARATOR, "Press Ctrl+C to stop monitoring", SEPARATOR]
+
+# Joint angle bars for the simple monitor, one block per 10 degrees (max 18)
+ANGLE_BARS = tuple("█" * n for n in range(19))
+
+
+class StatePoller:
+    """
+    Poll robot state on a background thread.
+    
+    The display loop reads the most recent snapshot from ``latest`` without
+    waiting on the network, so render rate and poll rate are independent.
+    """
+    
+    def __init__(self, robot, interval=0.01):
+        """
+        Initialize the poller.
+        
+        Args:
+            robot: Connected RobotController
+            interval: Minimum time between polls in seconds
+        """
+        self.robot = robot
+        self.interval = interval
+        self.latest = None
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="state-poller", daemon=True)
+    
+    def start(self):
+        """Start polling."""
+        self._thread.start()
+    
+    def stop(self, timeout=1.0):
+        """Stop polling and wait for the thread to exit."""
+        self._stop_event.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+    
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                state = self.robot.get_arm_state()
+            except Exception as e:
+                logger.debug("State poll failed: %s", e)
+                state = None
+            # Single reference assignment, atomic under the GIL
+            self.latest = state
+            self._stop_event.wait(self.interval)
+
+
+def wait_for_next_tick(next_tick, period):
+    """
+    Sleep until the next frame deadline.
+    
+    Args:
+        next_tick: Deadline of the frame just drawn (time.monotonic() clock)
+        period: Frame period in seconds
+        
+    Returns:
+        Deadline of the following frame. When a frame overruns, the schedule
+        restarts from now instead of bursting to catch up.
+    """
+    next_tick += period
+    remaining = next_tick - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+        return next_tick
+    return time.monotonic()
+
+
+def build_state_table(robot):
+    """
+    Build the state table once with placeholder values.
+    
+    Args:
+        robot: Connected RobotController
+        
+    Returns:
+        Tuple of (table, row index dict). The row dict maps 'status',
+        'joints', 'pose' and 'velocities' to the first value row of each group.
+    """
+    dof = robot.dof
+    table = Table(title="🤖 Robot State Monitor", show_header=True, header_style="bold magenta")
+    table.add_column("Property", style="cyan", width=20)
+    table.add_column("Value", style="green")
+    
+    # Static robot info
+    table.add_row("Robot Model", robot.model_name)
+    table.add_row("IP Address", f"{robot.ip}:{robot.port}")
+    table.add_row("DOF", str(dof))
+    table.add_row("Status", "N/A", end_section=True)
+    
+    # Placeholder rows, overwritten in place every tick
+    for i in range(1, dof + 1):
+        table.add_row(f"Joint {i}", "N/A", end_section=(i == dof))
+    for i, (label, _) in enumerate(POSE_ROWS):
+        table.add_row(label, "N/A", end_section=(i == len(POSE_ROWS) - 1))
+    for i in range(1, dof + 1):
+        table.add_row(f"Velocity J{i}", "N/A")
+    
+    rows = {
+        'status': 3,
+        'joints': 4,
+        'pose': 4 + dof,
+        'velocities': 4 + dof + len(POSE_ROWS),
+    }
+    return table, rows
 
 
 def monitor_with_rich(robot, update_rate=10):
     """Monitor robot state with rich terminal UI."""
     console = Console()
+    dof = robot.dof
+    
+    # Table, panel and layout are built once; only cell values change per tick
+    table, rows = build_state_table(robot)
+    cells = table.columns[1]._cells
+    
+    # Update plan fixed at startup for this robot's DOF:
+    # (state key, formatter, first row, row count, placeholder cells)
+    plan = tuple(
+        (key, FormatCache(formats), rows[group], len(formats), ["N/A"] * len(formats))
+        for key, group, formats in (
+            ('joint_angles', 'joints', ["%8.2f°"] * dof),
+            ('pose', 'pose', ["%8.4f " + unit for _, unit in POSE_ROWS]),
+            ('joint_velocities', 'velocities', ["%8.2f°/s"] * dof),
+        )
+    )
+    instructions = Panel(
+        "[yellow]Press Ctrl+C to stop monitoring[/yellow]\n"
+        "[dim]This is READ-ONLY mode - no commands are sent to the robot[/dim]",
+        title="Controls",
+        border_style="blue"
+    )
+    layout = Layout()
+    layout.split_column(
+        Layout(table, size=2 * dof + 17),
+        Layout(instructions, size=4)
+    )
+    
+    poller = StatePoller(robot)
+    poller.start()
+    period = 1.0 / update_rate
+    next_tick = time.monotonic()
     
-    with Live(console=console, refresh_per_second=update_rate) as live:
+    last_state = None
+    
+    # Frames are redrawn explicitly, and only when the state changed
+    with Live(layout, console=console, auto_refresh=False) as live:
         try:
             while True:
-                # Get robot state
-                joints = robot.get_current_joint_angles()
-                pose = robot.get_current_pose()
-                velocities = robot.get_joint_velocities()
-                is_moving = robot.is_moving()
-                
-                # Create display table
-                table = Table(title="🤖 Robot State Monitor", show_header=True, header_style="bold magenta")
-                table.add_column("Property", style="cyan", width=20)
-                table.add_column("Value", style="green")
-                
-                # Add robot info
-                table.add_row("Robot Model", robot.model_name)
-                table.add_row("IP Address", f"{robot.ip}:{robot.port}")
-                table.add_row("DOF", str(robot.dof))
-                table.add_row("Status", "🟢 Moving" if is_moving else "🟡 Idle")
-                
-                table.add_section()
+                # Latest snapshot from the poller thread
+                state = poller.latest or {}
+                if state == last_state:
+                    next_tick = wait_for_next_tick(next_tick, period)
+                    continue
+                last_state = state
                 
-                # Add joint angles
-                if joints:
-                    for i, angle in enumerate(joints, 1):
-                        table.add_row(f"Joint {i}", f"{angle:8.2f}°")
+                is_moving = state.get('is_moving', False)
+                cells[rows['status']] = "🟢 Moving" if is_moving else "🟡 Idle"
                 
-                table.add_section()
+                # Whole row groups are replaced with one slice assignment each
+                for key, cache, start, count, placeholder in plan:
+                    values = state.get(key)
+                    if values and len(values) >= count:
+                        cells[start:start + count] = cache.format(values)[:count]
+                    else:
+                        cells[start:start + count] = placeholder
                 
-                # Add pose
-                if pose:
-                    table.add_row("Position X", f"{pose[0]:8.4f} m")
-                    table.add_row("Position Y", f"{pose[1]:8.4f} m")
-                    table.add_row("Position Z", f"{pose[2]:8.4f} m")
-                    table.add_row("Rotation RX", f"{pose[3]:8.4f} rad")
-                    table.add_row("Rotation RY", f"{pose[4]:8.4f} rad")
-                    table.add_row("Rotation RZ", f"{pose[5]:8.4f} rad")
-                
-                table.add_section()
-                
-                # Add velocities
-                if velocities:
-                    for i, vel in enumerate(velocities, 1):
-                        table.add_row(f"Velocity J{i}", f"{vel:8.2f}°/s")
-                
-                # Create panel with instructions
-                instructions = Panel(
-                    "[yellow]Press Ctrl+C to stop monitoring[/yellow]\n"
-                    "[dim]This is READ-ONLY mode - no commands are sent to the robot[/dim]",
-                    title="Controls",
-                    border_style="blue"
-                )
-                
-                # Update display
-                layout = Layout()
-                layout.split_column(
-                    Layout(table, size=len(joints or []) + 15),
-                    Layout(instructions, size=4)
-                )
-                
-                live.update(layout)
-                time.sleep(1.0 / update_rate)
+                live.refresh()
+                next_tick = wait_for_next_tick(next_tick, period)
                 
         except KeyboardInterrupt:
             console.print("\n[yellow]Monitoring stopped by user[/yellow]")
+        
+        finally:
+            poller.stop()
 
 
 def monitor_simple(robot, update_rate=10):
@@ -135,53 +305,75 @@ def monitor_simple(robot, update_rate=10):
     print("\nPress Ctrl+C to stop monitoring")
     print("This is READ-ONLY mode - no commands are sent to the robot\n")
     
+    joint_cache = FormatCache(["%8.2f°"] * robot.dof)
+    pose_cache = FormatCache(
+        ["X=%7.4fm", "Y=%7.4fm", "Z=%7.4fm", "RX=%7.4frad", "RY=%7.4frad", "RZ=%7.4frad"]
+    )
+    velocity_cache = FormatCache(["%8.2f°/s"] * robot.dof)
+    
+    poller = StatePoller(robot)
+    poller.start()
+    period = 1.0 / update_rate
+    next_tick = time.monotonic()
+    
+    # Start from a clean screen; frames after this only overwrite in place
+    sys.stdout.write("\033[2J")
+    
     try:
         while True:
-            # Get robot state
-            joints = robot.get_current_joint_angles()
-            pose = robot.get_current_pose()
-            velocities = robot.get_joint_velocities()
-            is_moving = robot.is_moving()
-            
-            # Clear screen (optional)
-            print("\033[2J\033[H", end="")  # ANSI escape codes to clear screen
-            
-            print("=" * 80)
-            print(f"Robot State Monitor - {time.strftime('%Y-%m-%d %H:%M:%S')}")
-            print("=" * 80)
+            # Latest snapshot from the poller thread
+            state = poller.latest or {}
+            joints = state.get('joint_angles')
+            pose = state.get('pose')
+            velocities = state.get('joint_velocities')
+            is_moving = state.get('is_moving', False)
             
-            print(f"\nStatus: {'🟢 Moving' if is_moving else '🟡 Idle'}")
-            
-            print("\n--- Joint Angles (degrees) ---")
+            lines = [
+                SEPARATOR,
+                f"Robot State Monitor - {time.strftime('%Y-%m-%d %H:%M:%S')}",
+                SEPARATOR,
+                "",
+                "Status: 🟢 Moving" if is_moving else "Status: 🟡 Idle",
+                "",
+                "--- Joint Angles (degrees) ---",
+            ]
             if joints:
-                for i, angle in enumerate(joints, 1):
-                    bar = "█" * int(abs(angle) / 10) if abs(angle) < 180 else "█" * 18
-                    print(f"  Joint {i}: {angle:8.2f}° {bar}")
+                strings = joint_cache.format(joints)
+                for i, angle in enumerate(joints):
+                    bar = ANGLE_BARS[min(int(abs(angle) / 10), 18)]
+                    lines.append(f"  Joint {i + 1}: {strings[i]} {bar}")
             else:
-                print("  No data available")
+                lines.append("  No data available")
             
-            print("\n--- End-Effector Pose ---")
+            lines += ["", "--- End-Effector Pose ---"]
             if pose:
-                print(f"  Position: X={pose[0]:7.4f}m  Y={pose[1]:7.4f}m  Z={pose[2]:7.4f}m")
-                print(f"  Rotation: RX={pose[3]:7.4f}rad RY={pose[4]:7.4f}rad RZ={pose[5]:7.4f}rad")
+                strings = pose_cache.format(pose)
+                lines.append(f"  Position: {strings[0]}  {strings[1]}  {strings[2]}")
+                lines.append(f"  Rotation: {strings[3]} {strings[4]} {strings[5]}")
             else:
-                print("  No data available")
+                lines.append("  No data available")
             
-            print("\n--- Joint Velocities (deg/s) ---")
+            lines += ["", "--- Joint Velocities (deg/s) ---"]
             if velocities:
-                for i, vel in enumerate(velocities, 1):
-                    print(f"  Joint {i}: {vel:8.2f}°/s")
+                for i, text in enumerate(velocity_cache.format(velocities), 1):
+                    lines.append(f"  Joint {i}: {text}")
             else:
-                print("  No data available")
+                lines.append("  No data available")
+            
+            lines += FOOTER_LINES
             
-            print("\n" + "=" * 80)
-            print("Press Ctrl+C to stop monitoring")
-            print("=" * 80)
+            # Redraw in place: cursor home, clear each line's tail and
+            # anything left below, all in a single write
+            sys.stdout.write("\033[H" + "\033[K\n".join(lines) + "\033[K\n\033[J")
+            sys.stdout.flush()
             
-            time.sleep(1.0 / update_rate)
+            next_tick = wait_for_next_tick(next_tick, period)
             
     except KeyboardInterrupt:
         print("\n\nMonitoring stopped by user")
+    
+    finally:
+        poller.stop()
 
 
 def main():
@@ -245,17 +437,17 @@ def main():
     robot_model = args.model or config['robot']['model']
     robot_dof = args.dof or config['robot'].get('dof', None)
     
-    logger.info("=" * 60)
-    logger.info("Robot State Monitor (READ-ONLY)")
-    logger.info("=" * 60)
-    logger.info(f"Robot IP: {robot_ip}")
-    logger.info(f"Robot Model: {robot_model}")
-    if robot_dof:
-        logger.info(f"Robot DOF: {robot_dof} (configured)")
-    else:
-        logger.info(f"Robot DOF: Auto-detect")
-    logger.info(f"Update Rate: {args.rate} Hz")
-    logger.info("=" * 60)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n".join([
+            "=" * 60,
+            "Robot State Monitor (READ-ONLY)",
+            "=" * 60,
+            f"Robot IP: {robot_ip}",
+            f"Robot Model: {robot_model}",
+            f"Robot DOF: {robot_dof} (configured)" if robot_dof else "Robot DOF: Auto-detect",
+            f"Update Rate: {args.rate} Hz",
+            "=" * 60,
+        ]))
     
     # Create robot controller
     robot = RobotController(
@@ -297,7 +489,7 @@ def main():
         print("\n\n👋 Stopping monitor...")
     
     except Exception as e:
-        logger.error(f"Error during monitoring: {e}", exc_info=True)
+        logger.error("Error during monitoring: %s", e, exc_info=True)
         print(f"\n❌ Error: {e}")
         return 1
     
@@ -9,18 +9,99 @@ Keeping it here for reference/comparison.
 import sys
 import argparse
 import logging
-import select
+import os
 import termios
+import time
 import tty
-from pathlib import Path
+from contextlib import contextmanager
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import numpy as np
+
+try:
+    from . import _bootstrap  # noqa: F401  (adds the repo root to sys.path)
+except ImportError:
+    import _bootstrap  # noqa: F401  (run as a script from examples/)
 
 from realman_teleop import RobotController
 from realman_teleop.config_loader import ConfigLoader
 from realman_teleop.utils import setup_logging
 
 
+# Status lines, keyed by the enabled flag
+SPEED_STATUS = {
+    True: "\r[ENABLED] Speed: %.3f m/s    ",
+    False: "\r[DISABLED] Speed: %.3f m/s    ",
+}
+HOME_STATUS = {
+    True: "\r[ENABLED] ✓ Home position reached   ",
+    False: "\r[DISABLED] ✓ Home position reached   ",
+}
+
+# Movement keys: key -> (pose axis, direction, angular?, status line template)
+MOVE_KEYS = {
+    # Linear movement
+    'w': (0, +1, False, "\r⬆️  Forward (+X: %.3f)      "),
+    's': (0, -1, False, "\r⬇️  Backward (-X: %.3f)     "),
+    'a': (1, +1, False, "\r⬅️  Left (+Y: %.3f)         "),
+    'd': (1, -1, False, "\r➡️  Right (-Y: %.3f)        "),
+    'q': (2, +1, False, "\r⬆️  Up (+Z: %.3f)           "),
+    'e': (2, -1, False, "\r⬇️  Down (-Z: %.3f)         "),
+    # Rotation
+    'i': (3, +1, True, "\r🔄 Pitch+ (%.3f)  "),
+    'k': (3, -1, True, "\r🔄 Pitch- (%.3f)  "),
+    'j': (4, +1, True, "\r🔄 Roll+ (%.3f)   "),
+    'l': (4, -1, True, "\r🔄 Roll- (%.3f)   "),
+    'u': (5, +1, True, "\r🔄 Yaw+ (%.3f)    "),
+    'o': (5, -1, True, "\r🔄 Yaw- (%.3f)    "),
+}
+
+# Held keys repeat faster than this; their deltas are summed into one movel
+MOVE_FLUSH_INTERVAL = 0.05
+
+# While keys keep coming within this window, build on the last commanded
+# target instead of reading the pose back from the robot
+POSE_REUSE_WINDOW = 0.5
+
+# Per-key pose delta for a unit step (one 0.1 s tick at speed 1)
+MOVE_BASIS = {
+    key: sign * 0.1 * np.eye(6)[axis]
+    for key, (axis, sign, _, _) in MOVE_KEYS.items()
+}
+
+
+# Encoded status lines; the set is small (fixed text plus a few speed values)
+_STATUS_BYTES = {}
+
+
+def write_status(text):
+    """Write a status line straight to the stdout file descriptor."""
+    data = _STATUS_BYTES.get(text)
+    if data is None:
+        data = _STATUS_BYTES[text] = text.encode('utf-8')
+    os.write(sys.stdout.fileno(), data)
+
+
+@contextmanager
+def raw_terminal(stream, read_timeout_ds=1):
+    """
+    Put a terminal stream in raw mode for the duration of the block.
+    
+    Reads return after one byte or after read_timeout_ds tenths of a second
+    with no input (VMIN=0, VTIME), so the kernel handles the wait.
+    """
+    fd = stream.fileno()
+    old_settings = termios.tcgetattr(fd)
+    tty.setraw(fd)
+    attrs = termios.tcgetattr(fd)
+    attrs[6][termios.VMIN] = 0
+    attrs[6][termios.VTIME] = read_timeout_ds
+    termios.tcsetattr(fd, termios.TCSANOW, attrs)
+    try:
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
 class SimpleKeyboardControl:
     """Simple keyboard control using terminal input."""
     
@@ -30,21 +111,43 @@ class SimpleKeyboardControl:
         self.angular_speed = speed * 3.0
         self.enabled = False
         self.running = True
+        self._pose_buf = np.zeros(6, dtype=np.float64)
+        self._pending_delta = np.zeros(6, dtype=np.float64)
+        self._last_send = 0.0
+        self._target_valid = False
         
     def get_key(self):
-        """Get a single keypress from terminal."""
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(sys.stdin.fileno())
-            # Non-blocking read with timeout
-            rlist, _, _ = select.select([sys.stdin], [], [], 0.05)
-            if rlist:
-                ch = sys.stdin.read(1)
-                return ch
-            return None
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        """Get a single keypress from terminal (terminal must be in raw_terminal mode)."""
+        # Blocks in the kernel for at most the VTIME timeout
+        data = os.read(sys.stdin.fileno(), 1)
+        return data.decode('ascii', errors='ignore') or None
+    
+    def flush_motion(self):
+        """Send the accumulated pose delta as one movel once the flush interval has passed."""
+        if not self._pending_delta.any():
+            return
+        
+        now = time.monotonic()
+        if now - self._last_send < MOVE_FLUSH_INTERVAL:
+            return
+        
+        target_pose = self._pose_buf
+        if not self._target_valid or now - self._last_send > POSE_REUSE_WINDOW:
+            current_pose = self.robot.get_current_pose()
+            if not current_pose:
+                write_status("\r⚠️  Cannot read robot pose           ")
+                self._pending_delta.fill(0.0)
+                self._target_valid = False
+                return
+            np.copyto(target_pose, current_pose)
+        
+        target_pose += self._pending_delta
+        result = self.robot.movel(target_pose, velocity=30, block=False)
+        # A rejected target must not become the base for the next move
+        self._target_valid = result == 0
+        
+        self._pending_delta.fill(0.0)
+        self._last_send = now
     
     def print_instructions(self):
         """Print control instructions."""
@@ -78,121 +181,80 @@ class SimpleKeyboardControl:
         self.print_instructions()
         
         try:
-            while self.running:
-                key = self.get_key()
-                
-                if key is None:
-                    continue
-                
-                # Exit
-                if key == 'x' or key == '\x1b':  # x or ESC
-                    print("\n\n🛑 Exiting...")
-                    break
-                
-                # Speed adjustment
-                elif key == '+' or key == '=':
-                    self.speed = min(self.speed + 0.01, 0.5)
-                    self.angular_speed = self.speed * 3.0
-                    status = "ENABLED" if self.enabled else "DISABLED"
-                    print(f"\r[{status}] Speed: {self.speed:.3f} m/s    ", end='', flush=True)
-                    continue
-                elif key == '-' or key == '_':
-                    self.speed = max(self.speed - 0.01, 0.01)
-                    self.angular_speed = self.speed * 3.0
-                    status = "ENABLED" if self.enabled else "DISABLED"
-                    print(f"\r[{status}] Speed: {self.speed:.3f} m/s    ", end='', flush=True)
-                    continue
-                
-                # Home position
-                elif key == 'h':
-                    print("\r🏠 Moving to home position...        ", end='', flush=True)
-                    self.robot.move_to_home(velocity=20)
-                    status = "ENABLED" if self.enabled else "DISABLED"
-                    print(f"\r[{status}] ✓ Home position reached   ", end='', flush=True)
-                    continue
-                
-                # Deadman switch (SPACE toggles enable/disable)
-                elif key == ' ':
-                    self.enabled = not self.enabled
-                    if self.enabled:
-                        print("\r✅ ENABLED - Robot will move!         ", end='', flush=True)
-                    else:
-                        print("\r❌ DISABLED - Press SPACE to enable   ", end='', flush=True)
-                    continue
-                
-                # Movement commands (only if enabled)
-                if self.enabled:
-                    current_pose = self.robot.get_current_pose()
-                    if not current_pose:
-                        print("\r⚠️  Cannot read robot pose           ", end='', flush=True)
-                        continue
-                    
-                    target_pose = current_pose.copy()
-                    moved = False
-                    
-                    # Linear movement
-                    if key == 'w':
-                        target_pose[0] += self.speed * 0.1
-                        moved = True
-                        print(f"\r⬆️  Forward (+X: {self.speed:.3f})      ", end='', flush=True)
-                    elif key == 's':
-                        target_pose[0] -= self.speed * 0.1
-                        moved = True
-                        print(f"\r⬇️  Backward (-X: {self.speed:.3f})     ", end='', flush=True)
-                    elif key == 'a':
-                        target_pose[1] += self.speed * 0.1
-                        moved = True
-                        print(f"\r⬅️  Left (+Y: {self.speed:.3f})         ", end='', flush=True)
-                    elif key == 'd':
-                        target_pose[1] -= self.speed * 0.1
-                        moved = True
-                        print(f"\r➡️  Right (-Y: {self.speed:.3f})        ", end='', flush=True)
-                    elif key == 'q':
-                        target_pose[2] += self.speed * 0.1
-                        moved = True
-                        print(f"\r⬆️  Up (+Z: {self.speed:.3f})           ", end='', flush=True)
-                    elif key == 'e':
-                        target_pose[2] -= self.speed * 0.1
-                        moved = True
-                        print(f"\r⬇️  Down (-Z: {self.speed:.3f})         ", end='', flush=True)
-                    
-                    # Rotation
-                    elif key == 'i':
-                        target_pose[3] += self.angular_speed * 0.1
-                        moved = True
-                        print(f"\r🔄 Pitch+ ({self.angular_speed:.3f})  ", end='', flush=True)
-                    elif key == 'k':
-                        target_pose[3] -= self.angular_speed * 0.1
-                        moved = True
-                        print(f"\r🔄 Pitch- ({self.angular_speed:.3f})  ", end='', flush=True)
-                    elif key == 'j':
-                        target_pose[4] += self.angular_speed * 0.1
-                        moved = True
-                        print(f"\r🔄 Roll+ ({self.angular_speed:.3f})   ", end='', flush=True)
-                    elif key == 'l':
-                        target_pose[4] -= self.angular_speed * 0.1
-                        moved = True
-                        print(f"\r🔄 Roll- ({self.angular_speed:.3f})   ", end='', flush=True)
-                    elif key == 'u':
-                        target_pose[5] += self.angular_speed * 0.1
-                        moved = True
-                        print(f"\r🔄 Yaw+ ({self.angular_speed:.3f})    ", end='', flush=True)
-                    elif key == 'o':
-                        target_pose[5] -= self.angular_speed * 0.1
-                        moved = True
-                        print(f"\r🔄 Yaw- ({self.angular_speed:.3f})    ", end='', flush=True)
-                    
-                    if moved:
-                        self.robot.movel(target_pose, velocity=30, block=False)
-                else:
-                    if key in 'wsadqeijkluo':
-                        print("\r⚠️  DISABLED - Press SPACE to enable    ", end='', flush=True)
+            # Status lines bypass sys.stdout from here on
+            sys.stdout.flush()
+            
+            # Raw mode is set once for the whole session
+            with raw_terminal(sys.stdin):
+                self._control_loop()
+            print("\n\n🛑 Exiting...")
         
         except KeyboardInterrupt:
             print("\n\n🛑 Interrupted by user")
         except Exception as e:
             print(f"\n\n❌ Error: {e}")
             logging.exception("Control loop error")
+    
+    def _control_loop(self):
+        """Handle keypresses until exit is requested."""
+        while self.running:
+            self.flush_motion()
+            key = self.get_key()
+            
+            if key is None:
+                continue
+            
+            # Ctrl+C arrives as a plain byte in raw mode
+            if key == '\x03':
+                raise KeyboardInterrupt
+            
+            # Exit
+            if key == 'x' or key == '\x1b':  # x or ESC
+                break
+            
+            # Speed adjustment
+            elif key == '+' or key == '=':
+                self.speed = min(self.speed + 0.01, 0.5)
+                self.angular_speed = self.speed * 3.0
+                write_status(SPEED_STATUS[self.enabled] % self.speed)
+                continue
+            elif key == '-' or key == '_':
+                self.speed = max(self.speed - 0.01, 0.01)
+                self.angular_speed = self.speed * 3.0
+                write_status(SPEED_STATUS[self.enabled] % self.speed)
+                continue
+            
+            # Home position
+            elif key == 'h':
+                write_status("\r🏠 Moving to home position...        ")
+                self._pending_delta.fill(0.0)
+                self._target_valid = False
+                self.robot.move_to_home(velocity=20)
+                write_status(HOME_STATUS[self.enabled])
+                continue
+            
+            # Deadman switch (SPACE toggles enable/disable)
+            elif key == ' ':
+                self.enabled = not self.enabled
+                self._pending_delta.fill(0.0)
+                self._target_valid = False
+                if self.enabled:
+                    write_status("\r✅ ENABLED - Robot will move!         ")
+                else:
+                    write_status("\r❌ DISABLED - Press SPACE to enable   ")
+                continue
+            
+            # Movement commands (only if enabled), queued for flush_motion()
+            if self.enabled:
+                command = MOVE_KEYS.get(key)
+                if command:
+                    _, _, is_angular, label = command
+                    step = self.angular_speed if is_angular else self.speed
+                    self._pending_delta += MOVE_BASIS[key] * step
+                    write_status(label % step)
+            else:
+                if key in MOVE_KEYS:
+                    write_status("\r⚠️  DISABLED - Press SPACE to enable    ")
 
 
 def main():
@@ -221,22 +283,21 @@ def main():
     logger = logging.getLogger(__name__)
     
     # Load configuration
-    config = ConfigLoader.load_env_config()
-    robot_config = config.get('robot', {})
+    robot_config = ConfigLoader.prewarm()
     
     print("=" * 70)
     print("Simple Terminal Keyboard Teleoperation (BACKUP VERSION)")
     print("=" * 70)
-    print(f"Robot IP: {robot_config.get('ip', '192.168.10.18')}")
-    print(f"Robot Model: {robot_config.get('model', 'R1D2')}")
+    print(f"Robot IP: {robot_config.ip}")
+    print(f"Robot Model: {robot_config.model}")
     print("=" * 70)
     
     # Create robot controller
     robot = RobotController(
-        ip=robot_config.get('ip', '192.168.10.18'),
-        port=robot_config.get('port', 8080),
-        model=robot_config.get('model', 'R1D2'),
-        dof=robot_config.get('dof')
+        ip=robot_config.ip,
+        port=robot_config.port,
+        model=robot_config.model,
+        dof=robot_config.dof
     )
     
     # Connect to robot
@@ -9,32 +9,82 @@ import sys
 import time
 import argparse
 from pathlib import Path
+import numpy as np
 import yaml
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    from ._bootstrap import REPO_ROOT  # also adds the repo root to sys.path
+except ImportError:
+    from _bootstrap import REPO_ROOT  # run as a script from examples/
 
 from realman_teleop import RobotController
-from realman_teleop.config_loader import ConfigLoader
+from realman_teleop.config_loader import ConfigLoader, YamlLoader
+
+DEFAULT_LIMITS_PATH = REPO_ROOT / "config" / "realman_r1d2_joint_limits.yaml"
+
+# Allowed position error after a move, in degrees
+POSITION_TOLERANCE = 2.0
 
 
 def load_joint_limits(config_path: str = None) -> dict:
     """Load joint limits from config file."""
-    if config_path is None:
-        # Try to find the limits config
-        project_root = Path(__file__).parent.parent
-        config_path = project_root / "config" / "realman_r1d2_joint_limits.yaml"
-    
-    config_path = Path(config_path)
+    config_path = Path(config_path) if config_path is not None else DEFAULT_LIMITS_PATH
     if not config_path.exists():
         print(f"❌ Config file not found: {config_path}")
         return None
     
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    with open(config_path, 'rb') as f:
+        config = yaml.load(f, Loader=YamlLoader)
     
     return config.get('joint_limits', {})
 
 
+def write_lines(*lines):
+    """Write a block of output lines with a single write and flush."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def read_joint_angle(robot: RobotController, joint_idx: int):
+    """Read one joint angle back from the robot, or None if the read failed."""
+    angles = robot.get_current_joint_angles()
+    return angles[joint_idx] if angles else None
+
+
+def wait_settled(
+    robot: RobotController,
+    joint_idx: int,
+    target: float,
+    tol: float = 0.5,
+    timeout: float = 1.5,
+    rate_hz: float = 100
+):
+    """
+    Poll a joint until it is within tol of target or the timeout expires.
+    
+    Args:
+        robot: RobotController instance
+        joint_idx: Joint index (0-based)
+        target: Target angle (degrees)
+        tol: Settle tolerance (degrees)
+        timeout: Maximum time to wait (seconds)
+        rate_hz: Polling rate
+        
+    Returns:
+        Last angle read (degrees), or None if no read succeeded
+    """
+    deadline = time.monotonic() + timeout
+    actual = read_joint_angle(robot, joint_idx)
+    while actual is None or abs(actual - target) >= tol:
+        if time.monotonic() >= deadline:
+            break
+        time.sleep(1.0 / rate_hz)
+        reading = read_joint_angle(robot, joint_idx)
+        if reading is not None:
+            actual = reading
+    return actual
+
+
 def test_joint_movement(robot: RobotController, joint_num: int, min_val: float, max_val: float, speed: int = 10) -> bool:
     """
     Test moving a joint from min to max value.
@@ -51,103 +101,65 @@ def test_joint_movement(robot: RobotController, joint_num: int, min_val: float,
     """
     joint_idx = joint_num - 1  # Convert to 0-based index
     
-    print(f"\n{'='*60}")
-    print(f"Testing Joint {joint_num}")
-    print(f"{'='*60}")
-    print(f"Configured limits: [{min_val}°, {max_val}°]")
-    print(f"Movement speed: {speed}%")
-    print()
+    write_lines(
+        "",
+        "=" * 60,
+        f"Testing Joint {joint_num}",
+        "=" * 60,
+        f"Configured limits: [{min_val}°, {max_val}°]",
+        f"Movement speed: {speed}%",
+        "",
+        "Reading current joint angles...",
+    )
     
     try:
         # Get current joint angles
-        print("Reading current joint angles...")
         current_angles = robot.get_current_joint_angles()
         if not current_angles:
             print("❌ Failed to read current joint angles")
             return False
         
-        print(f"Current angles: {[f'{a:.1f}°' for a in current_angles]}")
-        print(f"Joint {joint_num} current position: {current_angles[joint_idx]:.2f}°")
-        print()
-        
-        # Create target positions
-        target_angles = current_angles.copy()
-        
-        # Test 1: Move to minimum
-        print(f"--- Test 1: Moving Joint {joint_num} to MINIMUM ({min_val}°) ---")
-        target_angles[joint_idx] = min_val
-        print(f"Target: {[f'{a:.1f}°' for a in target_angles]}")
-        
-        result = robot.movej(target_angles, velocity=speed, block=True)
-        if result != 0:
-            print(f"❌ Movement to minimum failed with code: {result}")
-            return False
+        write_lines(
+            f"Current angles: {[f'{a:.1f}°' for a in current_angles]}",
+            f"Joint {joint_num} current position: {current_angles[joint_idx]:.2f}°",
+            "",
+        )
         
-        time.sleep(0.5)
+        # One target buffer for all sub-tests; only the joint under test changes
+        target_angles = np.array(current_angles, dtype=np.float64)
+        center_val = (min_val + max_val) / 2
+        steps = (
+            ("MINIMUM", f"{min_val}°", "minimum", min_val),
+            ("MAXIMUM", f"{max_val}°", "maximum", max_val),
+            ("CENTER", f"{center_val:.1f}°", "center", center_val),
+        )
         
-        # Verify position
-        actual_angles = robot.get_current_joint_angles()
-        if actual_angles:
-            actual_pos = actual_angles[joint_idx]
-            error = abs(actual_pos - min_val)
-            print(f"✓ Reached minimum")
-            print(f"  Target: {min_val:.2f}°, Actual: {actual_pos:.2f}°, Error: {error:.2f}°")
+        for test_num, (title, shown, name, value) in enumerate(steps, 1):
+            target_angles[joint_idx] = value
+            write_lines(
+                f"--- Test {test_num}: Moving Joint {joint_num} to {title} ({shown}) ---",
+                f"Target: {[f'{a:.1f}°' for a in target_angles]}",
+            )
             
-            if error > 2.0:  # Allow 2 degree tolerance
-                print(f"⚠ Warning: Position error exceeds 2°")
-        print()
-        
-        time.sleep(1)
-        
-        # Test 2: Move to maximum
-        print(f"--- Test 2: Moving Joint {joint_num} to MAXIMUM ({max_val}°) ---")
-        target_angles[joint_idx] = max_val
-        print(f"Target: {[f'{a:.1f}°' for a in target_angles]}")
-        
-        result = robot.movej(target_angles, velocity=speed, block=True)
-        if result != 0:
-            print(f"❌ Movement to maximum failed with code: {result}")
-            return False
-        
-        time.sleep(0.5)
-        
-        # Verify position
-        actual_angles = robot.get_current_joint_angles()
-        if actual_angles:
-            actual_pos = actual_angles[joint_idx]
-            error = abs(actual_pos - max_val)
-            print(f"✓ Reached maximum")
-            print(f"  Target: {max_val:.2f}°, Actual: {actual_pos:.2f}°, Error: {error:.2f}°")
+            result = robot.movej(target_angles.tolist(), velocity=speed, block=True)
+            if result != 0:
+                print(f"❌ Movement to {name} failed with code: {result}")
+                return False
             
-            if error > 2.0:
-                print(f"⚠ Warning: Position error exceeds 2°")
-        print()
-        
-        time.sleep(1)
-        
-        # Test 3: Move to center
-        center_val = (min_val + max_val) / 2
-        print(f"--- Test 3: Moving Joint {joint_num} to CENTER ({center_val:.1f}°) ---")
-        target_angles[joint_idx] = center_val
-        
-        result = robot.movej(target_angles, velocity=speed, block=True)
-        if result != 0:
-            print(f"❌ Movement to center failed with code: {result}")
-            return False
-        
-        time.sleep(0.5)
-        
-        actual_angles = robot.get_current_joint_angles()
-        if actual_angles:
-            actual_pos = actual_angles[joint_idx]
-            error = abs(actual_pos - center_val)
-            print(f"✓ Reached center")
-            print(f"  Target: {center_val:.2f}°, Actual: {actual_pos:.2f}°, Error: {error:.2f}°")
-        print()
+            # Verify position once the joint has settled
+            lines = []
+            actual_pos = wait_settled(robot, joint_idx, value)
+            if actual_pos is not None:
+                error = abs(actual_pos - value)
+                lines.append(f"✓ Reached {name}")
+                lines.append(f"  Target: {value:.2f}°, Actual: {actual_pos:.2f}°, Error: {error:.2f}°")
+                
+                if error > POSITION_TOLERANCE:
+                    lines.append(f"⚠ Warning: Position error exceeds {POSITION_TOLERANCE:g}°")
+            lines.append("")
+            write_lines(*lines)
         
-        print(f"{'='*60}")
-        print(f"✅ Joint {joint_num} test PASSED")
-        print(f"{'='*60}")
+        write_lines("=" * 60, f"✅ Joint {joint_num} test PASSED", "=" * 60)
         
         return True
         
@@ -228,21 +240,20 @@ Examples:
         return 1
     
     # Load robot configuration
-    config = ConfigLoader.load_env_config()
-    robot_config = config.get('robot', {})
+    robot_config = ConfigLoader.prewarm()
     
     print(f"Robot Configuration:")
-    print(f"  IP: {robot_config.get('ip', '192.168.10.18')}")
-    print(f"  Model: {robot_config.get('model', 'R1D2')}")
-    print(f"  DOF: {robot_config.get('dof', 'auto-detect')}")
+    print(f"  IP: {robot_config.ip}")
+    print(f"  Model: {robot_config.model}")
+    print(f"  DOF: {robot_config.dof or 'auto-detect'}")
     print()
     
     # Create robot controller
     robot = RobotController(
-        ip=robot_config.get('ip', '192.168.10.18'),
-        port=robot_config.get('port', 8080),
-        model=robot_config.get('model', 'R1D2'),
-        dof=robot_config.get('dof')
+        ip=robot_config.ip,
+        port=robot_config.port,
+        model=robot_config.model,
+        dof=robot_config.dof
     )
     
     # Connect to robot
@@ -0,0 +1,244 @@
+"""
+Control Kernels Module
+
+Fixed-shape math used by the control modes on every control tick.
+Compiled with Numba when it is installed, plain NumPy otherwise.
+"""
+
+import numpy as np
+
+# limit_pose violation bits, in the order SafetyMonitor reports them
+LINEAR_VELOCITY = 1
+ANGULAR_VELOCITY = 2
+X_MIN, X_MAX = 4, 8
+Y_MIN, Y_MAX = 16, 32
+Z_MIN, Z_MAX = 64, 128
+# Not set by limit_pose; SafetyMonitor's bit for a scaled joint step
+JOINT_VELOCITY = 256
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    
+    @njit(cache=True)
+    def joint_step(current, velocity, max_velocity, dt, out):
+        """
+        Clamp each joint velocity to +/-max_velocity and integrate one step
+        into out. Missing velocity entries count as zero.
+        """
+        n = min(velocity.size, out.size)
+        for i in range(n):
+            v = velocity[i]
+            if v > max_velocity:
+                v = max_velocity
+            elif v < -max_velocity:
+                v = -max_velocity
+            out[i] = current[i] + v * dt
+        for i in range(n, out.size):
+            out[i] = current[i]
+    
+    @njit(cache=True)
+    def smooth_velocity(previous, target, smoothing, max_velocity, out):
+        """
+        Exponentially smooth target against previous into out and clamp its
+        magnitude. The length of out sets how many entries are used.
+        """
+        if previous.size < out.size or target.size < out.size:
+            raise ValueError("previous and target must be at least as long as out")
+        total = 0.0
+        for i in range(out.size):
+            v = smoothing * previous[i] + (1.0 - smoothing) * target[i]
+            out[i] = v
+            total += v * v
+        magnitude = np.sqrt(total)
+        if magnitude > max_velocity:
+            scale = max_velocity / magnitude
+            for i in range(out.size):
+                out[i] *= scale
+    
+    @njit(cache=True)
+    def integrate(current, velocity, dt, out):
+        """
+        Write current + velocity * dt into out, which may be current.
+        Missing velocity entries count as zero.
+        """
+        n = min(velocity.size, out.size)
+        for i in range(n):
+            out[i] = current[i] + velocity[i] * dt
+        for i in range(n, out.size):
+            out[i] = current[i]
+    
+    @njit(cache=True)
+    def limit_pose(target, current, max_linear, max_angular, low, high, out):
+        """
+        Scale the pose step from current to target down to the per-tick
+        limits, clamp the position into [low, high] and write the result
+        into out. Returns a bitmask of the limits that were hit.
+        """
+        n = target.size
+        mask = 0
+        linear = 0.0
+        for i in range(3):
+            d = abs(target[i] - current[i])
+            if d > linear:
+                linear = d
+        angular = 0.0
+        for i in range(3, n):
+            d = abs(target[i] - current[i])
+            if d > angular:
+                angular = d
+        linear_scale = 1.0
+        if linear > max_linear:
+            mask |= LINEAR_VELOCITY
+            linear_scale = max_linear / linear
+        angular_scale = 1.0
+        if angular > max_angular:
+            mask |= ANGULAR_VELOCITY
+            angular_scale = max_angular / angular
+        for i in range(3):
+            v = current[i] + (target[i] - current[i]) * linear_scale
+            if v < low[i]:
+                mask |= X_MIN << (2 * i)
+                v = low[i]
+            elif v > high[i]:
+                mask |= X_MAX << (2 * i)
+                v = high[i]
+            out[i] = v
+        for i in range(3, n):
+            out[i] = current[i] + (target[i] - current[i]) * angular_scale
+        return mask
+    
+    @njit(cache=True)
+    def limit_step(target, current, max_step, out):
+        """
+        Scale the step from current to target down to max_step and write
+        the result into out. Returns True if the step was scaled.
+        """
+        largest = 0.0
+        for i in range(target.size):
+            d = abs(target[i] - current[i])
+            if d > largest:
+                largest = d
+        if largest <= max_step:
+            return False
+        scale = max_step / largest
+        for i in range(target.size):
+            out[i] = current[i] + (target[i] - current[i]) * scale
+        return True
+    
+    @njit(cache=True, fastmath=True)
+    def deadzone(values, width, out):
+        """
+        Zero values within +/-width and rescale the rest to the full -1..1
+        range, writing the result into out.
+        """
+        scale = 1.0 / (1.0 - width)
+        for i in range(values.size):
+            v = values[i]
+            if v > width:
+                out[i] = (v - width) * scale
+            elif v < -width:
+                out[i] = (v + width) * scale
+            else:
+                out[i] = 0.0
+    
+    # Compile now (or load from the on-disk cache) rather than on the first tick
+    _warmup = np.zeros(6, dtype=np.float64)
+    joint_step(_warmup, _warmup, 1.0, 0.01, np.empty(6, dtype=np.float64))
+    smooth_velocity(_warmup, _warmup, 0.5, 1.0, np.empty(6, dtype=np.float64))
+    integrate(_warmup, _warmup, 0.01, np.empty(6, dtype=np.float64))
+    limit_pose(_warmup, _warmup, 1.0, 1.0, _warmup[:3], _warmup[:3], np.empty(6, dtype=np.float64))
+    limit_step(_warmup, _warmup, 1.0, np.empty(6, dtype=np.float64))
+    deadzone(_warmup, 0.1, np.empty(6, dtype=np.float64))
+    del _warmup
+
+else:
+    
+    def joint_step(current, velocity, max_velocity, dt, out):
+        """
+        Clamp each joint velocity to +/-max_velocity and integrate one step
+        into out. Missing velocity entries count as zero.
+        """
+        n = min(velocity.size, out.size)
+        out[n:] = 0.0
+        np.clip(velocity[:n], -max_velocity, max_velocity, out=out[:n])
+        out *= dt
+        out += current
+    
+    def smooth_velocity(previous, target, smoothing, max_velocity, out):
+        """
+        Exponentially smooth target against previous into out and clamp its
+        magnitude. The length of out sets how many entries are used.
+        """
+        n = out.size
+        if previous.size < n or target.size < n:
+            raise ValueError("previous and target must be at least as long as out")
+        np.multiply(previous[:n], smoothing, out=out)
+        out += (1.0 - smoothing) * target[:n]
+        magnitude = np.linalg.norm(out)
+        if magnitude > max_velocity:
+            out *= max_velocity / magnitude
+    
+    def integrate(current, velocity, dt, out):
+        """
+        Write current + velocity * dt into out, which may be current.
+        Missing velocity entries count as zero.
+        """
+        n = min(velocity.size, out.size)
+        np.copyto(out, current)  # out may be current itself
+        out[:n] += velocity[:n] * dt
+    
+    def limit_pose(target, current, max_linear, max_angular, low, high, out):
+        """
+        Scale the pose step from current to target down to the per-tick
+        limits, clamp the position into [low, high] and write the result
+        into out. Returns a bitmask of the limits that were hit.
+        """
+        np.subtract(target, current, out=out)
+        mask = 0
+        linear = np.abs(out[:3]).max()
+        if linear > max_linear:
+            mask |= LINEAR_VELOCITY
+            out[:3] *= max_linear / linear
+        if out.size > 3:
+            angular = np.abs(out[3:]).max()
+            if angular > max_angular:
+                mask |= ANGULAR_VELOCITY
+                out[3:] *= max_angular / angular
+        out += current
+        position = out[:3]
+        for i in range(3):
+            if position[i] < low[i]:
+                mask |= X_MIN << (2 * i)
+            elif position[i] > high[i]:
+                mask |= X_MAX << (2 * i)
+        np.clip(position, low, high, out=position)
+        return mask
+    
+    def limit_step(target, current, max_step, out):
+        """
+        Scale the step from current to target down to max_step and write
+        the result into out. Returns True if the step was scaled.
+        """
+        step = np.subtract(target, current)
+        largest = np.abs(step).max()
+        if largest <= max_step:
+            return False
+        step *= max_step / largest
+        np.add(current, step, out=out)
+        return True
+    
+    def deadzone(values, width, out):
+        """
+        Zero values within +/-width and rescale the rest to the full -1..1
+        range, writing the result into out.
+        """
+        magnitude = np.abs(values) - width
+        np.maximum(magnitude, 0.0, out=magnitude)
+        np.copysign(magnitude, values, out=out)
+        out *= 1.0 / (1.0 - width)
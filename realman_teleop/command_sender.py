@@ -0,0 +1,141 @@
+"""
+Command Sender Module
+
+Background thread that sends motion commands to the robot, so network
+round-trips do not stall the teleoperation loop.
+"""
+
+import logging
+import threading
+from collections import deque
+
+from .robot_controller import RobotController
+
+logger = logging.getLogger(__name__)
+
+
+class CommandSender:
+    """
+    Send movel/movej commands to the robot from a background thread.
+    
+    Only the newest pending command is kept: a target submitted before the
+    previous one went out replaces it, so the control loop never blocks and
+    stale targets are dropped under backpressure.
+    """
+    
+    def __init__(self, robot: RobotController):
+        """
+        Initialize the command sender.
+        
+        Args:
+            robot: RobotController instance
+        """
+        self.robot = robot
+        
+        # (generation, command type, target, velocity, stream), newest only
+        self._pending = deque(maxlen=1)
+        self._wake = threading.Event()
+        
+        # Held while a command is on the wire; cancel() bumps the generation
+        # under it so nothing submitted earlier is sent afterwards
+        self._lock = threading.Lock()
+        self._generation = 0
+        
+        self._failed = False
+        self._running = False
+        self._thread = None
+    
+    def start(self):
+        """Start the sender thread."""
+        if self._thread is not None:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="CommandSender", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 1.0):
+        """
+        Drop pending commands and stop the sender thread.
+        
+        Args:
+            timeout: Maximum time to wait for the thread to exit in seconds
+        """
+        self.cancel()
+        self._running = False
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def submit(self, command_type: str, target: list, velocity: int = 50, stream: bool = False):
+        """
+        Queue a motion command, replacing any command not yet sent.
+        
+        Args:
+            command_type: 'cartesian' for movel, anything else for movej
+            target: Target pose or joint angles
+            velocity: Planning velocity percentage
+            stream: Send with movep_stream/movej_stream instead (velocity unused)
+        """
+        self._pending.append((self._generation, command_type, target, velocity, stream))
+        self._wake.set()
+    
+    def cancel(self, wait: bool = True):
+        """
+        Drop pending commands and wait for any command being sent.
+        
+        Call before stopping the robot so no queued target is sent after the stop.
+        
+        Args:
+            wait: Wait for a command already being sent; False returns at
+                once (e.g. from a watchdog, when the send may be hung)
+        """
+        self._pending.clear()
+        if not wait:
+            self._generation += 1
+            return
+        with self._lock:
+            self._generation += 1
+    
+    def take_failure(self) -> bool:
+        """
+        Check whether the robot rejected a command since the last call.
+        
+        Returns:
+            True if a command failed
+        """
+        failed = self._failed
+        self._failed = False
+        return failed
+    
+    def _run(self):
+        """Send queued commands until stopped."""
+        while self._running:
+            self._wake.wait()
+            self._wake.clear()
+            
+            while self._pending:
+                try:
+                    generation, command_type, target, velocity, stream = self._pending.popleft()
+                except IndexError:
+                    break
+                
+                with self._lock:
+                    if generation != self._generation:
+                        continue
+                    try:
+                        if stream:
+                            if command_type == "cartesian":
+                                result = self.robot.movep_stream(target)
+                            else:
+                                result = self.robot.movej_fast(target)
+                        elif command_type == "cartesian":
+                            result = self.robot.movel(target, velocity=velocity, block=False)
+                        else:
+                            result = self.robot.movej(target, velocity=velocity, block=False)
+                    except Exception as e:
+                        logger.error(f"Failed to send {command_type} command: {e}")
+                        result = -1
+                
+                if result != 0:
+                    self._failed = True
@@ -4,19 +4,295 @@ Configuration Loader Module
 Load and parse YAML configuration files and environment variables.
 """
 
+import copy
+import hashlib
+import json
 import logging
+import re
+import tempfile
 import yaml
 import os
+from collections import OrderedDict
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Dict, Optional
-from dotenv import load_dotenv
+from typing import Dict, Optional, Tuple
+
+try:
+    # libyaml C bindings, several times faster than the pure-Python loader
+    from yaml import CSafeLoader as YamlLoader
+    LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+    LIBYAML_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Project-level settings files, resolved once at import
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+ROBOT_YAML_PATH = PROJECT_ROOT / "robot.yaml"
+ENV_FILE_PATH = PROJECT_ROOT / ".env"
+
+# Environment variables read by ConfigLoader.load_env_config
+ENV_CONFIG_VARS = (
+    'ROBOT_IP',
+    'ROBOT_PORT',
+    'ROBOT_MODEL',
+    'ROBOT_DOF',
+    'DEFAULT_UPDATE_RATE',
+    'DEFAULT_SPEED',
+    'LOG_LEVEL',
+)
+
+# Directory of the JSON files that cache parsed YAML across processes
+# (per user, never next to the YAML itself)
+JSON_CACHE_DIR = Path(
+    os.environ.get('XDG_CACHE_HOME') or Path.home() / ".cache"
+) / "realman_teleop"
+
+
+# Built-in defaults; accessors hand out deep copies
+_DEFAULT_ROBOT_CONFIG = {
+    'robot': {
+        'ip': '192.168.1.18',
+        'port': 8080,
+        'model': 'RM65',
+    },
+    'control': {
+        'mode': 'cartesian',
+        'update_rate': 100,
+    },
+    'limits': {
+        'max_linear_velocity': 0.5,
+        'max_angular_velocity': 1.0,
+        'max_joint_velocity': 30.0,
+    },
+    'safety': {
+        'enable_deadman': True,
+        'enable_collision_detection': True,
+        'collision_level': 3,
+        'emergency_stop_enabled': True,
+    }
+}
+
+_DEFAULT_KEYBOARD_CONFIG = {
+    'keyboard': {
+        'forward': 'w',
+        'backward': 's',
+        'left': 'a',
+        'right': 'd',
+        'up': 'q',
+        'down': 'e',
+        'emergency_stop': 'space',
+        'enable': 'shift',
+    },
+    'speeds': {
+        'linear': 0.1,
+        'angular': 0.3,
+        'joint': 10.0,
+    }
+}
+
+_DEFAULT_JOYSTICK_CONFIG = {
+    'joystick': {
+        'device': 0,
+        'deadzone': 0.1,
+    },
+    'axes': {
+        'linear_x': 1,
+        'linear_y': 0,
+        'linear_z': 4,
+        'angular_x': 3,
+        'angular_y': 5,
+        'angular_z': 2,
+    },
+    'buttons': {
+        'enable': 4,
+        'turbo': 5,
+        'emergency_stop': 6,
+        'mode_switch': 7,
+    },
+    'speeds': {
+        'normal': {
+            'linear': 0.1,
+            'angular': 0.3,
+        },
+        'turbo': {
+            'linear': 0.3,
+            'angular': 0.8,
+        }
+    }
+}
+
+
+def _env_number(name: str, default, convert):
+    """
+    Read a numeric environment variable.
+    
+    Args:
+        name: Variable name
+        default: Value used when the variable is unset, empty or invalid
+        convert: int or float
+        
+    Returns:
+        Converted value or default
+    """
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return convert(value)
+    except ValueError:
+        logger.warning(f"Invalid {name}={value!r}, using {default}")
+        return default
+
+
+# .env syntax: a comment after an unquoted value starts with whitespace + '#',
+# and double-quoted values may contain these backslash escapes
+_DOTENV_INLINE_COMMENT = re.compile(r'\s#')
+_DOTENV_ESCAPE = re.compile(r'\\(.)')
+_DOTENV_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '"': '"', '\\': '\\'}
+
+
+def _dotenv_value(value: str) -> str:
+    """
+    Parse the value part of a .env line as python-dotenv does.
+    
+    Args:
+        value: Text after the '=', with surrounding whitespace removed
+        
+    Returns:
+        Unquoted value without any trailing comment
+    """
+    quote = value[:1]
+    if quote not in ('"', "'"):
+        return _DOTENV_INLINE_COMMENT.split(value, 1)[0].rstrip()
+    
+    # Find the closing quote (in double quotes, skipping escaped ones);
+    # anything after it, such as a comment, is dropped
+    end = 1
+    while end < len(value) and value[end] != quote:
+        end += 2 if quote == '"' and value[end] == '\\' else 1
+    inner = value[1:end]
+    if quote == '"':
+        inner = _DOTENV_ESCAPE.sub(
+            lambda m: _DOTENV_ESCAPES.get(m.group(1), m.group(0)), inner
+        )
+    return inner
+
+
+def _load_dotenv(path: Path) -> None:
+    """
+    Export KEY=VALUE lines from a .env file into os.environ.
+    
+    Follows python-dotenv's rules for the common cases: blank lines and
+    comments are skipped, an ``export`` prefix is allowed, quotes are
+    removed from values and trailing ``# comments`` dropped. Variables
+    already set in the environment are kept.
+    
+    Args:
+        path: Path to the .env file
+    """
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        if line.startswith('export ') or line.startswith('export\t'):
+            line = line[len('export'):].lstrip()
+        key, sep, value = line.partition('=')
+        key = key.strip()
+        if sep and key:
+            os.environ.setdefault(key, _dotenv_value(value.strip()))
+
+
+def _deep_merge(dst: Dict, src: Dict) -> Dict:
+    """
+    Recursively merge src into dst in place.
+    
+    Nested dictionaries are merged key by key; any other value in src
+    replaces the one in dst.
+    
+    Args:
+        dst: Dictionary to update
+        src: Dictionary whose values take priority
+        
+    Returns:
+        dst, for chaining
+    """
+    for key, value in src.items():
+        if isinstance(value, dict) and isinstance(dst.get(key), dict):
+            _deep_merge(dst[key], value)
+        else:
+            dst[key] = value
+    return dst
+
+
+@dataclass(frozen=True)
+class RobotConfig:
+    """Robot connection settings."""
+    
+    ip: str = '192.168.10.18'
+    port: int = 8080
+    model: str = 'R1D2'
+    dof: Optional[int] = None
+
 
 class ConfigLoader:
     """Configuration file loader for robot teleoperation."""
     
+    # Parsed YAML files, least recently used first:
+    # resolved path -> (mtime_ns, size, config)
+    _yaml_cache: "OrderedDict[str, Tuple[int, int, Dict]]" = OrderedDict()
+    _yaml_cache_max = 100
+    
+    # Whether the pure-Python YAML fallback has been reported yet
+    _reported_yaml_loader = False
+    
+    # (path, mtime_ns, size) of the .env file last passed to _load_dotenv
+    _env_signature: Optional[Tuple[str, int, int]] = None
+    
+    # Config last built from environment variables: (variable values, config)
+    _env_config_cache: Optional[Tuple[Tuple, Dict]] = None
+    
+    # Robot settings loaded by prewarm(), shared by every caller of robot()
+    _robot_settings: Optional[RobotConfig] = None
+    
+    @staticmethod
+    def clear_cache():
+        """Forget all cached configuration files."""
+        ConfigLoader._yaml_cache.clear()
+        ConfigLoader._env_signature = None
+        ConfigLoader._env_config_cache = None
+        ConfigLoader._robot_settings = None
+    
+    @staticmethod
+    def prewarm() -> RobotConfig:
+        """
+        Load the robot settings now so later robot() calls never parse files.
+        
+        Entry points call this at startup, before any control loop starts.
+        Calling it again re-reads robot.yaml/.env and replaces the settings.
+        
+        Returns:
+            The cached RobotConfig
+        """
+        ConfigLoader._robot_settings = ConfigLoader.load_robot_settings()
+        return ConfigLoader._robot_settings
+    
+    @staticmethod
+    def robot() -> RobotConfig:
+        """
+        Get the robot settings loaded by prewarm().
+        
+        The returned RobotConfig is frozen, so it is shared rather than copied.
+        
+        Returns:
+            The cached RobotConfig
+        """
+        settings = ConfigLoader._robot_settings
+        if settings is None:
+            settings = ConfigLoader.prewarm()
+        return settings
+    
     @staticmethod
     def load_env_config() -> Dict:
         """
@@ -26,42 +302,50 @@ class ConfigLoader:
         Returns:
             Configuration dictionary
         """
-        project_root = Path(__file__).parent.parent
-        
         # Try robot.yaml first (preferred)
-        robot_yaml = project_root / "robot.yaml"
+        robot_yaml = ROBOT_YAML_PATH
         if robot_yaml.exists():
             try:
                 config = ConfigLoader.load_yaml(str(robot_yaml))
                 if config:
                     logger.info(f"Loaded configuration from {robot_yaml}")
                     # Ensure all required keys exist with defaults
-                    defaults = ConfigLoader.get_default_robot_config()
-                    for key in defaults:
+                    for key, value in _DEFAULT_ROBOT_CONFIG.items():
                         if key not in config:
-                            config[key] = defaults[key]
+                            config[key] = copy.deepcopy(value)
                     return config
             except Exception as e:
                 logger.warning(f"Failed to load robot.yaml: {e}, falling back to .env")
         
         # Fall back to .env file for backwards compatibility
-        env_file = project_root / ".env"
+        env_file = ENV_FILE_PATH
         if env_file.exists():
-            load_dotenv(env_file)
-            logger.info(f"Loaded environment from {env_file}")
+            # Only re-read .env when it changed since the last load
+            stat = env_file.stat()
+            signature = (str(env_file), stat.st_mtime_ns, stat.st_size)
+            if signature != ConfigLoader._env_signature:
+                _load_dotenv(env_file)
+                ConfigLoader._env_signature = signature
+                logger.info(f"Loaded environment from {env_file}")
+        
+        # Reuse the last config while the variables it came from are unchanged
+        env_values = tuple(os.environ.get(name) for name in ENV_CONFIG_VARS)
+        cached = ConfigLoader._env_config_cache
+        if cached and cached[0] == env_values:
+            return copy.deepcopy(cached[1])
         
         # Build config from environment variables or defaults
         config = {
             'robot': {
                 'ip': os.getenv('ROBOT_IP', '192.168.10.18'),
-                'port': int(os.getenv('ROBOT_PORT', '8080')),
+                'port': _env_number('ROBOT_PORT', 8080, int),
                 'model': os.getenv('ROBOT_MODEL', 'R1D2'),
             },
             'control': {
-                'update_rate': float(os.getenv('DEFAULT_UPDATE_RATE', '100')),
+                'update_rate': _env_number('DEFAULT_UPDATE_RATE', 100.0, float),
             },
             'speeds': {
-                'default': float(os.getenv('DEFAULT_SPEED', '0.1')),
+                'default': _env_number('DEFAULT_SPEED', 0.1, float),
             },
             'logging': {
                 'level': os.getenv('LOG_LEVEL', 'INFO'),
@@ -69,17 +353,36 @@ class ConfigLoader:
         }
         
         # Add DOF if specified (optional, will auto-detect if not set)
-        dof_env = os.getenv('ROBOT_DOF', '')
-        if dof_env and dof_env.isdigit():
-            config['robot']['dof'] = int(dof_env)
+        dof = _env_number('ROBOT_DOF', None, int)
+        if dof is not None:
+            config['robot']['dof'] = dof
         
-        return config
+        ConfigLoader._env_config_cache = (env_values, config)
+        return copy.deepcopy(config)
+    
+    @staticmethod
+    def load_robot_settings() -> RobotConfig:
+        """
+        Load robot connection settings from robot.yaml or .env.
+        
+        Returns:
+            RobotConfig with defaults filled in for missing keys
+        """
+        robot = ConfigLoader.load_env_config().get('robot') or {}
+        return RobotConfig(**{
+            f.name: robot[f.name] for f in fields(RobotConfig) if f.name in robot
+        })
     
     @staticmethod
     def load_yaml(filepath: str) -> Optional[Dict]:
         """
         Load YAML configuration file.
         
+        Parsed files are cached per process and re-read only when their
+        modification time or size changes. Callers get their own copy to mutate.
+        Across processes, the parsed result is kept as JSON under
+        JSON_CACHE_DIR, which loads much faster.
+        
         Args:
             filepath: Path to YAML file
             
@@ -87,10 +390,34 @@ class ConfigLoader:
             Configuration dictionary or None if error
         """
         try:
-            with open(filepath, 'r') as f:
-                config = yaml.safe_load(f)
+            path = Path(filepath).resolve()
+            stat = path.stat()
+            key = str(path)
+            cache = ConfigLoader._yaml_cache
+            
+            cached = cache.get(key)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                cache.move_to_end(key)
+                return copy.deepcopy(cached[2])
+            
+            sidecar = ConfigLoader._json_cache_path(path)
+            config = ConfigLoader._read_json_cache(sidecar, stat)
+            if config is None:
+                if not LIBYAML_AVAILABLE and not ConfigLoader._reported_yaml_loader:
+                    logger.info("libyaml not available, using the slower pure-Python YAML loader")
+                    ConfigLoader._reported_yaml_loader = True
+                
+                # Bytes go straight to the parser, which detects the encoding itself
+                with open(path, 'rb') as f:
+                    config = yaml.load(f, Loader=YamlLoader)
+                ConfigLoader._write_json_cache(sidecar, stat, config)
+            
+            cache[key] = (stat.st_mtime_ns, stat.st_size, config)
+            cache.move_to_end(key)
+            if len(cache) > ConfigLoader._yaml_cache_max:
+                cache.popitem(last=False)
             logger.info(f"Loaded configuration from {filepath}")
-            return config
+            return copy.deepcopy(config)
         except FileNotFoundError:
             logger.error(f"Configuration file not found: {filepath}")
             return None
@@ -98,6 +425,56 @@ class ConfigLoader:
             logger.error(f"Error parsing YAML file: {e}")
             return None
     
+    @staticmethod
+    def _json_cache_path(path: Path) -> Path:
+        """Get the JSON cache file for a resolved YAML path."""
+        digest = hashlib.sha1(str(path).encode('utf-8', 'surrogateescape')).hexdigest()[:16]
+        return JSON_CACHE_DIR / f"{path.stem}-{digest}.json"
+    
+    @staticmethod
+    def _read_json_cache(sidecar: Path, stat: os.stat_result) -> Optional[Dict]:
+        """Return the config stored in a JSON cache file if it matches the YAML's stat."""
+        try:
+            with open(sidecar, 'rb') as f:
+                entry = json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+        
+        if (not isinstance(entry, dict) or entry.get('mtime_ns') != stat.st_mtime_ns
+                or entry.get('size') != stat.st_size):
+            return None
+        return entry.get('config')
+    
+    @staticmethod
+    def _write_json_cache(sidecar: Path, stat: os.stat_result, config) -> None:
+        """Write the JSON cache file for a parsed YAML file, skipping what JSON can't represent."""
+        if config is None:
+            return
+        try:
+            data = json.dumps(
+                {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'config': config},
+                separators=(',', ':')
+            )
+        except (TypeError, ValueError):
+            return
+        # Non-string keys and tuples survive dumps() but not the round trip
+        if json.loads(data)['config'] != config:
+            return
+        
+        # Write to a temp file and rename, so readers never see a partial file
+        try:
+            sidecar.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=sidecar.parent, prefix=sidecar.name, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.write(data)
+                os.replace(tmp_path, sidecar)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug(f"Could not write config cache {sidecar}: {e}")
+    
     @staticmethod
     def load_robot_config(filepath: str = "config/robot_config.yaml") -> Dict:
         """
@@ -106,21 +483,18 @@ class ConfigLoader:
         2. YAML config file
         3. Defaults
         """
-        # Start with defaults
         config = ConfigLoader.get_default_robot_config()
         
-        # Try to load from YAML
-        yaml_config = ConfigLoader.load_yaml(filepath)
-        if yaml_config:
-            # Merge YAML config into defaults
-            config.update(yaml_config)
+        # YAML values override defaults key by key, so a partial section
+        # (e.g. only robot.ip) keeps the remaining default keys
+        _deep_merge(config, ConfigLoader.load_yaml(filepath) or {})
         
-        # Load and merge environment variables (highest priority)
+        # Environment variables have the highest priority
         env_config = ConfigLoader.load_env_config()
-        if env_config.get('robot'):
-            config['robot'].update(env_config['robot'])
-        if env_config.get('control'):
-            config['control'].update(env_config['control'])
+        _deep_merge(config, {
+            section: env_config[section]
+            for section in ('robot', 'control') if env_config.get(section)
+        })
         
         return config
     
@@ -145,80 +519,14 @@ class ConfigLoader:
     @staticmethod
     def get_default_robot_config() -> Dict:
         """Get default robot configuration."""
-        return {
-            'robot': {
-                'ip': '192.168.1.18',
-                'port': 8080,
-                'model': 'RM65',
-            },
-            'control': {
-                'mode': 'cartesian',
-                'update_rate': 100,
-            },
-            'limits': {
-                'max_linear_velocity': 0.5,
-                'max_angular_velocity': 1.0,
-                'max_joint_velocity': 30.0,
-            },
-            'safety': {
-                'enable_deadman': True,
-                'enable_collision_detection': True,
-                'collision_level': 3,
-                'emergency_stop_enabled': True,
-            }
-        }
+        return copy.deepcopy(_DEFAULT_ROBOT_CONFIG)
     
     @staticmethod
     def get_default_keyboard_config() -> Dict:
         """Get default keyboard configuration."""
-        return {
-            'keyboard': {
-                'forward': 'w',
-                'backward': 's',
-                'left': 'a',
-                'right': 'd',
-                'up': 'q',
-                'down': 'e',
-                'emergency_stop': 'space',
-                'enable': 'shift',
-            },
-            'speeds': {
-                'linear': 0.1,
-                'angular': 0.3,
-                'joint': 10.0,
-            }
-        }
+        return copy.deepcopy(_DEFAULT_KEYBOARD_CONFIG)
     
     @staticmethod
     def get_default_joystick_config() -> Dict:
         """Get default joystick configuration."""
-        return {
-            'joystick': {
-                'device': 0,
-                'deadzone': 0.1,
-            },
-            'axes': {
-                'linear_x': 1,
-                'linear_y': 0,
-                'linear_z': 4,
-                'angular_x': 3,
-                'angular_y': 5,
-                'angular_z': 2,
-            },
-            'buttons': {
-                'enable': 4,
-                'turbo': 5,
-                'emergency_stop': 6,
-                'mode_switch': 7,
-            },
-            'speeds': {
-                'normal': {
-                    'linear': 0.1,
-                    'angular': 0.3,
-                },
-                'turbo': {
-                    'linear': 0.3,
-                    'angular': 0.8,
-                }
-            }
-        }
+        return copy.deepcopy(_DEFAULT_JOYSTICK_CONFIG)
@@ -5,19 +5,28 @@ Different control modes for robot teleoperation.
 """
 
 import logging
-from abc import ABC, abstractmethod
 from typing import List, Optional
 
+import numpy as np
+
+from ._kernels import joint_step, smooth_velocity
+
 logger = logging.getLogger(__name__)
 
 
-class ControlMode(ABC):
-    """Base class for control modes."""
+class ControlMode:
+    """
+    Base class for control modes.
+    
+    A plain class rather than an ABC, so creating modes and isinstance()
+    checks skip the ABC machinery.
+    """
+    
+    __slots__ = ()
     
-    @abstractmethod
     def compute_command(self, input_velocity: List[float], current_state: dict) -> dict:
         """Compute robot command from input velocity."""
-        pass
+        raise NotImplementedError
 
 
 class JointControl(ControlMode):
@@ -27,14 +36,21 @@ class JointControl(ControlMode):
     Directly controls individual joint angles.
     """
     
-    def __init__(self, max_joint_velocity: float = 30.0):
+    __slots__ = ('max_joint_velocity', 'dof', '_target')
+    
+    def __init__(self, max_joint_velocity: float = 30.0, dof: Optional[int] = None):
         """
         Initialize joint control.
         
         Args:
             max_joint_velocity: Maximum joint velocity in deg/s
+            dof: Robot degrees of freedom, if already known (e.g. from
+                ConfigLoader.robot().dof). Lets every tick reuse one target
+                buffer instead of allocating it.
         """
         self.max_joint_velocity = max_joint_velocity
+        self.dof = dof
+        self._target = np.empty(dof, dtype=np.float64) if dof else None
     
     def compute_command(self, input_velocity: List[float], current_state: dict) -> dict:
         """
@@ -42,32 +58,35 @@ class JointControl(ControlMode):
         
         Args:
             input_velocity: Desired joint velocities
-            current_state: Current robot state
+            current_state: Current robot state. 'joint_angles' may be a list
+                or a float64 ndarray; an ndarray is used without copying.
             
         Returns:
             Command dictionary with target joint angles
         """
-        current_joints = current_state.get('joint_angles', [])
-        if not current_joints:
+        current_joints = current_state.get('joint_angles')
+        if current_joints is None or len(current_joints) == 0:
             logger.warning("No current joint angles available")
             return {'type': 'joint', 'target': []}
         
-        # Limit velocities
-        limited_velocities = [
-            max(min(v, self.max_joint_velocity), -self.max_joint_velocity)
-            for v in input_velocity
-        ]
+        current_joints = np.asarray(current_joints, dtype=np.float64)
         
-        # Compute target angles (simple integration)
+        # Limit velocities and compute target angles (simple integration)
         dt = current_state.get('dt', 0.01)
-        target_joints = [
-            current_joints[i] + limited_velocities[i] * dt
-            for i in range(len(current_joints))
-        ]
+        target_joints = self._target
+        if target_joints is None or target_joints.size != current_joints.size:
+            target_joints = np.empty_like(current_joints)
+        joint_step(
+            current_joints,
+            np.asarray(input_velocity, dtype=np.float64)[:current_joints.size],
+            self.max_joint_velocity,
+            dt,
+            target_joints
+        )
         
         return {
             'type': 'joint',
-            'target': target_joints,
+            'target': target_joints.tolist(),
             'velocity': 50,  # Planning velocity percentage
         }
 
@@ -79,6 +98,8 @@ class CartesianControl(ControlMode):
     Controls end-effector position and orientation in 3D space.
     """
     
+    __slots__ = ('_max_linear_velocity', '_max_angular_velocity', '_lo', '_hi')
+    
     def __init__(
         self,
         max_linear_velocity: float = 0.5,
@@ -91,8 +112,37 @@ class CartesianControl(ControlMode):
             max_linear_velocity: Maximum linear velocity in m/s
             max_angular_velocity: Maximum angular velocity in rad/s
         """
-        self.max_linear_velocity = max_linear_velocity
-        self.max_angular_velocity = max_angular_velocity
+        self._max_linear_velocity = max_linear_velocity
+        self._max_angular_velocity = max_angular_velocity
+        self._update_bounds()
+    
+    @property
+    def max_linear_velocity(self) -> float:
+        """Maximum linear velocity in m/s."""
+        return self._max_linear_velocity
+    
+    @max_linear_velocity.setter
+    def max_linear_velocity(self, value: float):
+        self._max_linear_velocity = value
+        self._update_bounds()
+    
+    @property
+    def max_angular_velocity(self) -> float:
+        """Maximum angular velocity in rad/s."""
+        return self._max_angular_velocity
+    
+    @max_angular_velocity.setter
+    def max_angular_velocity(self, value: float):
+        self._max_angular_velocity = value
+        self._update_bounds()
+    
+    def _update_bounds(self):
+        """Rebuild the per-axis velocity bounds [vx, vy, vz, wx, wy, wz]."""
+        self._hi = np.array(
+            [self._max_linear_velocity] * 3 + [self._max_angular_velocity] * 3,
+            dtype=np.float64
+        )
+        self._lo = -self._hi
     
     def compute_command(self, input_velocity: List[float], current_state: dict) -> dict:
         """
@@ -100,34 +150,31 @@ class CartesianControl(ControlMode):
         
         Args:
             input_velocity: Desired Cartesian velocities [vx, vy, vz, wx, wy, wz]
-            current_state: Current robot state
+            current_state: Current robot state. 'pose' may be a list or a
+                float64 ndarray; an ndarray is used without copying.
             
         Returns:
             Command dictionary with target pose
         """
-        current_pose = current_state.get('pose', [])
-        if not current_pose or len(current_pose) != 6:
+        current_pose = current_state.get('pose')
+        if current_pose is None or len(current_pose) != 6:
             logger.warning("No valid current pose available")
             return {'type': 'cartesian', 'target': []}
         
         # Limit velocities
-        limited_velocity = [
-            max(min(input_velocity[i], self.max_linear_velocity), -self.max_linear_velocity)
-            if i < 3 else
-            max(min(input_velocity[i], self.max_angular_velocity), -self.max_angular_velocity)
-            for i in range(6)
-        ]
+        limited_velocity = np.clip(
+            np.asarray(input_velocity, dtype=np.float64)[:6],
+            self._lo,
+            self._hi
+        )
         
         # Compute target pose
         dt = current_state.get('dt', 0.01)
-        target_pose = [
-            current_pose[i] + limited_velocity[i] * dt
-            for i in range(6)
-        ]
+        target_pose = np.asarray(current_pose, dtype=np.float64) + limited_velocity * dt
         
         return {
             'type': 'cartesian',
-            'target': target_pose,
+            'target': target_pose.tolist(),
             'velocity': 50,
         }
 
@@ -139,6 +186,8 @@ class VelocityControl(ControlMode):
     Continuous velocity-based control (for advanced users).
     """
     
+    __slots__ = ('max_velocity', 'smoothing_factor', 'previous_velocity', '_buf')
+    
     def __init__(
         self,
         max_velocity: float = 0.5,
@@ -153,7 +202,8 @@ class VelocityControl(ControlMode):
         """
         self.max_velocity = max_velocity
         self.smoothing_factor = smoothing_factor
-        self.previous_velocity = [0.0] * 6
+        self.previous_velocity = np.zeros(6, dtype=np.float64)
+        self._buf = np.empty(6, dtype=np.float64)
     
     def compute_command(self, input_velocity: List[float], current_state: dict) -> dict:
         """
@@ -166,22 +216,30 @@ class VelocityControl(ControlMode):
         Returns:
             Command dictionary with smoothed velocity
         """
-        # Apply exponential smoothing
-        smoothed_velocity = [
-            self.smoothing_factor * self.previous_velocity[i] +
-            (1 - self.smoothing_factor) * input_velocity[i]
-            for i in range(len(input_velocity))
-        ]
+        velocity = np.asarray(input_velocity, dtype=np.float64)
+        n = velocity.size
+        if n > self._buf.size:
+            # More components than before; unseen ones start from zero
+            self.previous_velocity = np.concatenate(
+                (self.previous_velocity, np.zeros(n - self._buf.size))
+            )
+            self._buf = np.empty(n, dtype=np.float64)
         
-        # Limit magnitude
-        magnitude = sum(v**2 for v in smoothed_velocity) ** 0.5
-        if magnitude > self.max_velocity:
-            scale = self.max_velocity / magnitude
-            smoothed_velocity = [v * scale for v in smoothed_velocity]
+        # Apply exponential smoothing and limit magnitude over the
+        # components given (views, so shorter inputs allocate nothing)
+        smoothed_velocity = self._buf[:n]
+        previous_velocity = self.previous_velocity[:n]
+        smooth_velocity(
+            previous_velocity,
+            velocity,
+            self.smoothing_factor,
+            self.max_velocity,
+            smoothed_velocity
+        )
         
-        self.previous_velocity = smoothed_velocity
+        previous_velocity[:] = smoothed_velocity
         
         return {
             'type': 'velocity',
-            'velocity': smoothed_velocity,
+            'velocity': smoothed_velocity.tolist(),
         }
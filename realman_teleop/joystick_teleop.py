@@ -5,8 +5,13 @@ Gamepad/joystick-based control for RealMan robotic arms.
 """
 
 import logging
+import time
 from typing import Dict, Optional
+
+import numpy as np
 import pygame
+
+from ._kernels import integrate
 from .teleop_base import TeleopBase
 from .robot_controller import RobotController
 
@@ -39,6 +44,27 @@ class JoystickTeleop(TeleopBase):
         'home': 1,               # B button
     }
     
+    # Per-tick input flags and their released values
+    _INPUT_FLAGS = {
+        'enable': False,
+        'turbo': False,
+        'emergency_stop': False,
+        'mode_switch': False,
+        'home': False,
+        'gripper_open': False,
+        'gripper_close': False,
+        'gripper_half': False,
+    }
+    
+    # Command velocity when nothing moves
+    _ZERO_VELOCITY = (0.0,) * 6
+    
+    # Bits of the edge-triggered buttons in _edge_prev
+    _MODE_SWITCH = 1
+    _GRIPPER_OPEN = 2
+    _GRIPPER_CLOSE = 4
+    _GRIPPER_HALF = 8
+    
     def __init__(
         self,
         robot: RobotController,
@@ -49,6 +75,9 @@ class JoystickTeleop(TeleopBase):
         deadzone: float = 0.1,
         normal_speed: float = 0.1,
         turbo_speed: float = 0.3,
+        event_driven: bool = False,
+        async_commands: bool = False,
+        stream_commands: bool = False,
     ):
         """
         Initialize joystick teleoperation.
@@ -62,8 +91,14 @@ class JoystickTeleop(TeleopBase):
             deadzone: Joystick deadzone (0-1)
             normal_speed: Normal speed multiplier
             turbo_speed: Turbo speed multiplier
+            event_driven: Wait for joystick events instead of polling while idle
+            async_commands: Send motion commands from a background thread
+            stream_commands: Stream per-tick targets without trajectory planning
         """
-        super().__init__(robot, update_rate)
+        super().__init__(
+            robot, update_rate, event_driven=event_driven,
+            async_commands=async_commands, stream_commands=stream_commands
+        )
         
         self.device_index = device_index
         self.axis_map = axis_map or self.DEFAULT_AXIS_MAP
@@ -72,9 +107,49 @@ class JoystickTeleop(TeleopBase):
         self.normal_speed = normal_speed
         self.turbo_speed = turbo_speed
         
+        # Axis indices in [linear x/y/z, angular x/y/z] order and button
+        # (action, index) pairs, resolved once for read_input
+        self._axis_idx = tuple(
+            self.axis_map[name]
+            for name in ('linear_x', 'linear_y', 'linear_z',
+                         'angular_x', 'angular_y', 'angular_z')
+        )
+        self._button_items = tuple(self.button_map.items())
+        
         self.joystick = None
+        self._num_axes = 0
+        self._num_buttons = 0
         self.mode = "cartesian"
         self.turbo_active = False
+        self._edge_prev = 0  # Edge-triggered buttons held on the previous tick
+        
+        # Pump SDL events at most once per control period
+        self._pump_interval = max(self.update_period, 0.001)
+        self._last_pump = 0.0
+        
+        # Input state returned by every read_input call, reset in place;
+        # callers must not keep it across ticks
+        # 'linear' and 'angular' are views into one [vx, vy, vz, wx, wy, wz]
+        # vector of raw axis values
+        self._vel6 = np.zeros(6, dtype=np.float64)
+        self._input_state = {
+            'linear': self._vel6[:3],
+            'angular': self._vel6[3:],
+        }
+        self._input_state.update(self._INPUT_FLAGS)
+        
+        # Velocity and target buffers reused on every tick
+        self._velocity = np.zeros(6, dtype=np.float64)
+        self._pose_target = np.empty(6, dtype=np.float64)
+        self._joint_target = np.empty(robot.dof, dtype=np.float64)
+        
+        # Command dict returned by every process_input call, reset in place
+        self._commands = {
+            'type': "cartesian",
+            'velocity': self._ZERO_VELOCITY,
+            'stop': False,
+            'home': False,
+        }
     
     def setup(self) -> bool:
         """Setup pygame and joystick."""
@@ -96,10 +171,21 @@ class JoystickTeleop(TeleopBase):
             # Initialize joystick
             self.joystick = pygame.joystick.Joystick(self.device_index)
             self.joystick.init()
+            self._num_axes = self.joystick.get_numaxes()
+            self._num_buttons = self.joystick.get_numbuttons()
+            
+            # Drop mapped buttons this device does not have
+            self._button_items = tuple(
+                (action, index) for action, index in self.button_map.items()
+                if index < self._num_buttons
+            )
+            
+            # Prime SDL so the first read sees real axis values, not defaults
+            pygame.event.pump()
+            pygame.event.clear(pump=False)
             
             logger.info(f"Joystick connected: {self.joystick.get_name()}")
-            logger.info(f"Axes: {self.joystick.get_numaxes()}, "
-                       f"Buttons: {self.joystick.get_numbuttons()}")
+            logger.info(f"Axes: {self._num_axes}, Buttons: {self._num_buttons}")
             logger.info(f"Deadzone: {self.deadzone}")
             logger.info(f"Normal speed: {self.normal_speed}, Turbo: {self.turbo_speed}")
             
@@ -110,68 +196,82 @@ class JoystickTeleop(TeleopBase):
             return False
     
     def read_input(self) -> dict:
-        """Read joystick input."""
-        input_state = {
-            'linear': [0.0, 0.0, 0.0],
-            'angular': [0.0, 0.0, 0.0],
-            'enable': False,
-            'turbo': False,
-            'emergency_stop': False,
-            'mode_switch': False,
-            'home': False,
-            'gripper_open': False,
-            'gripper_close': False,
-            'gripper_half': False,
-        }
+        """
+        Read joystick input.
+        
+        Returns:
+            Input state dictionary; the same object is reused on every call
+        """
+        # Reset the shared input state in place
+        input_state = self._input_state
+        input_state.update(self._INPUT_FLAGS)
+        self._vel6.fill(0.0)
         
         if not self.joystick:
             return input_state
         
-        # Process pygame events
-        pygame.event.pump()
-        
-        # Read axes
-        def read_axis(axis_index: int) -> float:
-            """Read axis value with deadzone."""
-            if axis_index >= self.joystick.get_numaxes():
-                return 0.0
-            value = self.joystick.get_axis(axis_index)
-            return value if abs(value) > self.deadzone else 0.0
+        # Pump once and drain the queue in the same pass; the joystick state
+        # is read directly below, so queued events are never needed
+        now = time.monotonic()
+        if now - self._last_pump >= self._pump_interval:
+            self._last_pump = now
+            pygame.event.pump()
+            pygame.event.clear(pump=False)
         
         # Map axes to linear/angular velocities
-        input_state['linear'][0] = read_axis(self.axis_map['linear_x'])
-        input_state['linear'][1] = read_axis(self.axis_map['linear_y'])
-        input_state['linear'][2] = read_axis(self.axis_map['linear_z'])
+        axis = self._axis_idx
+        input_state['linear'][0] = self._read_axis(axis[0])
+        input_state['linear'][1] = self._read_axis(axis[1])
+        input_state['linear'][2] = self._read_axis(axis[2])
         
-        input_state['angular'][0] = read_axis(self.axis_map['angular_x'])
-        input_state['angular'][1] = read_axis(self.axis_map['angular_y'])
-        input_state['angular'][2] = read_axis(self.axis_map['angular_z'])
+        input_state['angular'][0] = self._read_axis(axis[3])
+        input_state['angular'][1] = self._read_axis(axis[4])
+        input_state['angular'][2] = self._read_axis(axis[5])
         
         # Read buttons
-        for action, button_index in self.button_map.items():
-            if button_index < self.joystick.get_numbuttons():
-                if self.joystick.get_button(button_index):
-                    input_state[action] = True
+        for action, button_index in self._button_items:
+            if self.joystick.get_button(button_index):
+                input_state[action] = True
         
         return input_state
     
+    def _read_axis(self, axis_index: int) -> float:
+        """Read axis value with deadzone."""
+        if axis_index >= self._num_axes:
+            return 0.0
+        value = self.joystick.get_axis(axis_index)
+        return value if abs(value) > self.deadzone else 0.0
+    
+    def wait_for_input(self, timeout: float):
+        """Block until a joystick event arrives or the timeout expires."""
+        event = pygame.event.wait(int(timeout * 1000))
+        if event.type != pygame.NOEVENT:
+            # Leave it queued for read_input
+            pygame.event.post(event)
+    
     def process_input(self, input_state: dict) -> dict:
         """Process joystick input into robot commands."""
-        commands = {
-            'type': self.mode,
-            'velocity': [0.0] * 6,
-            'stop': False,
-            'home': False,
-        }
+        # Reset the shared command dict in place
+        commands = self._commands
+        commands['type'] = self.mode
+        commands['velocity'] = self._ZERO_VELOCITY
+        commands['stop'] = False
+        commands['home'] = False
+        
+        # Bitmask of edge-triggered buttons held now, and the ones newly pressed
+        held = (
+            input_state['mode_switch'] * self._MODE_SWITCH
+            | input_state['gripper_open'] * self._GRIPPER_OPEN
+            | input_state['gripper_close'] * self._GRIPPER_CLOSE
+            | input_state['gripper_half'] * self._GRIPPER_HALF
+        )
+        pressed = held & ~self._edge_prev
+        self._edge_prev = held
         
         # Handle mode switch
-        if input_state['mode_switch']:
-            if not hasattr(self, '_mode_switch_pressed'):
-                self._mode_switch_pressed = True
-                self.mode = "joint" if self.mode == "cartesian" else "cartesian"
-                logger.info(f"Switched to {self.mode.upper()} mode")
-        else:
-            self._mode_switch_pressed = False
+        if pressed & self._MODE_SWITCH:
+            self.mode = "joint" if self.mode == "cartesian" else "cartesian"
+            logger.info(f"Switched to {self.mode.upper()} mode")
         
         # Handle turbo
         self.turbo_active = input_state['turbo']
@@ -183,39 +283,20 @@ class JoystickTeleop(TeleopBase):
             return commands
         
         # Handle gripper controls
-        if input_state['gripper_open']:
-            if not hasattr(self, '_gripper_open_pressed'):
-                self._gripper_open_pressed = True
-                self.robot.gripper_open(speed=500, block=False)
-                logger.info("Opening gripper")
-        else:
-            self._gripper_open_pressed = False
+        if pressed & self._GRIPPER_OPEN:
+            self.robot.gripper_open(speed=500, block=False)
+            logger.info("Opening gripper")
         
-        if input_state['gripper_close']:
-            if not hasattr(self, '_gripper_close_pressed'):
-                self._gripper_close_pressed = True
-                self.robot.gripper_close(speed=500, force=300, block=False)
-                logger.info("Closing gripper")
-        else:
-            self._gripper_close_pressed = False
+        if pressed & self._GRIPPER_CLOSE:
+            self.robot.gripper_close(speed=500, force=300, block=False)
+            logger.info("Closing gripper")
         
-        if input_state['gripper_half']:
-            if not hasattr(self, '_gripper_half_pressed'):
-                self._gripper_half_pressed = True
-                self.robot.gripper_set_position(500, block=False)
-                logger.info("Half-opening gripper")
-        else:
-            self._gripper_half_pressed = False
+        if pressed & self._GRIPPER_HALF:
+            self.robot.gripper_set_position(500, block=False)
+            logger.info("Half-opening gripper")
         
         # Build velocity command
-        commands['velocity'] = [
-            input_state['linear'][0] * speed_multiplier,
-            input_state['linear'][1] * speed_multiplier,
-            input_state['linear'][2] * speed_multiplier,
-            input_state['angular'][0] * speed_multiplier,
-            input_state['angular'][1] * speed_multiplier,
-            input_state['angular'][2] * speed_multiplier,
-        ]
+        commands['velocity'] = np.multiply(self._vel6, speed_multiplier, out=self._velocity)
         
         return commands
     
@@ -223,33 +304,59 @@ class JoystickTeleop(TeleopBase):
         """Send commands to robot."""
         try:
             if commands['home']:
-                self.robot.move_to_home()
+                self._forget_state()
+                self._cancel_motion()
+                # Blocks until the arm is home
+                with self._watchdog_suspended():
+                    self.robot.move_to_home()
                 return True
             
             if commands['stop']:
+                self._forget_state()
+                self._cancel_motion()
                 self.robot.stop()
                 return True
             
-            # Check if there's any movement
-            if any(v != 0 for v in commands['velocity']):
-                if commands['type'] == "cartesian":
-                    current_pose = self.robot.get_current_pose()
-                    if current_pose:
-                        dt = self.update_period
-                        target_pose = [
-                            current_pose[i] + commands['velocity'][i] * dt
-                            for i in range(6)
-                        ]
-                        self.robot.movel(target_pose, velocity=50, block=False)
-                else:
-                    current_joints = self.robot.get_current_joint_angles()
-                    if current_joints:
-                        dt = self.update_period
-                        target_joints = [
-                            current_joints[i] + commands['velocity'][i] * dt
-                            for i in range(len(current_joints))
-                        ]
-                        self.robot.movej(target_joints, velocity=50, block=False)
+            # Nothing to send when the velocity is negligible; skips the state
+            # read too. The next motion starts from a fresh robot read.
+            velocity = np.asarray(commands['velocity'], dtype=np.float64)
+            if velocity.dot(velocity) <= self.MIN_VELOCITY * self.MIN_VELOCITY:
+                self._forget_state()
+                return True
+            
+            # The remembered state is the target buffer itself, so ticks
+            # between robot reads integrate in place without allocating
+            if commands['type'] == "cartesian":
+                current_pose = self._current_state("cartesian")
+                if current_pose is not None:
+                    target_pose = self._pose_target
+                    integrate(
+                        np.asarray(current_pose, dtype=np.float64),
+                        velocity,
+                        self.update_period,
+                        target_pose
+                    )
+                    if self._send_motion("cartesian", target_pose.tolist()):
+                        self._remember_state(target_pose)
+                    else:
+                        self._forget_state()
+                        
+            else:  # joint mode
+                current_joints = self._current_state("joint")
+                if current_joints is not None:
+                    target_joints = self._joint_target
+                    if target_joints.size != len(current_joints):
+                        target_joints = self._joint_target = np.empty(len(current_joints))
+                    integrate(
+                        np.asarray(current_joints, dtype=np.float64),
+                        velocity,
+                        self.update_period,
+                        target_joints
+                    )
+                    if self._send_motion("joint", target_joints.tolist()):
+                        self._remember_state(target_joints)
+                    else:
+                        self._forget_state()
             
             return True
             
@@ -270,17 +377,18 @@ def list_joysticks():
     pygame.init()
     pygame.joystick.init()
     
-    count = pygame.joystick.get_count()
-    print(f"\nFound {count} joystick(s):")
+    # Joysticks open on creation in pygame 2; pygame.quit() closes them all
+    joysticks = [pygame.joystick.Joystick(i) for i in range(pygame.joystick.get_count())]
     
-    for i in range(count):
-        joystick = pygame.joystick.Joystick(i)
-        joystick.init()
-        print(f"\nJoystick {i}:")
-        print(f"  Name: {joystick.get_name()}")
-        print(f"  Axes: {joystick.get_numaxes()}")
-        print(f"  Buttons: {joystick.get_numbuttons()}")
-        print(f"  Hats: {joystick.get_numhats()}")
-        joystick.quit()
+    lines = [f"\nFound {len(joysticks)} joystick(s):"]
+    for i, joystick in enumerate(joysticks):
+        lines.append(
+            f"\nJoystick {i}:\n"
+            f"  Name: {joystick.get_name()}\n"
+            f"  Axes: {joystick.get_numaxes()}\n"
+            f"  Buttons: {joystick.get_numbuttons()}\n"
+            f"  Hats: {joystick.get_numhats()}"
+        )
+    print("\n".join(lines))
     
     pygame.quit()
@@ -8,8 +8,13 @@ Automatically detects if running over SSH and uses appropriate input method.
 import logging
 import sys
 import os
+import queue
+import threading
+import time
 from typing import Dict, Optional
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 # Try to import pygame, but don't fail if not available
@@ -30,12 +35,36 @@ except ImportError:
     TERMINAL_MODE_AVAILABLE = False
     logger.warning("Terminal mode not available (Windows?)")
 
+from ._kernels import integrate
 from .teleop_base import TeleopBase
 from .robot_controller import RobotController
 
 
+# Held-key motion actions: action -> (input_state vector, component, sign)
+MOTION_ACTIONS = {
+    'forward': ('linear', 0, 1.0),
+    'backward': ('linear', 0, -1.0),
+    'left': ('linear', 1, 1.0),
+    'right': ('linear', 1, -1.0),
+    'up': ('linear', 2, 1.0),
+    'down': ('linear', 2, -1.0),
+    'rotate_x_pos': ('angular', 0, 1.0),
+    'rotate_x_neg': ('angular', 0, -1.0),
+    'rotate_y_pos': ('angular', 1, 1.0),
+    'rotate_y_neg': ('angular', 1, -1.0),
+    'rotate_z_pos': ('angular', 2, 1.0),
+    'rotate_z_neg': ('angular', 2, -1.0),
+}
+
+
+# Result of the pygame display probe in _detect_display, once it has run
+_DISPLAY_PROBED: Optional[bool] = None
+
+
 def _detect_display():
     """Detect if a display is available."""
+    global _DISPLAY_PROBED
+    
     if not PYGAME_AVAILABLE:
         return False
     
@@ -51,14 +80,16 @@ def _detect_display():
     if os.environ.get('SSH_CONNECTION') or os.environ.get('SSH_CLIENT'):
         return False
     
-    # Try to initialize pygame to see if display works
-    try:
-        pygame.init()
-        pygame.display.set_mode((1, 1))
-        pygame.quit()
-        return True
-    except:
-        return False
+    # Neither says for sure: open a display once to see if it works
+    if _DISPLAY_PROBED is None:
+        try:
+            pygame.display.init()
+            pygame.display.set_mode((1, 1))
+            pygame.display.quit()
+            _DISPLAY_PROBED = True
+        except:
+            _DISPLAY_PROBED = False
+    return _DISPLAY_PROBED
 
 
 class KeyboardTeleop(TeleopBase):
@@ -89,6 +120,91 @@ class KeyboardTeleop(TeleopBase):
         '\x1b': 'exit',  # ESC
     }
     
+    # Terminal mode: pose change per keypress (rotation keys move half as far)
+    TERMINAL_STEP = 0.01
+    
+    # Terminal mode: seconds before the locally tracked pose is re-read from the robot
+    TERMINAL_POSE_REFRESH = 1.0
+    
+    # Terminal mode: key batches closer together than this (seconds) count as
+    # one held key, and the furthest ahead of the tracked pose a held key
+    # aims, in batches
+    TERMINAL_REPEAT_GAP = 0.2
+    TERMINAL_MAX_LEAD = 2.0
+    
+    # Status line shown for each terminal motion action
+    _TERMINAL_MOTION_LABELS = {
+        'forward': "⬆️  Forward (+X)      ",
+        'backward': "⬇️  Backward (-X)     ",
+        'left': "⬅️  Left (+Y)         ",
+        'right': "➡️  Right (-Y)        ",
+        'up': "⬆️  Up (+Z)           ",
+        'down': "⬇️  Down (-Z)         ",
+        'rotate_x_pos': "🔄 Pitch+           ",
+        'rotate_x_neg': "🔄 Pitch-           ",
+        'rotate_y_pos': "🔄 Roll+            ",
+        'rotate_y_neg': "🔄 Roll-            ",
+        'rotate_z_pos': "🔄 Yaw+             ",
+        'rotate_z_neg': "🔄 Yaw-             ",
+    }
+    
+    # Instruction lines drawn above the mode/status lines in the pygame window
+    _STATIC_INSTRUCTIONS = (
+        "RealMan Robot Keyboard Control",
+        "",
+        "Movement (Cartesian):",
+        "  W/S: Forward/Backward (X)",
+        "  A/D: Left/Right (Y)",
+        "  Q/E: Up/Down (Z)",
+        "",
+        "Rotation:",
+        "  I/K: Rotate X",
+        "  J/L: Rotate Y",
+        "  U/O: Rotate Z",
+        "",
+        "Control:",
+        "  SHIFT: Enable (hold)",
+        "  SPACE: Emergency Stop",
+        "  TAB: Switch Mode",
+        "  +/-: Speed Up/Down",
+        "  H: Go Home",
+        "",
+    )
+    
+    # One-shot actions -> handler method, run once per keypress
+    _PRESS_HANDLERS = {
+        'mode_switch': '_press_mode_switch',
+        'speed_up': '_press_speed_up',
+        'speed_down': '_press_speed_down',
+        'gripper_open': '_press_gripper_open',
+        'gripper_close': '_press_gripper_close',
+        'gripper_half': '_press_gripper_half',
+    }
+    _TERMINAL_HANDLERS = {
+        'toggle_enable': '_terminal_toggle_enable',
+        'speed_up': '_terminal_speed_up',
+        'speed_down': '_terminal_speed_down',
+        'go_home': '_terminal_go_home',
+        'gripper_open': '_terminal_gripper_open',
+        'gripper_close': '_terminal_gripper_close',
+        'gripper_half': '_terminal_gripper_half',
+    }
+    
+    # Actions that set an input flag while their key is held (pygame mode)
+    _HELD_FLAGS = ('enable', 'emergency_stop', 'go_home')
+    
+    # Per-tick input flags and their released values
+    _INPUT_FLAGS = {
+        'enable': False,
+        'emergency_stop': False,
+        'mode_switch': False,
+        'speed_change': 0,
+        'go_home': False,
+    }
+    
+    # Command velocity when nothing moves
+    _ZERO_VELOCITY = (0.0,) * 6
+    
     # Pygame key mappings (when available)
     if PYGAME_AVAILABLE:
         DEFAULT_KEY_MAP = {
@@ -133,6 +249,9 @@ class KeyboardTeleop(TeleopBase):
             pygame.K_f: 'gripper_close',
             pygame.K_v: 'gripper_half',
         }
+        
+        # Events read by _read_pygame_input; everything else is discarded
+        _INPUT_EVENTS = (pygame.KEYDOWN, pygame.KEYUP, pygame.WINDOWFOCUSLOST, pygame.QUIT)
     else:
         DEFAULT_KEY_MAP = {}
     
@@ -145,6 +264,9 @@ class KeyboardTeleop(TeleopBase):
         angular_speed: float = 0.3,
         joint_speed: float = 5.0,
         force_terminal_mode: bool = False,
+        event_driven: bool = False,
+        async_commands: bool = False,
+        stream_commands: bool = False,
     ):
         """
         Initialize keyboard teleoperation.
@@ -157,8 +279,14 @@ class KeyboardTeleop(TeleopBase):
             angular_speed: Angular velocity in rad/s
             joint_speed: Joint velocity in deg/s
             force_terminal_mode: Force terminal mode even if display available
+            event_driven: Wait for key events instead of polling while idle
+            async_commands: Send motion commands from a background thread
+            stream_commands: Stream per-tick targets without trajectory planning
         """
-        super().__init__(robot, update_rate)
+        super().__init__(
+            robot, update_rate, event_driven=event_driven,
+            async_commands=async_commands, stream_commands=stream_commands
+        )
         
         # Detect mode
         self.has_display = _detect_display() and not force_terminal_mode
@@ -168,23 +296,166 @@ class KeyboardTeleop(TeleopBase):
             logger.info("Using TERMINAL mode (SSH-compatible)")
             self.key_map = self.TERMINAL_KEY_MAP
             self.toggle_enable = False  # For terminal mode toggle
-            # Reduce update rate for terminal mode to accommodate 50ms key timeout
-            if update_rate > 15:
-                self.update_rate = 15.0
-                self.update_period = 1.0 / 15.0
-                logger.info(f"Terminal mode: reduced update rate to {self.update_rate} Hz for reliable key detection")
         else:
             logger.info("Using PYGAME mode (Display available)")
             self.key_map = key_map or self.DEFAULT_KEY_MAP
         
-        self.linear_speed = linear_speed
-        self.angular_speed = angular_speed
-        self.joint_speed = joint_speed
+        # Key codes currently held down (pygame mode)
+        self._pressed = set()
+        
+        # key code -> MOTION_ACTIONS entry for the motion keys in key_map
+        self._motion_keys = {
+            key_code: MOTION_ACTIONS[action]
+            for key_code, action in self.key_map.items()
+            if action in MOTION_ACTIONS
+        }
+        
+        # key code -> joint index for the 'joint_<n>_neg' actions in key_map
+        self._joint_keys = {
+            key_code: int(action.split('_')[1]) - 1
+            for key_code, action in self.key_map.items()
+            if action.startswith('joint_')
+        }
+        
+        # key code -> input flag for the held-flag keys in key_map (pygame mode)
+        self._flag_keys = {
+            key_code: action
+            for key_code, action in self.key_map.items()
+            if action in self._HELD_FLAGS
+        }
+        
+        # key code (byte value in terminal mode) -> bound handler for the
+        # one-shot keys in key_map
+        handlers = self._TERMINAL_HANDLERS if self.terminal_mode else self._PRESS_HANDLERS
+        self._key_handlers = {
+            ord(key_code) if self.terminal_mode else key_code: getattr(self, handlers[action])
+            for key_code, action in self.key_map.items()
+            if action in handlers
+        }
+        
+        # Pump SDL events at most once per control period
+        self._pump_interval = max(self.update_period, 0.001)
+        self._last_pump = 0.0
+        
+        # Input event taken off the queue by wait_for_input, not yet handled
+        self._waited_event = None
+        
+        # [linear m/s, angular rad/s, joint deg/s], scaled together by speed changes
+        self._speeds = np.array([linear_speed, angular_speed, joint_speed], dtype=np.float64)
         
         self.mode = "cartesian"  # cartesian or joint
-        self.current_velocity = [0.0] * 6  # [vx, vy, vz, wx, wy, wz]
+        
+        # Cartesian velocity input [vx, vy, vz, wx, wy, wz], written in place
+        # by read_input and reset each tick with a single fill()
+        self.current_velocity = np.zeros(6, dtype=np.float64)
+        
+        # Input state returned by every read_input call, reset in place;
+        # callers must not keep it across ticks. 'linear' and 'angular' are
+        # views into current_velocity, which doubles as the Cartesian
+        # velocity command
+        self._joint_zeros = (0.0,) * robot.dof
+        self._input_state = {
+            'linear': self.current_velocity[:3],
+            'angular': self.current_velocity[3:],
+            'joint_deltas': list(self._joint_zeros),
+        }
+        self._input_state.update(self._INPUT_FLAGS)
+        
+        # Target buffers reused by send_commands on every tick
+        self._pose_target = np.empty(6, dtype=np.float64)
+        self._joint_target = np.empty(robot.dof, dtype=np.float64)
+        
+        # Command dict returned by every process_input call, reset in place
+        self._commands = {
+            'type': "cartesian",
+            'velocity': self._ZERO_VELOCITY,
+            'stop': False,
+            'home': False,
+        }
         
         self.screen = None
+        self._font = None
+        
+        # stdin descriptor and its saved attributes while in raw mode (terminal mode)
+        self._stdin_fd = None
+        self._old_termios = None
+        
+        # Raw input chunks read by the stdin reader thread, and a chunk taken
+        # off the queue by wait_for_input but not yet handled
+        self._key_queue = queue.SimpleQueue()
+        self._key_reader = None
+        self._reading_keys = False
+        self._pending_key = None
+        
+        # Text on the terminal status line, and when the last motion key
+        # pressed while disabled was reported there
+        self._status_text = ''
+        self._disabled_warning_time = float('-inf')
+        
+        # Pose change accumulated from one batch of terminal keys, and
+        # tables indexed by input byte giving each key's action and the
+        # (pose index, change) each motion key adds to the pose
+        self._terminal_delta = np.zeros(6, dtype=np.float64)
+        self._byte_actions = [None] * 256
+        self._byte_steps = [None] * 256
+        for key, action in self.TERMINAL_KEY_MAP.items():
+            byte = ord(key)
+            self._byte_actions[byte] = action
+            motion = MOTION_ACTIONS.get(action)
+            if motion is not None:
+                vector, component, sign = motion
+                if vector == 'linear':
+                    self._byte_steps[byte] = (component, sign * self.TERMINAL_STEP)
+                else:
+                    self._byte_steps[byte] = (3 + component, sign * self.TERMINAL_STEP * 0.5)
+        
+        # Terminal mode pose tracked locally from the commanded deltas (None
+        # until read, else the reused _terminal_pose buffer), and when it
+        # was last read from the robot
+        self._terminal_pose = np.zeros(6, dtype=np.float64)
+        self._cached_pose: Optional[np.ndarray] = None
+        self._cached_pose_time = 0.0
+        
+        # Smoothed pose read round-trip time in seconds, when the last
+        # terminal move was sent, the target sent ahead of the tracked pose,
+        # and whether the last target sent included a lead
+        self._rtt_ema = 0.05
+        self._last_move_time = float('-inf')
+        self._lead_target = np.zeros(6, dtype=np.float64)
+        self._lead_sent = False
+        
+        # Rendered instruction screens keyed by (mode, enabled), the fixed
+        # part they are drawn on, and the key currently on screen
+        self._instructions_cache = {}
+        self._instructions_base = None
+        self._displayed_key = None
+    
+    @property
+    def linear_speed(self) -> float:
+        """Linear velocity in m/s."""
+        return float(self._speeds[0])
+    
+    @linear_speed.setter
+    def linear_speed(self, value: float):
+        self._speeds[0] = value
+    
+    @property
+    def angular_speed(self) -> float:
+        """Angular velocity in rad/s."""
+        return float(self._speeds[1])
+    
+    @angular_speed.setter
+    def angular_speed(self, value: float):
+        self._speeds[1] = value
+    
+    @property
+    def joint_speed(self) -> float:
+        """Joint velocity in deg/s."""
+        return float(self._speeds[2])
+    
+    @joint_speed.setter
+    def joint_speed(self, value: float):
+        self._speeds[2] = value
     
     def setup(self) -> bool:
         """Setup input method (pygame or terminal)."""
@@ -192,10 +463,13 @@ class KeyboardTeleop(TeleopBase):
             if self.terminal_mode:
                 # Terminal mode setup
                 self._print_terminal_instructions()
+                self._resync_pose()
+                self._enter_raw_mode()
                 logger.info("Terminal keyboard teleoperation setup complete")
             else:
                 # Pygame mode setup
                 pygame.init()
+                self._font = pygame.font.Font(None, 24)
                 self.screen = pygame.display.set_mode((640, 480))
                 pygame.display.set_caption("RealMan Robot Keyboard Control")
                 self._display_instructions()
@@ -247,123 +521,223 @@ class KeyboardTeleop(TeleopBase):
         if not self.screen:
             return
         
-        font = pygame.font.Font(None, 24)
-        self.screen.fill((0, 0, 0))
-        
-        instructions = [
-            "RealMan Robot Keyboard Control",
-            "",
-            "Movement (Cartesian):",
-            "  W/S: Forward/Backward (X)",
-            "  A/D: Left/Right (Y)",
-            "  Q/E: Up/Down (Z)",
-            "",
-            "Rotation:",
-            "  I/K: Rotate X",
-            "  J/L: Rotate Y",
-            "  U/O: Rotate Z",
-            "",
-            "Control:",
-            "  SHIFT: Enable (hold)",
-            "  SPACE: Emergency Stop",
-            "  TAB: Switch Mode",
-            "  +/-: Speed Up/Down",
-            "  H: Go Home",
-            "",
+        # Only mode and enabled state change the text, so each combination
+        # is rendered once and blitted from then on
+        key = (self.mode, self.enabled)
+        surface = self._instructions_cache.get(key)
+        if surface is None:
+            surface = self._render_instructions()
+            self._instructions_cache[key] = surface
+        
+        self.screen.blit(surface, (0, 0))
+        pygame.display.flip()
+        self._displayed_key = key
+    
+    def _render_instructions(self):
+        """
+        Render the control instructions for the current mode and status.
+        
+        Returns:
+            Screen-sized pygame Surface with the instructions drawn on it
+        """
+        # The fixed lines are rendered once; each mode/status combination
+        # only adds the two status lines below them
+        if self._instructions_base is None:
+            self._instructions_base = pygame.Surface(self.screen.get_size())
+            self._instructions_base.fill((0, 0, 0))
+            y = 20
+            for line in self._STATIC_INSTRUCTIONS:
+                if line:
+                    text = self._font.render(line, True, (255, 255, 255))
+                    self._instructions_base.blit(text, (20, y))
+                y += 25
+        
+        surface = self._instructions_base.copy()
+        status_lines = [
             f"Current Mode: {self.mode.upper()}",
             f"Status: {'ENABLED' if self.enabled else 'DISABLED'}",
         ]
         
-        y = 20
-        for line in instructions:
-            text = font.render(line, True, (255, 255, 255))
-            self.screen.blit(text, (20, y))
+        y = 20 + 25 * len(self._STATIC_INSTRUCTIONS)
+        for line in status_lines:
+            text = self._font.render(line, True, (255, 255, 255))
+            surface.blit(text, (20, y))
             y += 25
         
-        pygame.display.flip()
+        return surface
     
-    def _get_terminal_key(self):
-        """Get a single keypress from terminal (non-blocking)."""
+    def _enter_raw_mode(self):
+        """Put stdin into raw mode once for the whole session and start the key reader."""
         if not TERMINAL_MODE_AVAILABLE:
-            return None
+            return
         
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
+        self._stdin_fd = sys.stdin.fileno()
+        if os.isatty(self._stdin_fd):
+            self._old_termios = termios.tcgetattr(self._stdin_fd)
+            tty.setraw(self._stdin_fd)
+            
+            # Blocking single-byte reads (VMIN=1, VTIME=0), and keep output
+            # post-processing so log lines still end with CR+LF
+            attrs = termios.tcgetattr(self._stdin_fd)
+            attrs[1] |= termios.OPOST
+            attrs[6][termios.VMIN] = 1
+            attrs[6][termios.VTIME] = 0
+            termios.tcsetattr(self._stdin_fd, termios.TCSADRAIN, attrs)
+        
+        self._reading_keys = True
+        self._key_reader = threading.Thread(target=self._read_keys, name="KeyReader", daemon=True)
+        self._key_reader.start()
+    
+    def _restore_terminal(self):
+        """Stop the key reader and restore the stdin attributes saved by _enter_raw_mode."""
+        self._reading_keys = False
+        if self._key_reader is not None:
+            self._key_reader.join(0.5)
+            self._key_reader = None
+        
+        if self._old_termios is not None:
+            termios.tcsetattr(self._stdin_fd, termios.TCSADRAIN, self._old_termios)
+            self._old_termios = None
+    
+    def _read_keys(self):
+        """Push keys from stdin onto the key queue as soon as they arrive."""
+        while self._reading_keys:
+            # The timeout only bounds how long cleanup waits for this thread
+            rlist, _, _ = select.select([self._stdin_fd], [], [], 0.1)
+            if not rlist:
+                continue
+            data = os.read(self._stdin_fd, 64)
+            if not data:
+                break  # stdin closed
+            self._key_queue.put(data)
+    
+    def _get_terminal_keys(self) -> bytes:
+        """Get every input byte received since the last call (non-blocking)."""
+        chunks = []
+        if self._pending_key is not None:
+            chunks.append(self._pending_key)
+            self._pending_key = None
         try:
-            tty.setraw(sys.stdin.fileno())
-            # Use 50ms timeout - same as working simple script for reliable key detection
-            rlist, _, _ = select.select([sys.stdin], [], [], 0.05)
-            if rlist:
-                ch = sys.stdin.read(1)
-                return ch
-            return None
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-    
-    def _terminal_direct_move(self, key: str, direction: str):
-        """Direct movement command for terminal mode (faster, bypasses normal loop)."""
-        # Get current pose and apply small increment
-        current_pose = self.robot.get_current_pose()
-        if not current_pose:
-            print(f"\r⚠️  Cannot read pose    ", end='', flush=True)
+            while True:
+                chunks.append(self._key_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        keys = b''.join(chunks)
+        if b'\x03' in keys:
+            # Raw mode swallows SIGINT, so turn Ctrl+C back into one
+            raise KeyboardInterrupt
+        return keys
+    
+    def wait_for_input(self, timeout: float):
+        """Block until a key event arrives or the timeout expires."""
+        if self.terminal_mode:
+            if self._key_reader is not None:
+                if self._pending_key is None:
+                    try:
+                        self._pending_key = self._key_queue.get(timeout=timeout)
+                    except queue.Empty:
+                        pass
+            else:
+                super().wait_for_input(timeout)
             return
         
-        target_pose = current_pose.copy()
-        increment = 0.01  # 1cm or 0.01 rad per keypress
-        
-        # Apply movement
-        if direction == 'X+':
-            target_pose[0] += increment
-            print(f"\r⬆️  Forward (+X)      ", end='', flush=True)
-        elif direction == 'X-':
-            target_pose[0] -= increment
-            print(f"\r⬇️  Backward (-X)     ", end='', flush=True)
-        elif direction == 'Y+':
-            target_pose[1] += increment
-            print(f"\r⬅️  Left (+Y)         ", end='', flush=True)
-        elif direction == 'Y-':
-            target_pose[1] -= increment
-            print(f"\r➡️  Right (-Y)        ", end='', flush=True)
-        elif direction == 'Z+':
-            target_pose[2] += increment
-            print(f"\r⬆️  Up (+Z)           ", end='', flush=True)
-        elif direction == 'Z-':
-            target_pose[2] -= increment
-            print(f"\r⬇️  Down (-Z)         ", end='', flush=True)
-        elif direction == 'RX+':
-            target_pose[3] += increment * 0.5
-            print(f"\r🔄 Pitch+           ", end='', flush=True)
-        elif direction == 'RX-':
-            target_pose[3] -= increment * 0.5
-            print(f"\r🔄 Pitch-           ", end='', flush=True)
-        elif direction == 'RY+':
-            target_pose[4] += increment * 0.5
-            print(f"\r🔄 Roll+            ", end='', flush=True)
-        elif direction == 'RY-':
-            target_pose[4] -= increment * 0.5
-            print(f"\r🔄 Roll-            ", end='', flush=True)
-        elif direction == 'RZ+':
-            target_pose[5] += increment * 0.5
-            print(f"\r🔄 Yaw+             ", end='', flush=True)
-        elif direction == 'RZ-':
-            target_pose[5] -= increment * 0.5
-            print(f"\r🔄 Yaw-             ", end='', flush=True)
-        
-        # Send command directly (non-blocking)
-        self.robot.movel(target_pose, velocity=30, block=False)
+        event = pygame.event.wait(int(timeout * 1000))
+        if event.type in self._INPUT_EVENTS:
+            # Handed to the next read_input ahead of the queue; posting it
+            # back would put it behind events that arrived after it
+            self._waited_event = event
+    
+    def _resync_pose(self):
+        """Re-read the pose tracked by terminal mode from the robot."""
+        start = time.monotonic()
+        pose = self.robot.get_current_pose()
+        self._rtt_ema += 0.2 * (time.monotonic() - start - self._rtt_ema)
+        if pose:
+            np.copyto(self._terminal_pose, pose)
+            self._cached_pose = self._terminal_pose
+        else:
+            self._cached_pose = None
+        self._cached_pose_time = time.monotonic()
+    
+    def _terminal_direct_move(self, delta: np.ndarray, action: str):
+        """
+        Direct movement command for terminal mode (faster, bypasses normal loop).
+        
+        Args:
+            delta: Pose change for all keys in this batch [x, y, z, rx, ry, rz]
+            action: Last motion action in the batch, shown on the status line
+        """
+        # Move from the locally tracked pose; read the robot only when it is
+        # missing or stale
+        if (self._cached_pose is None
+                or time.monotonic() - self._cached_pose_time >= self.TERMINAL_POSE_REFRESH):
+            self._resync_pose()
+        if self._cached_pose is None:
+            self._set_status("⚠️  Cannot read pose    ")
+            return
+        
+        self._cached_pose += delta
+        self._set_status(self._TERMINAL_MOTION_LABELS[action])
+        
+        # While a key is held, aim one round trip ahead along the key-repeat
+        # velocity so the robot is not always a step behind; the lead is
+        # not added to the tracked pose
+        now = time.monotonic()
+        interval = now - self._last_move_time
+        self._last_move_time = now
+        target = self._lead_target
+        self._lead_sent = interval < self.TERMINAL_REPEAT_GAP
+        if self._lead_sent:
+            np.multiply(delta, min(self._rtt_ema / interval, self.TERMINAL_MAX_LEAD), out=target)
+            target += self._cached_pose
+        else:
+            np.copyto(target, self._cached_pose)
+        self._send_terminal_target(target)
+    
+    def _settle_terminal_lead(self):
+        """
+        Pull the robot back to the tracked pose once a held key is released.
+        
+        A held key's target runs ahead of the tracked pose; without this the
+        robot would stop at that lead instead of where the keys took it.
+        """
+        if (not self._lead_sent
+                or time.monotonic() - self._last_move_time < self.TERMINAL_REPEAT_GAP):
+            return
+        self._lead_sent = False
+        if self._cached_pose is not None and self.toggle_enable:
+            self._send_terminal_target(self._cached_pose)
+    
+    def _send_terminal_target(self, target: np.ndarray):
+        """Send a terminal mode pose target, dropping the tracked pose on failure."""
+        # Send command directly (non-blocking, or queued to the background
+        # sender where a newer target replaces one not yet sent)
+        try:
+            # Keypress steps are too large to stream, so always plan them
+            sent = self._send_motion("cartesian", target.tolist(), velocity=30, stream=False)
+        except Exception as e:
+            logger.error(f"Terminal move failed: {e}")
+            sent = False
+        if not sent:
+            self._cached_pose = None
     
     def read_input(self) -> dict:
-        """Read keyboard input (terminal or pygame mode)."""
-        input_state = {
-            'linear': [0.0, 0.0, 0.0],
-            'angular': [0.0, 0.0, 0.0],
-            'joint_deltas': [0.0] * self.robot.dof,
-            'enable': False,
-            'emergency_stop': False,
-            'mode_switch': False,
-            'speed_change': 0,
-            'go_home': False,
-        }
+        """
+        Read keyboard input (terminal or pygame mode).
+        
+        Returns:
+            Input state dictionary; the same object is reused on every call
+        """
+        # Reset the shared input state in place
+        input_state = self._input_state
+        input_state.update(self._INPUT_FLAGS)
+        self.current_velocity.fill(0.0)
+        if len(input_state['joint_deltas']) == self.robot.dof:
+            input_state['joint_deltas'][:] = self._joint_zeros
+        else:
+            self._joint_zeros = (0.0,) * self.robot.dof
+            input_state['joint_deltas'] = list(self._joint_zeros)
         
         if self.terminal_mode:
             # Terminal mode input
@@ -374,219 +748,215 @@ class KeyboardTeleop(TeleopBase):
     
     def _read_terminal_input(self, input_state: dict) -> dict:
         """Read input in terminal mode."""
-        key = self._get_terminal_key()
+        keys = self._get_terminal_keys()
         
-        if key is None:
+        if not keys:
             input_state['enable'] = self.toggle_enable
+            self._settle_terminal_lead()
             return input_state
         
-        # Debug: show what key was pressed (for troubleshooting)
-        # print(f"\nDEBUG: Key pressed = {repr(key)}", flush=True)
-        
-        # Check for exit
-        if key in ['x', '\x1b']:  # x or ESC
-            input_state['emergency_stop'] = True
-            return input_state
-        
-        # Check for toggle enable (space bar)
-        if key == ' ':
-            self.toggle_enable = not self.toggle_enable
-            if self.toggle_enable:
-                print("\r✅ ENABLED - Robot will move!                    ", end='', flush=True)
-            else:
-                print("\r❌ DISABLED - Press SPACE to enable              ", end='', flush=True)
-            input_state['enable'] = self.toggle_enable
-            return input_state
+        # Fold every motion key in the batch into one pose change
+        delta = self._terminal_delta
+        delta.fill(0.0)
+        last_motion = None
         
-        # Speed adjustment
-        if key in ['+', '=']:
-            self.linear_speed = min(self.linear_speed + 0.01, 0.5)
-            self.angular_speed = self.linear_speed * 3.0
-            status = "ENABLED" if self.toggle_enable else "DISABLED"
-            print(f"\r[{status}] Speed: {self.linear_speed:.3f} m/s    ", end='', flush=True)
-        elif key in ['-', '_']:
-            self.linear_speed = max(self.linear_speed - 0.01, 0.01)
-            self.angular_speed = self.linear_speed * 3.0
-            status = "ENABLED" if self.toggle_enable else "DISABLED"
-            print(f"\r[{status}] Speed: {self.linear_speed:.3f} m/s    ", end='', flush=True)
-        elif key == 'h':
-            input_state['go_home'] = True
-            print("\r🏠 Moving to home position...        ", end='', flush=True)
-        elif key == 'g':
-            print("\r✋ Opening gripper...                 ", end='', flush=True)
-            self.robot.gripper_open(speed=500, block=False)
-        elif key == 'f':
-            print("\r✊ Closing gripper...                 ", end='', flush=True)
-            self.robot.gripper_close(speed=500, force=300, block=False)
-        elif key == 'v':
-            print("\r🤏 Half-opening gripper...            ", end='', flush=True)
-            self.robot.gripper_set_position(500, block=False)
+        for key in keys:
+            action = self._byte_actions[key]
+            
+            # Check for exit (x or ESC)
+            if action == 'exit':
+                input_state['emergency_stop'] = True
+                return input_state
+            
+            # Enable toggle, speed, home and gripper keys
+            handler = self._key_handlers.get(key)
+            if handler is not None:
+                handler(input_state)
+                continue
+            
+            # Movement/rotation (only if enabled)
+            step = self._byte_steps[key]
+            if step is None:
+                continue
+            if not self.toggle_enable:
+                self._warn_disabled()
+                continue
+            
+            index, amount = step
+            delta[index] += amount
+            last_motion = action
         
         # Set enable state
         input_state['enable'] = self.toggle_enable
         
-        # Movement/rotation (only if enabled)
-        if self.toggle_enable:
-            action = self.key_map.get(key)
-            
-            # Direct incremental movement for faster response
-            if action == 'forward':
-                # Send direct movement command for instant response
-                self._terminal_direct_move(key, 'X+')
-            elif action == 'backward':
-                self._terminal_direct_move(key, 'X-')
-            elif action == 'left':
-                self._terminal_direct_move(key, 'Y+')
-            elif action == 'right':
-                self._terminal_direct_move(key, 'Y-')
-            elif action == 'up':
-                self._terminal_direct_move(key, 'Z+')
-            elif action == 'down':
-                self._terminal_direct_move(key, 'Z-')
-            elif action == 'rotate_x_pos':
-                self._terminal_direct_move(key, 'RX+')
-            elif action == 'rotate_x_neg':
-                self._terminal_direct_move(key, 'RX-')
-            elif action == 'rotate_y_pos':
-                self._terminal_direct_move(key, 'RY+')
-            elif action == 'rotate_y_neg':
-                self._terminal_direct_move(key, 'RY-')
-            elif action == 'rotate_z_pos':
-                self._terminal_direct_move(key, 'RZ+')
-            elif action == 'rotate_z_neg':
-                self._terminal_direct_move(key, 'RZ-')
-            else:
-                # For non-movement keys, use normal processing
-                if action == 'forward':
-                    input_state['linear'][0] = self.linear_speed
-                elif action == 'backward':
-                    input_state['linear'][0] = -self.linear_speed
-                elif action == 'left':
-                    input_state['linear'][1] = self.linear_speed
-                elif action == 'right':
-                    input_state['linear'][1] = -self.linear_speed
-                elif action == 'up':
-                    input_state['linear'][2] = self.linear_speed
-                elif action == 'down':
-                    input_state['linear'][2] = -self.linear_speed
-        else:
-            if key in 'wsadqeijkluo':
-                print("\r⚠️  DISABLED - Press SPACE to enable    ", end='', flush=True)
+        # One movel for the whole batch, for faster response than the normal loop
+        if last_motion is not None and self.toggle_enable:
+            self._terminal_direct_move(delta, last_motion)
         
         return input_state
     
+    def _set_status(self, text: str):
+        """Show text on the terminal status line unless it is already shown."""
+        if text != self._status_text:
+            sys.stdout.write("\r" + text)
+            sys.stdout.flush()
+            self._status_text = text
+    
+    def _warn_disabled(self):
+        """Remind that motion keys do nothing while disabled, at most once per second."""
+        now = time.monotonic()
+        if now - self._disabled_warning_time >= 1.0:
+            self._disabled_warning_time = now
+            self._set_status("⚠️  DISABLED - Press SPACE to enable    ")
+    
+    def _terminal_toggle_enable(self, input_state: dict):
+        """Toggle the enable switch (space bar)."""
+        self.toggle_enable = not self.toggle_enable
+        if self.toggle_enable:
+            self._set_status("✅ ENABLED - Robot will move!                    ")
+        else:
+            self._set_status("❌ DISABLED - Press SPACE to enable              ")
+            self._cached_pose = None
+    
+    def _terminal_set_speed(self, linear_speed: float):
+        """Set the terminal mode speed and show it on the status line."""
+        self._speeds[0] = linear_speed
+        self._speeds[1] = linear_speed * 3.0
+        self._resync_pose()
+        status = "ENABLED" if self.toggle_enable else "DISABLED"
+        self._set_status(f"[{status}] Speed: {self.linear_speed:.3f} m/s    ")
+    
+    def _terminal_speed_up(self, input_state: dict):
+        """Raise the terminal mode speed."""
+        self._terminal_set_speed(min(self.linear_speed + 0.01, 0.5))
+    
+    def _terminal_speed_down(self, input_state: dict):
+        """Lower the terminal mode speed."""
+        self._terminal_set_speed(max(self.linear_speed - 0.01, 0.01))
+    
+    def _terminal_go_home(self, input_state: dict):
+        """Request a move to the home position."""
+        input_state['go_home'] = True
+        self._set_status("🏠 Moving to home position...        ")
+    
+    def _terminal_gripper_open(self, input_state: dict):
+        """Open the gripper."""
+        self._set_status("✋ Opening gripper...                 ")
+        self.robot.gripper_open(speed=500, block=False)
+    
+    def _terminal_gripper_close(self, input_state: dict):
+        """Close the gripper."""
+        self._set_status("✊ Closing gripper...                 ")
+        self.robot.gripper_close(speed=500, force=300, block=False)
+    
+    def _terminal_gripper_half(self, input_state: dict):
+        """Half-open the gripper."""
+        self._set_status("🤏 Half-opening gripper...            ")
+        self.robot.gripper_set_position(500, block=False)
+    
     def _read_pygame_input(self, input_state: dict) -> dict:
         """Read input in pygame mode."""
-        # Process pygame events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        # Track held keys from KEYDOWN/KEYUP events; at most one pump per
+        # control period fetches them and the rest of the queue is dropped unread
+        now = time.monotonic()
+        pump = now - self._last_pump >= self._pump_interval
+        if pump:
+            self._last_pump = now
+        
+        events = pygame.event.get(self._INPUT_EVENTS, pump=pump)
+        if self._waited_event is not None:
+            events.insert(0, self._waited_event)
+            self._waited_event = None
+        
+        pressed = self._pressed
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                pressed.add(event.key)
+                self._handle_key_press(event.key, input_state)
+            elif event.type == pygame.KEYUP:
+                pressed.discard(event.key)
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                # Key releases are not delivered while the window is unfocused
+                pressed.clear()
+            else:  # pygame.QUIT
                 input_state['emergency_stop'] = True
+        pygame.event.clear(pump=False)
+        
+        # Redraw (and flip) only when the mode or enabled state changed
+        if self._displayed_key != (self.mode, self.enabled):
+            self._display_instructions()
         
-        # Get current key states
-        keys = pygame.key.get_pressed()
-        
-        # Check each mapped key
-        for key_code, action in self.key_map.items():
-            if keys[key_code]:
-                if action == 'enable':
-                    input_state['enable'] = True
-                elif action == 'emergency_stop':
-                    input_state['emergency_stop'] = True
-                elif action == 'mode_switch':
-                    if not hasattr(self, '_mode_switch_pressed'):
-                        self._mode_switch_pressed = True
-                        input_state['mode_switch'] = True
-                elif action == 'go_home':
-                    input_state['go_home'] = True
-                elif action == 'gripper_open':
-                    if not hasattr(self, '_gripper_open_pressed'):
-                        self._gripper_open_pressed = True
-                        self.robot.gripper_open(speed=500, block=False)
-                        self.logger.info("Opening gripper")
-                elif action == 'gripper_close':
-                    if not hasattr(self, '_gripper_close_pressed'):
-                        self._gripper_close_pressed = True
-                        self.robot.gripper_close(speed=500, force=300, block=False)
-                        self.logger.info("Closing gripper")
-                elif action == 'gripper_half':
-                    if not hasattr(self, '_gripper_half_pressed'):
-                        self._gripper_half_pressed = True
-                        self.robot.gripper_set_position(500, block=False)
-                        self.logger.info("Half-opening gripper")
-                elif action == 'speed_up':
-                    input_state['speed_change'] = 1
-                elif action == 'speed_down':
-                    input_state['speed_change'] = -1
-                    
-                # Linear motion
-                elif action == 'forward':
-                    input_state['linear'][0] = self.linear_speed
-                elif action == 'backward':
-                    input_state['linear'][0] = -self.linear_speed
-                elif action == 'left':
-                    input_state['linear'][1] = self.linear_speed
-                elif action == 'right':
-                    input_state['linear'][1] = -self.linear_speed
-                elif action == 'up':
-                    input_state['linear'][2] = self.linear_speed
-                elif action == 'down':
-                    input_state['linear'][2] = -self.linear_speed
-                    
-                # Angular motion
-                elif action == 'rotate_x_pos':
-                    input_state['angular'][0] = self.angular_speed
-                elif action == 'rotate_x_neg':
-                    input_state['angular'][0] = -self.angular_speed
-                elif action == 'rotate_y_pos':
-                    input_state['angular'][1] = self.angular_speed
-                elif action == 'rotate_y_neg':
-                    input_state['angular'][1] = -self.angular_speed
-                elif action == 'rotate_z_pos':
-                    input_state['angular'][2] = self.angular_speed
-                elif action == 'rotate_z_neg':
-                    input_state['angular'][2] = -self.angular_speed
-                    
-                # Joint motion
-                elif action.startswith('joint_'):
-                    joint_num = int(action.split('_')[1]) - 1
-                    if joint_num < self.robot.dof:
-                        input_state['joint_deltas'][joint_num] = -self.joint_speed
-        
-        # Reset mode switch flag when key released
-        if not keys[pygame.K_TAB]:
-            self._mode_switch_pressed = False
-        
-        # Reset gripper button flags when keys released
-        if not keys[pygame.K_g]:
-            self._gripper_open_pressed = False
-        if not keys[pygame.K_f]:
-            self._gripper_close_pressed = False
-        if not keys[pygame.K_v]:
-            self._gripper_half_pressed = False
+        # Check each held key; motion and joint keys need a single table lookup
+        for key_code in pressed:
+            motion = self._motion_keys.get(key_code)
+            if motion is not None:
+                vector, component, sign = motion
+                speed = self.linear_speed if vector == 'linear' else self.angular_speed
+                input_state[vector][component] = sign * speed
+                continue
+            
+            joint = self._joint_keys.get(key_code)
+            if joint is not None:
+                if joint < self.robot.dof:
+                    input_state['joint_deltas'][joint] = -self.joint_speed
+                continue
+            
+            flag = self._flag_keys.get(key_code)
+            if flag is not None:
+                input_state[flag] = True
         
         return input_state
     
+    def _handle_key_press(self, key_code: int, input_state: dict):
+        """Run the one-shot action bound to a key, once per press."""
+        handler = self._key_handlers.get(key_code)
+        if handler is not None:
+            handler(input_state)
+    
+    def _press_mode_switch(self, input_state: dict):
+        """Request a switch between Cartesian and joint mode."""
+        input_state['mode_switch'] = True
+    
+    def _press_speed_up(self, input_state: dict):
+        """Request a speed increase."""
+        input_state['speed_change'] = 1
+    
+    def _press_speed_down(self, input_state: dict):
+        """Request a speed decrease."""
+        input_state['speed_change'] = -1
+    
+    def _press_gripper_open(self, input_state: dict):
+        """Open the gripper."""
+        self.robot.gripper_open(speed=500, block=False)
+        logger.info("Opening gripper")
+    
+    def _press_gripper_close(self, input_state: dict):
+        """Close the gripper."""
+        self.robot.gripper_close(speed=500, force=300, block=False)
+        logger.info("Closing gripper")
+    
+    def _press_gripper_half(self, input_state: dict):
+        """Half-open the gripper."""
+        self.robot.gripper_set_position(500, block=False)
+        logger.info("Half-opening gripper")
+    
     def process_input(self, input_state: dict) -> dict:
         """Process keyboard input into robot commands."""
-        commands = {
-            'type': self.mode,
-            'velocity': [0.0] * 6,
-            'stop': False,
-            'home': False,
-        }
+        # Reset the shared command dict in place
+        commands = self._commands
+        commands['type'] = self.mode
+        commands['velocity'] = self._ZERO_VELOCITY
+        commands['stop'] = False
+        commands['home'] = False
         
         # Handle mode switch
         if input_state['mode_switch']:
             self.mode = "joint" if self.mode == "cartesian" else "cartesian"
             logger.info(f"Switched to {self.mode.upper()} mode")
-            self._display_instructions()
         
         # Handle speed change
         if input_state['speed_change'] != 0:
-            factor = 1.1 if input_state['speed_change'] > 0 else 0.9
-            self.linear_speed *= factor
-            self.angular_speed *= factor
-            self.joint_speed *= factor
+            self._speeds *= 1.1 if input_state['speed_change'] > 0 else 0.9
             logger.info(f"Speed adjusted: linear={self.linear_speed:.3f}, "
                        f"angular={self.angular_speed:.3f}, joint={self.joint_speed:.3f}")
         
@@ -597,9 +967,7 @@ class KeyboardTeleop(TeleopBase):
         
         # Build velocity command based on mode
         if self.mode == "cartesian":
-            commands['velocity'] = (
-                input_state['linear'] + input_state['angular']
-            )
+            commands['velocity'] = self.current_velocity
         else:  # joint mode
             commands['velocity'] = input_state['joint_deltas']
         
@@ -609,41 +977,68 @@ class KeyboardTeleop(TeleopBase):
         """Send commands to robot."""
         try:
             if commands['home']:
-                self.robot.move_to_home()
+                self._forget_state()
+                self._cached_pose = None
+                self._cancel_motion()
+                # Blocks until the arm is home
+                with self._watchdog_suspended():
+                    self.robot.move_to_home()
                 return True
             
             if commands['stop']:
+                self._forget_state()
+                self._cached_pose = None
+                self._cancel_motion()
                 self.robot.stop()
                 return True
             
-            # Check if there's any movement
-            if any(v != 0 for v in commands['velocity']):
-                # For simplicity, we'll use small incremental movements
-                # In a real implementation, you'd use velocity control or
-                # continuous position updates
-                
-                if commands['type'] == "cartesian":
-                    # Get current pose and apply velocity increment
-                    current_pose = self.robot.get_current_pose()
-                    if current_pose:
-                        # Apply velocity for one time step
-                        dt = self.update_period
-                        target_pose = [
-                            current_pose[i] + commands['velocity'][i] * dt
-                            for i in range(6)
-                        ]
-                        self.robot.movel(target_pose, velocity=50, block=False)
-                
-                else:  # joint mode
-                    # Get current angles and apply delta
-                    current_joints = self.robot.get_current_joint_angles()
-                    if current_joints:
-                        dt = self.update_period
-                        target_joints = [
-                            current_joints[i] + commands['velocity'][i] * dt
-                            for i in range(len(current_joints))
-                        ]
-                        self.robot.movej(target_joints, velocity=50, block=False)
+            # Nothing to send when the velocity is negligible; skips the state
+            # read too. The next motion starts from a fresh robot read.
+            velocity = np.asarray(commands['velocity'], dtype=np.float64)
+            if velocity.dot(velocity) <= self.MIN_VELOCITY * self.MIN_VELOCITY:
+                self._forget_state()
+                return True
+            
+            # For simplicity, we'll use small incremental movements
+            # In a real implementation, you'd use velocity control or
+            # continuous position updates
+            
+            # The remembered state is the target buffer itself, so ticks
+            # between robot reads integrate in place without allocating
+            if commands['type'] == "cartesian":
+                # Get current pose and apply velocity increment
+                current_pose = self._current_state("cartesian")
+                if current_pose is not None:
+                    # Apply velocity for one time step
+                    target_pose = self._pose_target
+                    integrate(
+                        np.asarray(current_pose, dtype=np.float64),
+                        velocity,
+                        self.update_period,
+                        target_pose
+                    )
+                    if self._send_motion("cartesian", target_pose.tolist()):
+                        self._remember_state(target_pose)
+                    else:
+                        self._forget_state()
+            
+            else:  # joint mode
+                # Get current angles and apply delta
+                current_joints = self._current_state("joint")
+                if current_joints is not None:
+                    target_joints = self._joint_target
+                    if target_joints.size != len(current_joints):
+                        target_joints = self._joint_target = np.empty(len(current_joints))
+                    integrate(
+                        np.asarray(current_joints, dtype=np.float64),
+                        velocity,
+                        self.update_period,
+                        target_joints
+                    )
+                    if self._send_motion("joint", target_joints.tolist()):
+                        self._remember_state(target_joints)
+                    else:
+                        self._forget_state()
             
             return True
             
@@ -654,6 +1049,7 @@ class KeyboardTeleop(TeleopBase):
     def cleanup(self):
         """Cleanup resources (pygame or terminal)."""
         if self.terminal_mode:
+            self._restore_terminal()
             print("\n\n")  # Clean up terminal output
             logger.info("Terminal mode cleaned up")
         elif self.screen:
@@ -5,11 +5,32 @@ Main interface for controlling RealMan robotic arms.
 """
 
 import logging
-from typing import Optional, Dict, List, Tuple
+import os
+import socket
+import threading
+import time
+from dataclasses import dataclass, replace
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Optional, Dict, List, Sequence, Tuple
 from Robotic_Arm.rm_robot_interface import *
 
 logger = logging.getLogger(__name__)
 
+# Extract the position and orientation values of an SDK pose dict
+_get_xyz = itemgetter('x', 'y', 'z')
+_get_euler = itemgetter('rx', 'ry', 'rz')
+
+
+@dataclass(frozen=True)
+class _RobotModelSpec:
+    """Fixed parameters of a supported robot model."""
+    
+    dof: int
+    model_enum: Any
+    force_type: Any
+    default_joints: Tuple[float, ...]
+
 
 class RobotController:
     """
@@ -20,44 +41,44 @@ class RobotController:
     """
     
     # Robot model configurations
-    ROBOT_MODELS = {
-        "RM65": {
-            "dof": 6,
-            "model_enum": rm_robot_arm_model_e.RM_MODEL_RM_65_E,
-            "force_type": rm_force_type_e.RM_MODEL_RM_B_E,
-            "default_joints": [0, 20, 70, 0, 90, 0],
-        },
-        "RM75": {
-            "dof": 7,
-            "model_enum": rm_robot_arm_model_e.RM_MODEL_RM_75_E,
-            "force_type": rm_force_type_e.RM_MODEL_RM_B_E,
-            "default_joints": [0, 20, 0, 70, 0, 90, 0],
-        },
-        "RML63": {
-            "dof": 6,
-            "model_enum": rm_robot_arm_model_e.RM_MODEL_RM_63_II_E,
-            "force_type": rm_force_type_e.RM_MODEL_RM_B_E,
-            "default_joints": [0, 20, 70, 0, 90, 0],
-        },
-        "ECO65": {
-            "dof": 6,
-            "model_enum": rm_robot_arm_model_e.RM_MODEL_ECO_65_E,
-            "force_type": rm_force_type_e.RM_MODEL_RM_B_E,
-            "default_joints": [0, 20, 70, 0, -90, 0],
-        },
-        "GEN72": {
-            "dof": 7,
-            "model_enum": rm_robot_arm_model_e.RM_MODEL_GEN_72_E,
-            "force_type": rm_force_type_e.RM_MODEL_RM_B_E,
-            "default_joints": [0, 20, 0, 70, 0, 90, 0],
-        },
-        "R1D2": {
-            "dof": 6,
-            "model_enum": rm_robot_arm_model_e.RM_MODEL_RM_65_E,  # Using RM65 as base
-            "force_type": rm_force_type_e.RM_MODEL_RM_B_E,
-            "default_joints": [0, 20, 70, 0, 90, 0],
-        },
-    }
+    ROBOT_MODELS = MappingProxyType({
+        "RM65": _RobotModelSpec(
+            dof=6,
+            model_enum=rm_robot_arm_model_e.RM_MODEL_RM_65_E,
+            force_type=rm_force_type_e.RM_MODEL_RM_B_E,
+            default_joints=(0, 20, 70, 0, 90, 0),
+        ),
+        "RM75": _RobotModelSpec(
+            dof=7,
+            model_enum=rm_robot_arm_model_e.RM_MODEL_RM_75_E,
+            force_type=rm_force_type_e.RM_MODEL_RM_B_E,
+            default_joints=(0, 20, 0, 70, 0, 90, 0),
+        ),
+        "RML63": _RobotModelSpec(
+            dof=6,
+            model_enum=rm_robot_arm_model_e.RM_MODEL_RM_63_II_E,
+            force_type=rm_force_type_e.RM_MODEL_RM_B_E,
+            default_joints=(0, 20, 70, 0, 90, 0),
+        ),
+        "ECO65": _RobotModelSpec(
+            dof=6,
+            model_enum=rm_robot_arm_model_e.RM_MODEL_ECO_65_E,
+            force_type=rm_force_type_e.RM_MODEL_RM_B_E,
+            default_joints=(0, 20, 70, 0, -90, 0),
+        ),
+        "GEN72": _RobotModelSpec(
+            dof=7,
+            model_enum=rm_robot_arm_model_e.RM_MODEL_GEN_72_E,
+            force_type=rm_force_type_e.RM_MODEL_RM_B_E,
+            default_joints=(0, 20, 0, 70, 0, 90, 0),
+        ),
+        "R1D2": _RobotModelSpec(
+            dof=6,
+            model_enum=rm_robot_arm_model_e.RM_MODEL_RM_65_E,  # Using RM65 as base
+            force_type=rm_force_type_e.RM_MODEL_RM_B_E,
+            default_joints=(0, 20, 70, 0, 90, 0),
+        ),
+    })
     
     def __init__(
         self,
@@ -90,22 +111,51 @@ class RobotController:
         # Use provided DOF or fall back to model default
         if dof is not None:
             self.dof = dof
-            self.model_config["dof"] = dof
+            self.model_config = replace(self.model_config, dof=dof)
             logger.info(f"Using configured DOF: {dof}")
         else:
-            self.dof = self.model_config["dof"]
+            self.dof = self.model_config.dof
         
         # Initialize robot API
         self.robot = RoboticArm(thread_mode)
         self.handle = None
         self.connected = False
         
+        # SDK motion calls used at the control rate, bound once
+        self._rm_movej = self.robot.rm_movej
+        self._rm_movel = self.robot.rm_movel
+        self._rm_movej_canfd = self.robot.rm_movej_canfd
+        self._rm_movep_canfd = self.robot.rm_movep_canfd
+        
+        # Set while no planned move is running; cleared when one is sent and
+        # set again by the controller's arrival event (see _on_arm_event).
+        # Arrival events need the SDK's receive thread, absent in single mode.
+        self._idle = threading.Event()
+        self._idle.set()
+        self._motion_events = thread_mode != rm_thread_mode_e.RM_SINGLE_MODE_E
+        self._event_callback = None
+        
+        # Whether _log_robot_info has reported the software info yet
+        self._info_logged = False
+        
+        # Background state polling (see start_state_stream): latest
+        # (timestamp, SDK state dict) snapshot, replaced as a whole so
+        # readers never see a partial update
+        self._stream_snapshot = None
+        self._stream_period = 0.0
+        self._stream_running = False
+        self._stream_thread = None
+        
         logger.info(f"Initialized controller for {self.model_name} robot")
     
-    def connect(self) -> bool:
+    def connect(self, refresh_info: bool = False) -> bool:
         """
         Connect to the robot.
         
+        Args:
+            refresh_info: Query and log the robot software information
+                even if an earlier connect already did
+                
         Returns:
             True if connection successful, False otherwise
         """
@@ -119,11 +169,25 @@ class RobotController:
             self.connected = True
             logger.info(f"Connected to robot at {self.ip}:{self.port} (ID: {self.handle.id})")
             
+            # Small motion commands should not wait on Nagle coalescing;
+            # only a latency tweak, so a failure must not fail the connection
+            try:
+                self._set_tcp_nodelay()
+            except Exception as e:
+                logger.warning(f"Could not tune the control socket: {e}")
+            
+            # Track planned moves through arrival events instead of polling
+            if self._motion_events:
+                # Keep a reference: the SDK only holds a raw pointer to it
+                self._event_callback = rm_event_callback_ptr(self._on_arm_event)
+                self.robot.rm_get_arm_event_call_back(self._event_callback)
+            
             # Auto-detect actual DOF from robot
             self._detect_dof()
             
-            # Get and log robot info
-            self._log_robot_info()
+            # Get and log robot info (once; it does not change on reconnect)
+            if refresh_info or not self._info_logged:
+                self._log_robot_info()
             
             return True
             
@@ -142,6 +206,8 @@ class RobotController:
         if not self.connected:
             return True
         
+        self.stop_state_stream()
+        
         try:
             result = self.robot.rm_delete_robot_arm()
             self.connected = False
@@ -152,6 +218,59 @@ class RobotController:
             logger.error(f"Disconnection failed: {e}")
             return False
     
+    def _set_tcp_nodelay(self) -> bool:
+        """
+        Disable Nagle's algorithm (and delayed ACKs where supported) on the
+        SDK's control socket.
+        
+        The RealMan SDK opens and owns the TCP connection, so it is found
+        by its peer address among this process's open file descriptors
+        (Linux only). The option is set through a duplicate descriptor,
+        which shares the underlying socket.
+        
+        Returns:
+            True if TCP_NODELAY was set on the control socket
+        """
+        fd_dir = '/proc/self/fd'
+        if not os.path.isdir(fd_dir):
+            logger.debug("Cannot enumerate sockets, TCP_NODELAY not set")
+            return False
+        
+        for name in os.listdir(fd_dir):
+            try:
+                fd = os.dup(int(name))
+            except OSError:
+                continue  # Already closed (e.g. the listdir handle itself)
+            try:
+                sock = socket.socket(fileno=fd)
+            except OSError:
+                os.close(fd)  # Not a socket
+                continue
+            
+            try:
+                # Unix sockets (e.g. socketpair) have no (host, port) peer
+                if (sock.type != socket.SOCK_STREAM
+                        or sock.family not in (socket.AF_INET, socket.AF_INET6)):
+                    continue
+                peer = sock.getpeername()
+                if peer[:2] == (self.ip, self.port):
+                    options = ["TCP_NODELAY"]
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    if hasattr(socket, 'TCP_QUICKACK'):
+                        # Linux only, and not sticky: the kernel may return to
+                        # delayed ACKs later, so this only covers the early replies
+                        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+                        options.append("TCP_QUICKACK")
+                    logger.debug(f"{', '.join(options)} enabled on control socket (fd {name})")
+                    return True
+            except OSError:
+                continue
+            finally:
+                sock.close()
+        
+        logger.debug("Control socket not found, TCP_NODELAY not set")
+        return False
+    
     def _detect_dof(self):
         """Detect actual DOF from robot by reading joint state."""
         try:
@@ -164,7 +283,7 @@ class RobotController:
                         logger.warning(f"DOF mismatch! Config says {self.dof}, robot has {actual_dof}")
                         logger.info(f"Auto-updating DOF to {actual_dof}")
                         self.dof = actual_dof
-                        self.model_config["dof"] = actual_dof
+                        self.model_config = replace(self.model_config, dof=actual_dof)
                     else:
                         logger.info(f"Detected DOF: {self.dof}")
         except Exception as e:
@@ -175,15 +294,20 @@ class RobotController:
         try:
             result, info = self.robot.rm_get_arm_software_info()
             if result == 0:
-                logger.info("=" * 60)
-                logger.info("Robot Software Information")
-                logger.info("=" * 60)
-                logger.info(f"Model: {info.get('product_version', 'Unknown')}")
-                logger.info(f"Algorithm Version: {info.get('algorithm_info', {}).get('version', 'Unknown')}")
-                logger.info(f"Control Layer: {info.get('ctrl_info', {}).get('version', 'Unknown')}")
-                logger.info(f"Dynamics Version: {info.get('dynamic_info', {}).get('model_version', 'Unknown')}")
-                logger.info(f"Planning Layer: {info.get('plan_info', {}).get('version', 'Unknown')}")
-                logger.info("=" * 60)
+                rule = "=" * 60
+                # One record, so concurrent log output cannot interleave with it
+                logger.info(
+                    f"{rule}\n"
+                    f"Robot Software Information\n"
+                    f"{rule}\n"
+                    f"Model: {info.get('product_version', 'Unknown')}\n"
+                    f"Algorithm Version: {info.get('algorithm_info', {}).get('version', 'Unknown')}\n"
+                    f"Control Layer: {info.get('ctrl_info', {}).get('version', 'Unknown')}\n"
+                    f"Dynamics Version: {info.get('dynamic_info', {}).get('model_version', 'Unknown')}\n"
+                    f"Planning Layer: {info.get('plan_info', {}).get('version', 'Unknown')}\n"
+                    f"{rule}"
+                )
+                self._info_logged = True
         except Exception as e:
             logger.warning(f"Could not retrieve robot info: {e}")
     
@@ -214,7 +338,50 @@ class RobotController:
             logger.error(f"Expected {self.dof} joint angles, got {len(joint_angles)}")
             return -1
         
-        return self.robot.rm_movej(joint_angles, velocity, 0, 0, int(block))
+        self._idle.clear()
+        return self._motion_sent(self._rm_movej(joint_angles, velocity, 0, 0, int(block)), block)
+    
+    def movej_sequence(
+        self,
+        waypoints: List[List[float]],
+        velocity: int = 20,
+        block: bool = True
+    ) -> int:
+        """
+        Move through several joint waypoints as one connected trajectory.
+        
+        All but the last waypoint are queued with the trajectory-connect
+        flag set, so the controller plans the whole sequence together and
+        runs it without stopping between segments.
+        
+        Args:
+            waypoints: List of target joint angle lists in degrees
+            velocity: Movement velocity (1-100)
+            block: Whether to block until the last waypoint is reached
+            
+        Returns:
+            Status code (0 = success)
+        """
+        if not self.connected:
+            logger.error("Not connected to robot")
+            return -1
+        
+        if not waypoints:
+            logger.error("No waypoints given")
+            return -1
+        
+        for joint_angles in waypoints:
+            if len(joint_angles) != self.dof:
+                logger.error(f"Expected {self.dof} joint angles, got {len(joint_angles)}")
+                return -1
+        
+        self._idle.clear()
+        for joint_angles in waypoints[:-1]:
+            result = self._rm_movej(joint_angles, velocity, 0, 1, 0)
+            if result != 0:
+                return self._motion_sent(result, block)
+        
+        return self._motion_sent(self._rm_movej(waypoints[-1], velocity, 0, 0, int(block)), block)
     
     def movej_p(
         self,
@@ -237,11 +404,12 @@ class RobotController:
             logger.error("Not connected to robot")
             return -1
         
-        return self.robot.rm_movej_p(pose, velocity, 0, 0, int(block))
+        self._idle.clear()
+        return self._motion_sent(self.robot.rm_movej_p(pose, velocity, 0, 0, int(block)), block)
     
     def movel(
         self,
-        pose: List[float],
+        pose: Sequence[float],
         velocity: int = 20,
         block: bool = True
     ) -> int:
@@ -249,7 +417,9 @@ class RobotController:
         Move to Cartesian pose using linear interpolation.
         
         Args:
-            pose: Target pose [x, y, z, rx, ry, rz] in meters and radians
+            pose: Target pose [x, y, z, rx, ry, rz] in meters and radians.
+                A numpy array is accepted as-is; the SDK copies the values
+                into its C pose struct before returning.
             velocity: Movement velocity (1-100)
             block: Whether to block until motion complete
             
@@ -260,7 +430,73 @@ class RobotController:
             logger.error("Not connected to robot")
             return -1
         
-        return self.robot.rm_movel(pose, velocity, 0, 0, int(block))
+        self._idle.clear()
+        return self._motion_sent(self._rm_movel(pose, velocity, 0, 0, int(block)), block)
+    
+    def movej_stream(self, joint_angles: Sequence[float], follow: bool = False) -> int:
+        """
+        Stream joint angles to the controller without trajectory planning.
+        
+        Sends a CANFD pass-through target and returns immediately. Targets
+        must be close together and sent at a steady rate (as a teleop loop
+        does), since the arm moves straight to each one.
+        
+        Args:
+            joint_angles: Target joint angles in degrees
+            follow: True for high-follow mode (tracks targets as fast as
+                possible), False for low-follow mode (smoother)
+                
+        Returns:
+            Status code (0 = success)
+        """
+        if not self.connected:
+            logger.error("Not connected to robot")
+            return -1
+        
+        if len(joint_angles) != self.dof:
+            logger.error(f"Expected {self.dof} joint angles, got {len(joint_angles)}")
+            return -1
+        
+        return self._rm_movej_canfd(joint_angles, follow)
+    
+    def movej_fast(self, joint_angles: Sequence[float], follow: bool = False) -> int:
+        """
+        movej_stream without the joint count check, for per-tick streaming.
+        
+        The caller guarantees joint_angles holds exactly dof values, e.g.
+        by filling a buffer sized from self.dof; any sequence of floats
+        (list, array.array, NumPy array) is accepted.
+        
+        Args:
+            joint_angles: Target joint angles in degrees
+            follow: True for high-follow mode, False for low-follow mode
+            
+        Returns:
+            Status code (0 = success)
+        """
+        if not self.connected:
+            return -1
+        return self._rm_movej_canfd(joint_angles, follow)
+    
+    def movep_stream(self, pose: Sequence[float], follow: bool = False) -> int:
+        """
+        Stream a Cartesian pose to the controller without trajectory planning.
+        
+        Cartesian counterpart of movej_stream; the same rate and step size
+        requirements apply.
+        
+        Args:
+            pose: Target pose [x, y, z, rx, ry, rz] in meters and radians
+            follow: True for high-follow mode, False for low-follow mode
+            
+        Returns:
+            Status code (0 = success)
+        """
+        if not self.connected:
+            logger.error("Not connected to robot")
+            return -1
+        
+        return self._rm_movep_canfd(pose, follow)
     
     def stop(self) -> int:
         """
@@ -273,10 +509,95 @@ class RobotController:
             return -1
         
         logger.warning("Emergency stop triggered!")
-        return self.robot.rm_set_arm_stop()
+        result = self.robot.rm_set_arm_stop()
+        if result == 0:
+            self._idle.set()
+        return result
+    
+    def _motion_sent(self, result: int, block: bool) -> int:
+        """
+        Update the idle flag after sending a planned move.
+        
+        Args:
+            result: Status code returned by the SDK move call
+            block: Whether the call waited for the move to finish
+            
+        Returns:
+            result, unchanged
+        """
+        if result != 0 or block or not self._motion_events:
+            self._idle.set()
+        return result
+    
+    def _on_arm_event(self, data):
+        """SDK callback: mark the arm idle when its last planned arm move arrives."""
+        if (data.handle_id == (self.handle.id if self.handle else None)
+                and data.event_type == 1      # planned trajectory arrived
+                and data.device == 0          # arm joints, not gripper/hand/lift
+                and data.trajectory_connect == 0):
+            self._idle.set()
     
     # ========== State Query Methods ==========
     
+    def start_state_stream(self, period: float = 0.01):
+        """
+        Poll the arm state on a background thread.
+        
+        While running, the state getters return the latest polled state
+        instead of each sending their own request, so several consumers
+        (teleop, safety, monitoring) share one request per period.
+        
+        Args:
+            period: Time between state requests in seconds
+        """
+        if self._stream_thread is not None:
+            return
+        self._stream_period = period
+        self._stream_running = True
+        self._stream_thread = threading.Thread(
+            target=self._stream_state, name="ArmStateStream", daemon=True
+        )
+        self._stream_thread.start()
+    
+    def stop_state_stream(self):
+        """Stop background state polling; the getters query the robot again."""
+        self._stream_running = False
+        if self._stream_thread is not None:
+            self._stream_thread.join(1.0)
+            self._stream_thread = None
+        self._stream_snapshot = None
+    
+    def _stream_state(self):
+        """Poll rm_get_current_arm_state until stop_state_stream is called."""
+        next_poll = time.monotonic()
+        while self._stream_running:
+            if self.connected:
+                try:
+                    result, state = self.robot.rm_get_current_arm_state()
+                    if result == 0:
+                        self._stream_snapshot = (time.monotonic(), state)
+                except Exception as e:
+                    logger.error(f"State stream request failed: {e}")
+            
+            next_poll += self._stream_period
+            delay = next_poll - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_poll = time.monotonic()
+    
+    def _read_arm_state(self) -> Tuple[int, Dict]:
+        """
+        Get the SDK arm state, from the state stream when it is fresh.
+        
+        Returns:
+            (status code, SDK state dict) as from rm_get_current_arm_state
+        """
+        snapshot = self._stream_snapshot
+        if snapshot is not None and time.monotonic() - snapshot[0] < 5 * self._stream_period:
+            return 0, snapshot[1]
+        return self.robot.rm_get_current_arm_state()
+    
     def get_current_joint_angles(self) -> Optional[List[float]]:
         """
         Get current joint angles.
@@ -287,7 +608,7 @@ class RobotController:
         if not self.connected:
             return None
         
-        result, state = self.robot.rm_get_current_arm_state()
+        result, state = self._read_arm_state()
         if result == 0:
             return state.get('joint', [])
         return None
@@ -302,21 +623,31 @@ class RobotController:
         if not self.connected:
             return None
         
-        result, state = self.robot.rm_get_current_arm_state()
+        result, state = self._read_arm_state()
         if result == 0:
-            pose_data = state.get('pose', [])
-            
-            # Handle both list format and nested dict format
-            if isinstance(pose_data, list) and len(pose_data) == 6:
-                return pose_data
-            elif isinstance(pose_data, dict):
+            return self._parse_pose(state.get('pose', []))
+        return None
+    
+    @staticmethod
+    def _parse_pose(pose_data) -> Optional[List[float]]:
+        """Convert an SDK pose (list or nested dict) to [x, y, z, rx, ry, rz]."""
+        # Handle both list format and nested dict format
+        if isinstance(pose_data, list) and len(pose_data) == 6:
+            return pose_data
+        elif isinstance(pose_data, dict):
+            try:
+                return [*_get_xyz(pose_data['position']), *_get_euler(pose_data['euler'])]
+            except KeyError:
+                # Incomplete pose: fill missing values with 0
+                position = pose_data.get('position', {})
+                euler = pose_data.get('euler', {})
                 return [
-                    pose_data.get('position', {}).get('x', 0),
-                    pose_data.get('position', {}).get('y', 0),
-                    pose_data.get('position', {}).get('z', 0),
-                    pose_data.get('euler', {}).get('rx', 0),
-                    pose_data.get('euler', {}).get('ry', 0),
-                    pose_data.get('euler', {}).get('rz', 0),
+                    position.get('x', 0),
+                    position.get('y', 0),
+                    position.get('z', 0),
+                    euler.get('rx', 0),
+                    euler.get('ry', 0),
+                    euler.get('rz', 0),
                 ]
         return None
     
@@ -330,14 +661,16 @@ class RobotController:
         if not self.connected:
             return None
         
-        result, state = self.robot.rm_get_current_arm_state()
+        result, state = self._read_arm_state()
         if result == 0:
             return state.get('joint_speed', [])
         return None
     
     def is_moving(self) -> bool:
         """
-        Check if robot is currently moving.
+        Check if a planned move (movej, movel, ...) is still running.
+        
+        Streamed targets (movej_stream/movep_stream) are not tracked.
         
         Returns:
             True if moving, False otherwise
@@ -345,10 +678,40 @@ class RobotController:
         if not self.connected:
             return False
         
-        result, state = self.robot.rm_get_current_arm_state()
-        if result == 0:
-            return state.get('arm_err', 0) == 0 and state.get('sys_err', 0) == 0
-        return False
+        if self._motion_events:
+            return not self._idle.is_set()
+        
+        # No arrival events: ask the controller whether it is executing a plan
+        trajectory = self.robot.rm_get_arm_current_trajectory()
+        return trajectory.get('return_code') == 0 and trajectory.get('trajectory_type', 0) != 0
+    
+    def get_arm_state(self) -> Optional[Dict]:
+        """
+        Get joint angles, pose, joint velocities and motion status at once.
+        
+        Joint angles, pose and velocities come from a single state request
+        (or the state stream), so this is cheaper than calling the
+        individual getters back to back. 'is_moving' comes from is_moving():
+        free with the default threaded SDK mode, one more request in
+        single-thread mode.
+        
+        Returns:
+            Dictionary with 'joint_angles', 'pose', 'joint_velocities' and
+            'is_moving' keys, or None if error
+        """
+        if not self.connected:
+            return None
+        
+        result, state = self._read_arm_state()
+        if result != 0:
+            return None
+        
+        return {
+            'joint_angles': state.get('joint', []),
+            'pose': self._parse_pose(state.get('pose', [])),
+            'joint_velocities': state.get('joint_speed', []),
+            'is_moving': self.is_moving(),
+        }
     
     # ========== Safety Methods ==========
     
@@ -458,6 +821,120 @@ class RobotController:
             return state
         return None
     
+    def gripper_wait_idle(
+        self,
+        timeout: float = 3.0,
+        poll_interval: float = 0.02,
+        settle_time: float = 0.1
+    ) -> bool:
+        """
+        Wait until the gripper stops moving.
+        
+        Polls the gripper state instead of sleeping for a fixed time, so
+        it pairs with the non-blocking (block=False) gripper commands.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            poll_interval: Time between state reads in seconds
+            settle_time: How long the position must stay unchanged in seconds
+            
+        Returns:
+            True if the gripper settled, False on timeout or error
+        """
+        deadline = time.monotonic() + timeout
+        last_pos = None
+        stable_since = None
+        
+        while time.monotonic() < deadline:
+            state = self.gripper_get_state()
+            pos = state.get('actpos') if state else None
+            now = time.monotonic()
+            
+            if pos is None or pos != last_pos:
+                last_pos = pos
+                stable_since = now
+            elif now - stable_since >= settle_time:
+                return True
+            
+            time.sleep(poll_interval)
+        
+        return False
+    
+    def gripper_wait_position(
+        self,
+        target: int,
+        tolerance: int = 30,
+        timeout: float = 3.0,
+        poll_interval: float = 0.02,
+        settle_time: float = 0.1
+    ) -> Optional[int]:
+        """
+        Wait until the gripper reaches a commanded position.
+        
+        Unlike gripper_wait_idle, a gripper that has not started moving yet
+        is not taken as done. Stopping short (e.g. on a grasped object)
+        only ends the wait once the gripper has moved and then held still
+        for settle_time.
+        
+        Args:
+            target: Commanded gripper opening (1-1000)
+            tolerance: Largest |actpos - target| counted as reached
+            timeout: Maximum time to wait in seconds
+            poll_interval: Time between state reads in seconds
+            settle_time: How long a stopped-short position must hold in seconds
+            
+        Returns:
+            Last actual position read, or None if the state could not be read
+        """
+        deadline = time.monotonic() + timeout
+        first_pos = last_pos = None
+        stable_since = None
+        
+        while True:
+            state = self.gripper_get_state()
+            pos = state.get('actpos') if state else None
+            now = time.monotonic()
+            
+            if pos is not None:
+                if abs(pos - target) <= tolerance:
+                    return pos
+                if first_pos is None:
+                    first_pos = pos
+                if pos != last_pos:
+                    stable_since = now
+                elif pos != first_pos and now - stable_since >= settle_time:
+                    return pos  # Moved, then stopped short of the target
+                last_pos = pos
+            
+            if now >= deadline:
+                return last_pos
+            time.sleep(poll_interval)
+    
+    def gripper_sweep(self, positions: Sequence[int], timeout: float = 3.0) -> List[Optional[int]]:
+        """
+        Move the gripper through a list of positions and read where it stops.
+        
+        Each position is sent non-blocking and followed by
+        gripper_wait_position, so every waypoint costs one command plus
+        state polls rather than a blocking call and a fixed sleep.
+        
+        Args:
+            positions: Gripper openings to visit in order (1-1000)
+            timeout: Maximum time to wait at each position in seconds
+            
+        Returns:
+            Actual position reached at each waypoint (None if the command
+            failed or the state could not be read)
+        """
+        actuals = []
+        for position in positions:
+            position = int(position)
+            if self.gripper_set_position(position, block=False) != 0:
+                actuals.append(None)
+                continue
+            actuals.append(self.gripper_wait_position(position, timeout=timeout))
+        return actuals
+    
     # ========== Utility Methods ==========
     
     def move_to_home(self, velocity: int = 20) -> int:
@@ -470,7 +947,7 @@ class RobotController:
         Returns:
             Status code (0 = success)
         """
-        home_position = self.model_config["default_joints"]
+        home_position = list(self.model_config.default_joints)
         logger.info(f"Moving to home position: {home_position}")
         return self.movej(home_position, velocity, block=True)
     
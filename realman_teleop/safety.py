@@ -5,11 +5,35 @@ Safety features and monitoring for robot teleoperation.
 """
 
 import logging
+import time
+from types import MappingProxyType
 from typing import Dict, List, Optional
+
+import numpy as np
+
+from . import _kernels
+from ._kernels import limit_pose, limit_step
 from .robot_controller import RobotController
 
 logger = logging.getLogger(__name__)
 
+# Violation bits and the names they are reported under
+_VIOLATIONS = (
+    (_kernels.LINEAR_VELOCITY, "linear_velocity_exceeded"),
+    (_kernels.ANGULAR_VELOCITY, "angular_velocity_exceeded"),
+    (_kernels.X_MIN, "x_min_exceeded"),
+    (_kernels.X_MAX, "x_max_exceeded"),
+    (_kernels.Y_MIN, "y_min_exceeded"),
+    (_kernels.Y_MAX, "y_max_exceeded"),
+    (_kernels.Z_MIN, "z_min_exceeded"),
+    (_kernels.Z_MAX, "z_max_exceeded"),
+    (_kernels.JOINT_VELOCITY, "joint_velocity_exceeded"),
+)
+
+# Workspace bounds passed to limit_pose when workspace limits are disabled
+_NO_LOW = np.full(3, -np.inf)
+_NO_HIGH = np.full(3, np.inf)
+
 
 class SafetyMonitor:
     """
@@ -19,6 +43,10 @@ class SafetyMonitor:
     collision detection, and emergency stop handling.
     """
     
+    # Shortest time between violation warnings; violations in between are
+    # counted and reported together with the next warning (seconds)
+    VIOLATION_LOG_INTERVAL = 0.1
+    
     def __init__(
         self,
         robot: RobotController,
@@ -40,10 +68,15 @@ class SafetyMonitor:
         self.enable_workspace_limits = enable_workspace_limits
         self.enable_collision_detection = enable_collision_detection
         
+        # Control period the limits are applied over; the limits are kept
+        # as per-tick displacements so the checks need no division by dt
+        self._dt = 0.01
+        
         # Default safety limits
-        self.max_linear_velocity = 0.5  # m/s
-        self.max_angular_velocity = 1.0  # rad/s
-        self.max_joint_velocity = 30.0  # deg/s
+        self._max_linear_velocity = 0.5  # m/s
+        self._max_angular_velocity = 1.0  # rad/s
+        self._max_joint_velocity = 30.0  # deg/s
+        self._update_displacement_limits()
         
         # Workspace limits (example for RM65, adjust per model)
         self.workspace_limits = {
@@ -55,10 +88,25 @@ class SafetyMonitor:
         # Collision detection level
         self.collision_level = 3
         
-        # Safety state
-        self.violations = []
+        # Safety state: bits from _VIOLATIONS hit by the last check
+        self._violation_mask = 0
         self.emergency_stop_triggered = False
         
+        # Occurrences of each _VIOLATIONS entry not yet logged, and when
+        # the last warning went out (perf_counter_ns)
+        self._unlogged_violations = [0] * len(_VIOLATIONS)
+        self._last_warn_ns = None
+        
+        # Arm state read at most once per check_commands call, and the
+        # call it belongs to
+        self._tick = 0
+        self._state_cache = None
+        self._state_tick = -1
+        
+        # Target, current and output rows reused by the limit kernels
+        self._pose_buf = np.empty((3, 6), dtype=np.float64)
+        self._joint_buf = np.empty((3, 0), dtype=np.float64)
+        
         logger.info("Safety monitor initialized")
         self._log_safety_config()
     
@@ -82,102 +130,183 @@ class SafetyMonitor:
         Returns:
             Modified commands with safety enforced, or emergency stop
         """
-        self.violations.clear()
+        self._violation_mask = 0
+        self._tick += 1
         
         if self.emergency_stop_triggered:
             return {'type': 'stop', 'reason': 'emergency_stop'}
         
-        # Check velocity limits
-        if self.enable_velocity_limits:
-            commands = self._check_velocity_limits(commands)
-        
-        # Check workspace limits
-        if self.enable_workspace_limits:
-            commands = self._check_workspace_limits(commands)
+        # Check velocity and workspace limits
+        command_type = commands.get('type')
+        if command_type == 'cartesian':
+            if self.enable_velocity_limits or self.enable_workspace_limits:
+                commands = self._check_pose_limits(commands)
+        elif command_type == 'joint':
+            if self.enable_velocity_limits:
+                commands = self._check_joint_limits(commands)
         
         # Log violations
-        if self.violations:
-            logger.warning(f"Safety violations: {', '.join(self.violations)}")
+        if self._violation_mask and logger.isEnabledFor(logging.WARNING):
+            self._log_violations()
         
         return commands
     
-    def _check_velocity_limits(self, commands: Dict) -> Dict:
-        """Check and enforce velocity limits."""
-        if commands.get('type') == 'cartesian':
-            target_pose = commands.get('target', [])
-            if len(target_pose) >= 6:
-                # Check if target would require excessive velocity
-                current_pose = self.robot.get_current_pose()
-                if current_pose:
-                    dt = 0.01  # Assumed time step
-                    
-                    # Linear velocity check
-                    linear_vel = [
-                        abs((target_pose[i] - current_pose[i]) / dt)
-                        for i in range(3)
-                    ]
-                    if max(linear_vel) > self.max_linear_velocity:
-                        self.violations.append("linear_velocity_exceeded")
-                        # Scale down
-                        scale = self.max_linear_velocity / max(linear_vel)
-                        commands['target'][:3] = [
-                            current_pose[i] + (target_pose[i] - current_pose[i]) * scale
-                            for i in range(3)
-                        ]
-                    
-                    # Angular velocity check
-                    angular_vel = [
-                        abs((target_pose[i] - current_pose[i]) / dt)
-                        for i in range(3, 6)
-                    ]
-                    if max(angular_vel) > self.max_angular_velocity:
-                        self.violations.append("angular_velocity_exceeded")
-                        scale = self.max_angular_velocity / max(angular_vel)
-                        commands['target'][3:] = [
-                            current_pose[i] + (target_pose[i] - current_pose[i]) * scale
-                            for i in range(3, 6)
-                        ]
-        
-        elif commands.get('type') == 'joint':
-            target_joints = commands.get('target', [])
-            if target_joints:
-                current_joints = self.robot.get_current_joint_angles()
-                if current_joints:
-                    dt = 0.01
-                    joint_vel = [
-                        abs((target_joints[i] - current_joints[i]) / dt)
-                        for i in range(len(target_joints))
-                    ]
-                    if max(joint_vel) > self.max_joint_velocity:
-                        self.violations.append("joint_velocity_exceeded")
-                        scale = self.max_joint_velocity / max(joint_vel)
-                        commands['target'] = [
-                            current_joints[i] + (target_joints[i] - current_joints[i]) * scale
-                            for i in range(len(target_joints))
-                        ]
+    @property
+    def violations(self) -> List[str]:
+        """Names of the limits the last check_commands call enforced."""
+        mask = self._violation_mask
+        return [name for bit, name in _VIOLATIONS if mask & bit]
+    
+    def _log_violations(self):
+        """Count this check's violations and log the counts at most once per interval."""
+        mask = self._violation_mask
+        counts = self._unlogged_violations
+        for i, (bit, _) in enumerate(_VIOLATIONS):
+            if mask & bit:
+                counts[i] += 1
+        
+        now_ns = time.perf_counter_ns()
+        if (self._last_warn_ns is not None
+                and now_ns - self._last_warn_ns < self.VIOLATION_LOG_INTERVAL * 1e9):
+            return
+        
+        summary = ', '.join(
+            name if count == 1 else f"{name} (x{count})"
+            for (_, name), count in zip(_VIOLATIONS, counts) if count
+        )
+        logger.warning(f"Safety violations: {summary}")
+        counts[:] = [0] * len(counts)
+        self._last_warn_ns = now_ns
+    
+    def _arm_state(self) -> Optional[Dict]:
+        """
+        Get the arm state for the current check, reading the robot only once.
+        
+        Returns:
+            Arm state as returned by RobotController.get_arm_state(), or None
+        """
+        if self._state_tick != self._tick:
+            self._state_cache = self.robot.get_arm_state()
+            self._state_tick = self._tick
+        return self._state_cache
+    
+    def _check_pose_limits(self, commands: Dict) -> Dict:
+        """Scale down fast Cartesian steps and clamp the target into the workspace."""
+        target_pose = commands.get('target', [])
+        n = min(len(target_pose), 6)
+        if n < 3:
+            return commands
+        
+        target = self._pose_buf[0, :n]
+        target[:] = target_pose[:n]
+        
+        # Velocity limits need the current pose; without it only the
+        # workspace is enforced (a step from target to itself never scales)
+        current = target
+        max_linear = max_angular = np.inf
+        if self.enable_velocity_limits and n == 6:
+            state = self._arm_state()
+            current_pose = state['pose'] if state else None
+            if current_pose:
+                current = self._pose_buf[1]
+                current[:] = current_pose[:6]
+                max_linear = self._max_linear_disp
+                max_angular = self._max_angular_disp
+        
+        if self.enable_workspace_limits:
+            low, high = self._ws_low, self._ws_high
+        else:
+            low, high = _NO_LOW, _NO_HIGH
+        
+        out = self._pose_buf[2, :n]
+        mask = limit_pose(target, current, max_linear, max_angular, low, high, out)
+        if mask:
+            self._violation_mask |= mask
+            commands['target'][:n] = out.tolist()
         
         return commands
     
-    def _check_workspace_limits(self, commands: Dict) -> Dict:
-        """Check workspace boundaries."""
-        if commands.get('type') == 'cartesian':
-            target_pose = commands.get('target', [])
-            if len(target_pose) >= 3:
-                # Check X, Y, Z limits
-                axes = ['x', 'y', 'z']
-                for i, axis in enumerate(axes):
-                    min_val, max_val = self.workspace_limits[axis]
-                    if target_pose[i] < min_val:
-                        self.violations.append(f"{axis}_min_exceeded")
-                        target_pose[i] = min_val
-                    elif target_pose[i] > max_val:
-                        self.violations.append(f"{axis}_max_exceeded")
-                        target_pose[i] = max_val
-                
-                commands['target'] = target_pose
+    def _check_joint_limits(self, commands: Dict) -> Dict:
+        """Scale down joint steps that exceed the joint velocity limit."""
+        target_joints = commands.get('target', [])
+        n = len(target_joints)
+        if n == 0:
+            return commands
+        
+        state = self._arm_state()
+        current_joints = state['joint_angles'] if state else None
+        if not current_joints or len(current_joints) < n:
+            return commands
+        
+        buf = self._joint_buf
+        if buf.shape[1] != n:
+            buf = self._joint_buf = np.empty((3, n), dtype=np.float64)
+        target, current, out = buf
+        target[:] = target_joints
+        current[:] = current_joints[:n]
+        if limit_step(target, current, self._max_joint_disp, out):
+            self._violation_mask |= _kernels.JOINT_VELOCITY
+            commands['target'] = out.tolist()
         
         return commands
     
+    @property
+    def max_linear_velocity(self) -> float:
+        """Maximum Cartesian linear velocity (m/s)."""
+        return self._max_linear_velocity
+    
+    @max_linear_velocity.setter
+    def max_linear_velocity(self, value: float):
+        self._max_linear_velocity = value
+        self._update_displacement_limits()
+    
+    @property
+    def max_angular_velocity(self) -> float:
+        """Maximum Cartesian angular velocity (rad/s)."""
+        return self._max_angular_velocity
+    
+    @max_angular_velocity.setter
+    def max_angular_velocity(self, value: float):
+        self._max_angular_velocity = value
+        self._update_displacement_limits()
+    
+    @property
+    def max_joint_velocity(self) -> float:
+        """Maximum joint velocity (deg/s)."""
+        return self._max_joint_velocity
+    
+    @max_joint_velocity.setter
+    def max_joint_velocity(self, value: float):
+        self._max_joint_velocity = value
+        self._update_displacement_limits()
+    
+    @property
+    def workspace_limits(self) -> MappingProxyType:
+        """
+        Workspace limits as 'x', 'y', 'z' keys and (min, max) tuples.
+        
+        The mapping is read-only; assign a new dictionary or call
+        set_workspace_limits() to change the limits.
+        """
+        return MappingProxyType(self._workspace_limits)
+    
+    @workspace_limits.setter
+    def workspace_limits(self, limits: Dict[str, tuple]):
+        self._workspace_limits = dict(limits)
+        self._update_workspace_bounds()
+    
+    def _update_displacement_limits(self):
+        """Recompute the largest allowed per-tick displacements from the velocity limits."""
+        self._max_linear_disp = self._max_linear_velocity * self._dt
+        self._max_angular_disp = self._max_angular_velocity * self._dt
+        self._max_joint_disp = self._max_joint_velocity * self._dt
+    
+    def _update_workspace_bounds(self):
+        """Rebuild the x, y, z lower and upper bound arrays from the workspace limits."""
+        bounds = np.array([self._workspace_limits[axis] for axis in 'xyz'], dtype=np.float64)
+        self._ws_low = np.ascontiguousarray(bounds[:, 0])
+        self._ws_high = np.ascontiguousarray(bounds[:, 1])
+    
     def trigger_emergency_stop(self):
         """Trigger emergency stop."""
         logger.critical("EMERGENCY STOP TRIGGERED BY SAFETY MONITOR")
@@ -188,7 +317,7 @@ class SafetyMonitor:
         """Reset emergency stop."""
         logger.info("Emergency stop reset")
         self.emergency_stop_triggered = False
-        self.violations.clear()
+        self._violation_mask = 0
     
     def set_velocity_limits(
         self,
@@ -207,6 +336,16 @@ class SafetyMonitor:
         logger.info(f"Velocity limits updated: linear={self.max_linear_velocity}, "
                    f"angular={self.max_angular_velocity}, joint={self.max_joint_velocity}")
     
+    def set_control_period(self, dt: float):
+        """
+        Set the time step the velocity limits are applied over.
+        
+        Args:
+            dt: Control loop period in seconds
+        """
+        self._dt = dt
+        self._update_displacement_limits()
+    
     def set_workspace_limits(self, limits: Dict[str, tuple]):
         """
         Update workspace limits.
@@ -214,8 +353,8 @@ class SafetyMonitor:
         Args:
             limits: Dictionary with 'x', 'y', 'z' keys and (min, max) tuples
         """
-        self.workspace_limits.update(limits)
-        logger.info(f"Workspace limits updated: {self.workspace_limits}")
+        self.workspace_limits = {**self._workspace_limits, **limits}
+        logger.info(f"Workspace limits updated: {self._workspace_limits}")
     
     def enable_collision_detection(self, level: int = 3):
         """
@@ -5,8 +5,17 @@ Abstract base class for all teleoperation interfaces.
 """
 
 import logging
+import os
+import selectors
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from contextlib import contextmanager
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .command_sender import CommandSender
 from .robot_controller import RobotController
 from .safety import SafetyMonitor
 
@@ -20,11 +29,41 @@ class TeleopBase(ABC):
     All teleoperation modes (keyboard, joystick, etc.) inherit from this class.
     """
     
+    # Longest wait between loop iterations while idle in event-driven mode
+    IDLE_PERIOD = 0.2
+    
+    # Velocity magnitude at or below which a command counts as no motion,
+    # so float noise left after the deadzone does not reach the robot
+    MIN_VELOCITY = 1e-4
+    
+    # Ticks between robot state reads while moving; in between, the last
+    # commanded target stands in for the robot's current pose/joints
+    STATE_REFRESH_TICKS = 10
+    
+    # Final stretch before a tick deadline spent spinning instead of sleeping,
+    # since sleep can overshoot by about this much (seconds)
+    SPIN_MARGIN = 0.001
+    
+    # Ticks the loop may fall behind its schedule before it stops catching up
+    MAX_LAG_TICKS = 3
+    
+    # Time a tick may take while control is enabled before the watchdog
+    # stops the robot and ends the loop (seconds); well above ordinary SDK
+    # round-trip jitter, so only a real hang trips it
+    WATCHDOG_TIMEOUT = 0.5
+    
+    # SCHED_FIFO priority requested for the control loop on Linux when the
+    # process is allowed to (None leaves the default scheduler)
+    REALTIME_PRIORITY = 20
+    
     def __init__(
         self,
         robot: RobotController,
         update_rate: float = 100.0,
-        enable_safety: bool = True
+        enable_safety: bool = True,
+        event_driven: bool = False,
+        async_commands: bool = False,
+        stream_commands: bool = False
     ):
         """
         Initialize teleoperation base.
@@ -33,18 +72,45 @@ class TeleopBase(ABC):
             robot: RobotController instance
             update_rate: Control loop update rate in Hz
             enable_safety: Whether to enable safety monitoring
+            event_driven: When no motion is commanded, wait for input events
+                (up to IDLE_PERIOD) instead of polling at update_rate
+            async_commands: Send movel/movej from a background thread so
+                network round-trips do not delay the control loop
+            stream_commands: Send per-tick targets as unplanned CANFD
+                pass-through commands (movep_stream/movej_stream) instead of
+                planning a movel/movej for each one
         """
         self.robot = robot
         self.update_rate = update_rate
         self.update_period = 1.0 / update_rate
+        self.event_driven = event_driven
+        self.stream_commands = stream_commands
         
         self.running = False
         self.enabled = False  # Deadman switch state
         
+        # Last commanded target, its type ('cartesian' or 'joint') and how
+        # many ticks it has been reused since the last robot state read
+        self._state_cache = None
+        self._state_cache_type = None
+        self._state_cache_age = 0
+        
+        # Loop heartbeat for the watchdog thread: start of the current tick
+        # (perf_counter_ns) and whether a stall there should stop the robot
+        self._last_tick_ns = 0
+        self._watchdog_armed = False
+        
+        # Selector watching input_fileno() in wait_for_input, created on first use
+        self._input_selector = None
+        
+        # Background sender for motion commands (None sends inline)
+        self._sender = CommandSender(robot) if async_commands else None
+        
         # Safety monitor
         self.safety = None
         if enable_safety:
             self.safety = SafetyMonitor(robot)
+            self.safety.set_control_period(self.update_period)
         
         logger.info(f"Initialized {self.__class__.__name__} at {update_rate} Hz")
     
@@ -99,6 +165,122 @@ class TeleopBase(ABC):
         """Cleanup teleoperation interface."""
         pass
     
+    def input_fileno(self) -> Optional[int]:
+        """
+        File descriptor that becomes readable when the input device has new data.
+        
+        Returns:
+            File descriptor, or None if the device cannot be waited on this way
+        """
+        return None
+    
+    def wait_for_input(self, timeout: float):
+        """
+        Wait for new input while idle in event-driven mode.
+        
+        The default waits on input_fileno() if the subclass provides one
+        and otherwise just sleeps; subclasses without a file descriptor
+        should return early as soon as their input device has something
+        to report.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+        """
+        fd = self.input_fileno()
+        if fd is None:
+            time.sleep(timeout)
+            return
+        
+        if self._input_selector is None:
+            self._input_selector = selectors.DefaultSelector()
+            self._input_selector.register(fd, selectors.EVENT_READ)
+        self._input_selector.select(timeout)
+    
+    def _current_state(self, command_type: str):
+        """
+        Get the pose or joint angles to integrate the next command from.
+        
+        Reads the robot only every STATE_REFRESH_TICKS calls, or after the
+        cached target was invalidated; otherwise returns the last target
+        recorded with _remember_state().
+        
+        Args:
+            command_type: 'cartesian' for the pose, anything else for joints
+            
+        Returns:
+            Pose or joint angles (a list, or the array last passed to
+            _remember_state()), or None if the robot read failed
+        """
+        if (self._state_cache is not None
+                and self._state_cache_type == command_type
+                and self._state_cache_age < self.STATE_REFRESH_TICKS):
+            self._state_cache_age += 1
+            return self._state_cache
+        
+        if command_type == "cartesian":
+            state = self.robot.get_current_pose()
+        else:
+            state = self.robot.get_current_joint_angles()
+        self._state_cache = state or None
+        self._state_cache_type = command_type
+        self._state_cache_age = 1
+        return self._state_cache
+    
+    def _remember_state(self, target):
+        """
+        Record a commanded target as the state for the next tick.
+        
+        Args:
+            target: Pose or joint angles; kept by reference, so a reused
+                buffer may be passed and updated in place
+        """
+        self._state_cache = target
+    
+    def _forget_state(self):
+        """Make the next _current_state() call read the robot."""
+        self._state_cache = None
+    
+    def _send_motion(
+        self,
+        command_type: str,
+        target: list,
+        velocity: int = 50,
+        stream: Optional[bool] = None
+    ) -> bool:
+        """
+        Send a non-blocking movel/movej, through the background sender if enabled.
+        
+        Args:
+            command_type: 'cartesian' for movel, anything else for movej
+            target: Target pose or joint angles
+            velocity: Planning velocity percentage
+            stream: Stream the target without planning; defaults to
+                stream_commands
+            
+        Returns:
+            False if the robot rejected this command (or, with the background
+            sender, an earlier one)
+        """
+        if stream is None:
+            stream = self.stream_commands
+        
+        if self._sender is not None:
+            self._sender.submit(command_type, target, velocity, stream)
+            return not self._sender.take_failure()
+        
+        if stream:
+            if command_type == "cartesian":
+                return self.robot.movep_stream(target) == 0
+            return self.robot.movej_fast(target) == 0
+        if command_type == "cartesian":
+            return self.robot.movel(target, velocity=velocity, block=False) == 0
+        return self.robot.movej(target, velocity=velocity, block=False) == 0
+    
+    def _cancel_motion(self):
+        """Drop motion commands not yet sent; call before stopping the robot."""
+        if self._sender is not None:
+            self._sender.cancel()
+    
     def enable(self):
         """Enable robot control (deadman switch pressed)."""
         if not self.enabled:
@@ -111,11 +293,14 @@ class TeleopBase(ABC):
             self.enabled = False
             logger.info("Robot control DISABLED")
             # Stop robot when disabled
+            self._cancel_motion()
             self.robot.stop()
+            self._forget_state()
     
     def emergency_stop(self):
         """Trigger emergency stop."""
         logger.critical("EMERGENCY STOP ACTIVATED!")
+        self._cancel_motion()
         self.robot.stop()
         self.disable()
         self.running = False
@@ -127,8 +312,6 @@ class TeleopBase(ABC):
         This is the main control loop that reads input, processes it,
         and sends commands to the robot.
         """
-        import time
-        
         logger.info("Starting teleoperation...")
         
         if not self.setup():
@@ -136,10 +319,30 @@ class TeleopBase(ABC):
             return
         
         self.running = True
+        # Start the helper threads first so they keep the default scheduler
+        # instead of inheriting the loop's real-time policy
+        if self._sender is not None:
+            self._sender.start()
+        watchdog = threading.Thread(target=self._watchdog, name="TeleopWatchdog", daemon=True)
+        watchdog.start()
+        saved_scheduler = self._set_realtime_priority()
+        realtime = saved_scheduler is not None
+        
+        # Ticks are scheduled on absolute deadlines so sleep overshoot and
+        # varying work do not add up to drift
+        perf_counter_ns = time.perf_counter_ns
+        sleep = time.sleep
+        period_ns = int(self.update_period * 1e9)
+        # Under SCHED_FIFO sleep wakes on time and a spinning loop would
+        # starve every other thread on its core, so only spin otherwise
+        spin_ns = 0 if realtime else int(self.SPIN_MARGIN * 1e9)
+        overruns = 0
+        next_tick_ns = perf_counter_ns()
         
         try:
             while self.running:
-                loop_start = time.time()
+                loop_start_ns = perf_counter_ns()
+                self._last_tick_ns = loop_start_ns
                 
                 # Read input from device
                 input_state = self.read_input()
@@ -154,8 +357,10 @@ class TeleopBase(ABC):
                     self.enable()
                 else:
                     self.disable()
+                self._watchdog_armed = self.enabled
                 
                 # Process and send commands only if enabled
+                active = False
                 if self.enabled:
                     commands = self.process_input(input_state)
                     
@@ -164,13 +369,41 @@ class TeleopBase(ABC):
                         commands = self.safety.check_commands(commands)
                     
                     self.send_commands(commands)
+                    active = commands.get('home', False) or bool(
+                        np.any(commands.get('velocity', ()))
+                    )
                 
-                # Maintain update rate
-                loop_time = time.time() - loop_start
-                if loop_time < self.update_period:
-                    time.sleep(self.update_period - loop_time)
-                else:
-                    logger.warning(f"Loop time {loop_time:.4f}s exceeds period {self.update_period:.4f}s")
+                # Maintain update rate (or wait for input while idle)
+                now_ns = perf_counter_ns()
+                loop_time = (now_ns - loop_start_ns) * 1e-9
+                if self.event_driven and not active:
+                    self._watchdog_armed = False
+                    if loop_time < self.IDLE_PERIOD:
+                        self.wait_for_input(self.IDLE_PERIOD - loop_time)
+                    next_tick_ns = perf_counter_ns()
+                    continue
+                
+                if loop_time > self.update_period:
+                    # Warn on the 1st, 2nd, 4th, 8th, ... overrun only
+                    overruns += 1
+                    if overruns & (overruns - 1) == 0:
+                        logger.warning(
+                            f"Loop time {loop_time:.4f}s exceeds period {self.update_period:.4f}s "
+                            f"({overruns} overruns so far)"
+                        )
+                
+                next_tick_ns += period_ns
+                remaining_ns = next_tick_ns - now_ns
+                if remaining_ns < -self.MAX_LAG_TICKS * period_ns:
+                    # Too far behind; start a new schedule instead of
+                    # running a burst of back-to-back ticks
+                    next_tick_ns = now_ns
+                elif remaining_ns > 0:
+                    if remaining_ns > spin_ns:
+                        sleep((remaining_ns - spin_ns) * 1e-9)
+                    if spin_ns:
+                        while perf_counter_ns() < next_tick_ns:
+                            pass
         
         except KeyboardInterrupt:
             logger.info("Teleoperation interrupted by user")
@@ -179,9 +412,88 @@ class TeleopBase(ABC):
             logger.error(f"Error in teleoperation loop: {e}", exc_info=True)
         
         finally:
+            self.running = False
+            self._watchdog_armed = False
+            if saved_scheduler is not None:
+                self._restore_scheduler(*saved_scheduler)
+            watchdog.join()
+            if self._sender is not None:
+                self._sender.stop()
+            if self._input_selector is not None:
+                self._input_selector.close()
+                self._input_selector = None
             self.cleanup()
             logger.info("Teleoperation stopped")
     
+    def _watchdog(self):
+        """
+        Stop the robot if a tick stalls while control is enabled.
+        
+        Runs beside the loop so a hung read_input or SDK call cannot leave
+        the robot following its last command.
+        """
+        timeout_ns = int(self.WATCHDOG_TIMEOUT * 1e9)
+        while self.running:
+            time.sleep(self.update_period)
+            if self._watchdog_armed and time.perf_counter_ns() - self._last_tick_ns > timeout_ns:
+                logger.critical(
+                    f"Control loop stalled for over {self.WATCHDOG_TIMEOUT:.2f}s, stopping robot"
+                )
+                if self._sender is not None:
+                    self._sender.cancel(wait=False)
+                self.robot.stop()
+                self.running = False
+                return
+    
+    @contextmanager
+    def _watchdog_suspended(self):
+        """
+        Disarm the watchdog around a call that blocks on purpose.
+        
+        Use for moves sent with block=True (e.g. move_to_home), which take
+        far longer than a tick without the loop being stalled.
+        """
+        armed = self._watchdog_armed
+        self._watchdog_armed = False
+        try:
+            yield
+        finally:
+            # Restart the stall timer before re-arming
+            self._last_tick_ns = time.perf_counter_ns()
+            self._watchdog_armed = armed
+    
+    def _set_realtime_priority(self) -> Optional[Tuple[int, "os.sched_param"]]:
+        """
+        Run the control loop under SCHED_FIFO if the OS and privileges allow.
+        
+        Returns:
+            The previous (policy, param) to hand to _restore_scheduler, or
+            None if the calling thread was left on its current scheduler
+        """
+        if self.REALTIME_PRIORITY is None or not hasattr(os, "sched_setscheduler"):
+            return None
+        try:
+            saved = (os.sched_getscheduler(0), os.sched_getparam(0))
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(self.REALTIME_PRIORITY))
+            logger.info(f"Control loop running with SCHED_FIFO priority {self.REALTIME_PRIORITY}")
+            return saved
+        except (PermissionError, OSError) as e:
+            logger.debug(f"Real-time scheduling not available: {e}")
+            return None
+    
+    def _restore_scheduler(self, policy: int, param: "os.sched_param"):
+        """
+        Put the calling thread back on the scheduler it had before run().
+        
+        Args:
+            policy: Scheduling policy saved by _set_realtime_priority
+            param: Scheduling parameters saved by _set_realtime_priority
+        """
+        try:
+            os.sched_setscheduler(0, policy, param)
+        except OSError as e:
+            logger.warning(f"Could not restore the scheduling policy: {e}")
+    
     def stop(self):
         """Stop the teleoperation loop."""
         self.running = False
@@ -4,57 +4,222 @@ Utility Functions Module
 Helper functions for robot teleoperation.
 """
 
+import atexit
 import logging
+import logging.handlers
 import math
-from typing import List, Tuple
+import os
+import queue
+import threading
+import time
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ._kernels import deadzone
 
 logger = logging.getLogger(__name__)
 
+# Name prefix for handlers installed by setup_logging()
+_HANDLER_PREFIX = "realman_teleop."
+
+# Angle unit conversion factors
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+
+# math functions bound once for the small-list helpers below
+_radians = math.radians
+_degrees = math.degrees
+_hypot = math.hypot
+
+# Give up the rest of the time slice while spin-waiting (no-op where unsupported)
+_yield_cpu = getattr(os, 'sched_yield', lambda: None)
+
+# Listener writing queued records when setup_logging(background=True)
+_listener = None
+
+
+def _stop_listener():
+    """Flush and stop the background log listener, if running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
 
-def setup_logging(level: str = "INFO", log_file: str = None):
+class _LogFormatter(logging.Formatter):
+    """Formatter that reuses the timestamp text for records in the same second."""
+    
+    def __init__(self, fmt: str, datefmt: str):
+        """
+        Initialize the formatter.
+        
+        Args:
+            fmt: %-style record format
+            datefmt: strftime format for asctime, with at most second resolution
+        """
+        super().__init__(fmt, datefmt=datefmt)
+        self._time_second = None
+        self._time_text = ""
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        """Format the record time, calling strftime once per second."""
+        second = int(record.created)
+        if second != self._time_second:
+            self._time_text = super().formatTime(record, datefmt)
+            self._time_second = second
+        return self._time_text
+
+
+class _BufferedFileHandler(logging.handlers.MemoryHandler):
+    """
+    Log file handler that writes records in batches.
+    
+    Records are held in memory and written when the buffer fills, when a
+    WARNING or higher record arrives, every FLUSH_INTERVAL seconds, and
+    on close, so high-rate debug logging does not cost a write per record.
+    """
+    
+    # Longest time a buffered record waits before being written (seconds)
+    FLUSH_INTERVAL = 30.0
+    
+    def __init__(self, filename: str, capacity: int = 1024):
+        """
+        Initialize the handler.
+        
+        Args:
+            filename: Log file path
+            capacity: Records buffered before they are written
+        """
+        super().__init__(
+            capacity, flushLevel=logging.WARNING, target=logging.FileHandler(filename)
+        )
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="LogFileFlush", daemon=True
+        )
+        self._flusher.start()
+    
+    def _flush_periodically(self):
+        """Write buffered records every FLUSH_INTERVAL until closed."""
+        while not self._closed.wait(self.FLUSH_INTERVAL):
+            self.flush()
+    
+    def setFormatter(self, fmt: logging.Formatter):
+        """Set the formatter, which the file handler applies when writing."""
+        super().setFormatter(fmt)
+        self.target.setFormatter(fmt)
+    
+    def close(self):
+        """Write remaining records and close the file."""
+        self._closed.set()
+        target = self.target
+        super().close()
+        if target is not None:
+            target.close()
+
+
+def setup_logging(
+    level: str = "INFO",
+    log_file: str = None,
+    background: bool = True,
+    minimal_records: bool = False
+):
     """
     Setup logging configuration.
     
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional log file path
+        background: Write records on a listener thread, so logging from
+            the control loop only enqueues them; False writes them from the
+            logging thread itself
+        minimal_records: Stop filling in the thread and process fields of
+            every log record, which the format here never shows. These are
+            process-wide logging flags, so only set this from a program
+            that owns all of its logging configuration.
     """
+    global _listener
+    
     numeric_level = getattr(logging, level.upper(), None)
     if not isinstance(numeric_level, int):
         raise ValueError(f'Invalid log level: {level}')
     
+    if minimal_records:
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+    
     # Create formatter
-    formatter = logging.Formatter(
+    formatter = _LogFormatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
     # Console handler
     console_handler = logging.StreamHandler()
+    console_handler.set_name(_HANDLER_PREFIX + "console")
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(formatter)
     
-    # Configure root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(numeric_level)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler if specified
     if log_file:
-        file_handler = logging.FileHandler(log_file)
+        file_handler = _BufferedFileHandler(log_file)
+        file_handler.set_name(_HANDLER_PREFIX + "file")
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Configure root logger, replacing handlers from any earlier call so
+    # repeated setup does not duplicate every record
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        if (handler.get_name() or "").startswith(_HANDLER_PREFIX):
+            root_logger.removeHandler(handler)
+            handler.close()
+    _stop_listener()
+    root_logger.setLevel(numeric_level)
+    
+    if background:
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.set_name(_HANDLER_PREFIX + "queue")
+        _listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _listener.start()
+        root_logger.addHandler(queue_handler)
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
 
 
-def degrees_to_radians(degrees: List[float]) -> List[float]:
+def degrees_to_radians(degrees: Sequence[float]) -> List[float]:
     """Convert degrees to radians."""
-    return [math.radians(d) for d in degrees]
+    # map over the C function beats a NumPy round trip for joint-sized lists
+    return list(map(_radians, degrees))
 
 
-def radians_to_degrees(radians: List[float]) -> List[float]:
+def radians_to_degrees(radians: Sequence[float]) -> List[float]:
     """Convert radians to degrees."""
-    return [math.degrees(r) for r in radians]
+    return list(map(_degrees, radians))
+
+
+def degrees_to_radians_array(degrees) -> np.ndarray:
+    """Convert degrees (any array-like) to radians as a NumPy array."""
+    return np.multiply(degrees, _DEG2RAD)
+
+
+def radians_to_degrees_array(radians) -> np.ndarray:
+    """Convert radians (any array-like) to degrees as a NumPy array."""
+    return np.multiply(radians, _RAD2DEG)
 
 
 def clamp(value: float, min_val: float, max_val: float) -> float:
@@ -64,18 +229,39 @@ def clamp(value: float, min_val: float, max_val: float) -> float:
 
 def apply_deadzone(value: float, deadzone: float) -> float:
     """Apply deadzone to input value."""
-    if abs(value) < deadzone:
-        return 0.0
-    # Scale to full range after deadzone
-    sign = 1 if value > 0 else -1
-    return sign * (abs(value) - deadzone) / (1.0 - deadzone)
+    # Distance past the deadzone, scaled to the full range, with the input's sign
+    return math.copysign(max(abs(value) - deadzone, 0.0) / (1.0 - deadzone), value)
+
+
+def apply_deadzone_array(
+    values: Sequence[float],
+    deadzone_width: float,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Apply apply_deadzone() to every element of an array in one call.
+    
+    Args:
+        values: Axis values in -1..1
+        deadzone_width: Deadzone (0-1)
+        out: Float array to write the result into
+        
+    Returns:
+        Values with the deadzone applied (out if given)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if out is None:
+        out = np.empty_like(values)
+    deadzone(values, deadzone_width, out)
+    return out
 
 
 def smooth_velocity(
-    current: List[float],
-    target: List[float],
-    smoothing: float = 0.5
-) -> List[float]:
+    current: Sequence[float],
+    target: Sequence[float],
+    smoothing: float = 0.5,
+    out: Optional[np.ndarray] = None
+) -> Union[List[float], np.ndarray]:
     """
     Apply exponential smoothing to velocity.
     
@@ -83,30 +269,70 @@ def smooth_velocity(
         current: Current velocity
         target: Target velocity
         smoothing: Smoothing factor (0-1, higher = smoother)
+        out: Float array to write the result into (may be current), for
+            callers that reuse a buffer every tick
+        
+    Returns:
+        Smoothed velocity as a list, or out if given
+    """
+    if out is None:
+        return (np.multiply(current, smoothing) + np.multiply(target, 1.0 - smoothing)).tolist()
+    np.multiply(current, smoothing, out=out)
+    out += np.multiply(target, 1.0 - smoothing)
+    return out
+
+
+def make_smoother(
+    size: int,
+    smoothing: float = 0.5,
+    dtype=np.float64
+) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+    """
+    Build a smooth_velocity() step for a fixed size and smoothing factor.
+    
+    The returned function closes over preallocated buffers and the
+    precomputed weights, so a control loop can call it every tick without
+    allocating.
+    
+    Args:
+        size: Number of velocity components
+        smoothing: Smoothing factor (0-1, higher = smoother)
+        dtype: Float type of the buffers
         
     Returns:
-        Smoothed velocity
+        Function step(current, target) returning the smoothed velocity.
+        The result is the same array on every call; copy it to keep it.
     """
-    return [
-        smoothing * current[i] + (1 - smoothing) * target[i]
-        for i in range(len(current))
-    ]
+    out = np.empty(size, dtype=dtype)
+    scratch = np.empty(size, dtype=dtype)
+    keep = dtype(smoothing)
+    blend = dtype(1.0 - smoothing)
+    multiply = np.multiply
+    add = np.add
+    
+    def step(current: np.ndarray, target: np.ndarray) -> np.ndarray:
+        multiply(target, blend, out=scratch)
+        multiply(current, keep, out=out)
+        return add(out, scratch, out=out)
+    
+    return step
 
 
-def normalize_vector(vector: List[float]) -> List[float]:
+def normalize_vector(vector: Sequence[float]) -> List[float]:
     """Normalize vector to unit length."""
-    magnitude = math.sqrt(sum(v**2 for v in vector))
+    magnitude = vector_magnitude(vector)
     if magnitude > 0:
         return [v / magnitude for v in vector]
     return vector
 
 
-def vector_magnitude(vector: List[float]) -> float:
+def vector_magnitude(vector: Sequence[float]) -> float:
     """Calculate vector magnitude."""
-    return math.sqrt(sum(v**2 for v in vector))
+    # n-dimensional hypot: one C call, and safe against overflow/underflow
+    return _hypot(*vector)
 
 
-def limit_vector_magnitude(vector: List[float], max_magnitude: float) -> List[float]:
+def limit_vector_magnitude(vector: Sequence[float], max_magnitude: float) -> List[float]:
     """Limit vector magnitude to maximum value."""
     magnitude = vector_magnitude(vector)
     if magnitude > max_magnitude:
@@ -116,7 +342,12 @@ def limit_vector_magnitude(vector: List[float], max_magnitude: float) -> List[fl
 
 
 def pose_to_string(pose: List[float]) -> str:
-    """Format pose as readable string."""
+    """
+    Format pose as readable string.
+    
+    For log messages in the control loop, pass LazyFormat(pose_to_string, pose)
+    as a %-style argument so the formatting only runs if the record is emitted.
+    """
     if len(pose) >= 6:
         return (f"Position: ({pose[0]:.3f}, {pose[1]:.3f}, {pose[2]:.3f}) m, "
                 f"Orientation: ({pose[3]:.3f}, {pose[4]:.3f}, {pose[5]:.3f}) rad")
@@ -124,28 +355,74 @@ def pose_to_string(pose: List[float]) -> str:
 
 
 def joints_to_string(joints: List[float]) -> str:
-    """Format joint angles as readable string."""
+    """
+    Format joint angles as readable string.
+    
+    For log messages in the control loop, pass LazyFormat(joints_to_string, joints)
+    as a %-style argument so the formatting only runs if the record is emitted.
+    """
     return "Joints: [" + ", ".join(f"{j:.2f}°" for j in joints) + "]"
 
 
-class RateLimiter:
-    """Simple rate limiter for periodic operations."""
+class LazyFormat:
+    """
+    Defer a formatting call until a log record is actually emitted.
+    
+    Example:
+        logger.debug("%s", LazyFormat(joints_to_string, joints))
+    """
+    
+    __slots__ = ("_func", "_args")
     
-    def __init__(self, rate_hz: float):
+    def __init__(self, func, *args):
         """
-        Initialize rate limiter.
+        Initialize the deferred call.
         
         Args:
-            rate_hz: Desired rate in Hz
+            func: Function returning the text
+            *args: Arguments passed to func when the text is needed
         """
-        import time
-        self.period = 1.0 / rate_hz
-        self.last_time = time.time()
-    
-    def sleep(self):
-        """Sleep to maintain desired rate."""
-        import time
-        elapsed = time.time() - self.last_time
-        if elapsed < self.period:
-            time.sleep(self.period - elapsed)
-        self.last_time = time.time()
+        self._func = func
+        self._args = args
+    
+    def __str__(self) -> str:
+        """Call the formatting function."""
+        return self._func(*self._args)
+
+
+def rate_iter(rate_hz: float) -> Iterator[int]:
+    """
+    Pace a loop at a fixed rate: ``for _ in rate_iter(100): step()``.
+    
+    Each iteration starts at the next period boundary. Deadlines advance by
+    whole periods, so sleep overshoot and slow iterations do not accumulate
+    into rate drift; after falling more than a period behind, the schedule
+    restarts from now.
+    
+    Args:
+        rate_hz: Desired rate in Hz
+        
+    Yields:
+        The deadline of the current iteration (time.perf_counter_ns() clock)
+    """
+    period_ns = round(1e9 / rate_hz)
+    # Waits shorter than this yield the CPU in a loop instead of sleeping,
+    # since sleep can overshoot by more than that (nanoseconds)
+    yield_threshold_ns = 100_000
+    # Same clock as the TeleopBase loop, the highest-resolution monotonic one
+    perf_counter_ns = time.perf_counter_ns
+    sleep = time.sleep
+    
+    next_ns = perf_counter_ns() + period_ns
+    while True:
+        now = perf_counter_ns()
+        delta = next_ns - now
+        if delta > yield_threshold_ns:
+            sleep((delta - yield_threshold_ns) / 1e9)
+        if delta > 0:
+            while perf_counter_ns() < next_ns:
+                _yield_cpu()
+        elif delta < -period_ns:
+            next_ns = now
+        yield next_ns
+        next_ns += period_ns
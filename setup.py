@@ -36,6 +36,9 @@ setup(
     python_requires=">=3.9",
     install_requires=requirements,
     extras_require={
+        "jit": [
+            "numba>=0.56.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=3.0.0",
@@ -8,12 +8,33 @@ Creates .env file with your configuration.
 
 import os
 import sys
-import subprocess
+import socket
 from pathlib import Path
 
+# PyYAML and its dumper/loader classes, set by _import_yaml() on first use
+yaml = YamlDumper = YamlLoader = None
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+# Supported robot models, in menu order
+MODELS = ("RM65", "RM75", "RML63", "ECO65", "GEN72", "R1D2")
+MODEL_SET = frozenset(MODELS)
+MODEL_BY_INDEX = {str(i): model for i, model in enumerate(MODELS, 1)}
+
+def _import_yaml():
+    """Import PyYAML once, when a config file is first read or written."""
+    global yaml, YamlDumper, YamlLoader
+    if yaml is not None:
+        return
+    import yaml as yaml_module
+    try:
+        # libyaml C bindings, much faster than the pure-Python emitter/loader
+        from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+    except ImportError:
+        from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+    yaml = yaml_module
+
 def print_header(text):
     """Print a formatted header."""
     print("\n" + "=" * 60)
@@ -32,40 +53,77 @@ def print_warning(text):
     """Print warning message."""
     print(f"⚠ {text}")
 
-def test_ping(ip_address):
-    """Test if robot IP is reachable."""
+def test_ping(ip_address, port=8080):
+    """
+    Test if robot IP is reachable.
+    
+    Opens a TCP connection to the controller port instead of running the
+    ping command; a refused connection still means the host answered.
+    """
     try:
-        # Use platform-specific ping command
-        if sys.platform.startswith('win'):
-            result = subprocess.run(['ping', '-n', '1', '-w', '1000', ip_address], 
-                                  capture_output=True, timeout=2)
-        else:
-            result = subprocess.run(['ping', '-c', '1', '-W', '1', ip_address], 
-                                  capture_output=True, timeout=2)
-        return result.returncode == 0
-    except Exception:
+        socket.create_connection((ip_address, int(port)), timeout=1.0).close()
+        return True
+    except ConnectionRefusedError:
+        return True
+    except OSError:
         return False
 
-def detect_robot_dof(ip, port, model):
+def load_previous_dof(config_file, ip, port, model):
     """
-    Connect to robot and detect DOF (Degrees of Freedom).
+    Get the DOF saved by an earlier setup run for the same robot.
     
     Returns:
-        int: Number of joints (DOF), or None if detection failed
+        int: DOF from the existing robot.yaml if its IP, port and model
+            match, or None
+    """
+    try:
+        _import_yaml()
+        with open(config_file, 'r') as f:
+            robot = (yaml.load(f, Loader=YamlLoader) or {}).get('robot', {})
+    except Exception:
+        return None
+    
+    if (robot.get('ip') == ip and str(robot.get('port')) == str(port)
+            and robot.get('model') == model and robot.get('dof')):
+        return int(robot['dof'])
+    return None
+
+def connect_robot(ip, port, model):
+    """
+    Open the connection used by the setup probes.
+    
+    Returns:
+        RobotController: Connected controller (call disconnect() when
+            done), or None if the robot could not be reached
     """
     try:
         from realman_teleop import RobotController
         
-        print("\n  Connecting to robot to detect DOF...")
+        print("\n  Connecting to robot...")
         robot = RobotController(ip=ip, port=int(port), model=model)
         
         if not robot.connect():
-            print_warning("Could not connect to robot for DOF detection")
+            print_warning("Could not connect to robot for configuration detection")
             return None
+        return robot
         
+    except Exception as e:
+        print_warning(f"Connection failed: {e}")
+        return None
+
+def detect_robot_dof(robot):
+    """
+    Detect DOF (Degrees of Freedom) on a connected robot.
+    
+    Args:
+        robot: Controller returned by connect_robot()
+        
+    Returns:
+        int: Number of joints (DOF), or None if detection failed
+    """
+    try:
         # Read joint state to detect DOF
         joints = robot.get_current_joint_angles()
-        robot.disconnect()
         
         if joints:
             dof = len(joints)
@@ -89,7 +147,8 @@ def main():
     config_file = project_root / "robot.yaml"
     
     # Check if robot.yaml already exists
-    if config_file.exists():
+    previous_config = config_file.exists()
+    if previous_config:
         print_warning(f"robot.yaml file already exists at: {config_file}")
         response = input("Do you want to reconfigure? (y/N): ").strip().lower()
         if response not in ['y', 'yes']:
@@ -107,9 +166,14 @@ def main():
         ip_input = input(f"\nEnter robot IP address [{default_ip}]: ").strip()
         robot_ip = ip_input if ip_input else default_ip
         
-        # Validate IP format (basic)
-        parts = robot_ip.split('.')
-        if len(parts) == 4 and all(p.isdigit() and 0 <= int(p) <= 255 for p in parts):
+        # Validate IP format: strict dotted quad, parsed in C
+        try:
+            socket.inet_pton(socket.AF_INET, robot_ip)
+            valid_ip = True
+        except OSError:
+            valid_ip = False
+        
+        if valid_ip:
             print(f"\nTesting connection to {robot_ip}...")
             if test_ping(robot_ip):
                 print_success(f"Robot is reachable at {robot_ip}")
@@ -131,8 +195,7 @@ def main():
     
     # Get robot model
     print("\nAvailable robot models:")
-    models = ["RM65", "RM75", "RML63", "ECO65", "GEN72", "R1D2"]
-    for i, model in enumerate(models, 1):
+    for i, model in enumerate(MODELS, 1):
         print(f"  {i}. {model}")
     
     while True:
@@ -140,19 +203,33 @@ def main():
         model_input = input(f"\nEnter robot model [{default_model}]: ").strip().upper()
         robot_model = model_input if model_input else default_model
         
-        if robot_model in models or model_input.isdigit() and 1 <= int(model_input) <= len(models):
-            if model_input.isdigit():
-                robot_model = models[int(model_input) - 1]
+        if model_input in MODEL_BY_INDEX:
+            robot_model = MODEL_BY_INDEX[model_input]
             break
-        else:
-            print_error(f"Invalid model. Choose from: {', '.join(models)}")
+        if robot_model in MODEL_SET:
+            break
+        print_error(f"Invalid model. Choose from: {', '.join(MODELS)}")
     
     # Detect DOF (Degrees of Freedom)
     print("\n" + "-" * 60)
     print("Step 1b: Detecting Robot Configuration")
     print("-" * 60)
     
-    robot_dof = detect_robot_dof(robot_ip, robot_port, robot_model)
+    # Reuse the DOF found by an earlier run for the same robot instead of
+    # connecting again
+    robot_dof = None
+    if previous_config:
+        robot_dof = load_previous_dof(config_file, robot_ip, robot_port, robot_model)
+        if robot_dof is not None:
+            print_success(f"Using {robot_dof} joints (DOF) from existing robot.yaml")
+    if robot_dof is None:
+        # One connection shared by every probe of this step
+        robot = connect_robot(robot_ip, robot_port, robot_model)
+        if robot is not None:
+            try:
+                robot_dof = detect_robot_dof(robot)
+            finally:
+                robot.disconnect()
     
     if robot_dof is None:
         print_warning("Could not auto-detect DOF")
@@ -209,12 +286,12 @@ def main():
         config_data['robot']['dof'] = robot_dof
     
     try:
-        import yaml
+        _import_yaml()
         with open(config_file, 'w') as f:
             f.write("# RealMan Robot Configuration\n")
             f.write("# Generated by setup_robot.py\n")
             f.write("# Edit this file to change your robot settings\n\n")
-            yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(config_data, f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
         print_success(f"Configuration saved to: {config_file}")
     except Exception as e:
         print_error(f"Failed to save configuration: {e}")
@@ -224,9 +301,9 @@ def main():
     config_file = project_root / "config" / "robot_config.yaml"
     if config_file.exists():
         try:
-            import yaml
+            _import_yaml()
             with open(config_file, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=YamlLoader)
             
             config['robot']['ip'] = robot_ip
             config['robot']['port'] = int(robot_port)
@@ -235,7 +312,7 @@ def main():
                 config['robot']['dof'] = robot_dof
             
             with open(config_file, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False)
+                yaml.dump(config, f, Dumper=YamlDumper, default_flow_style=False)
             
             print_success(f"Also updated: {config_file}")
         except Exception as e:
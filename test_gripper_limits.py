@@ -17,8 +17,7 @@ def main():
     """Test gripper limits."""
     
     # Load configuration
-    config = ConfigLoader.load_env_config()
-    robot_config = config.get('robot', {})
+    robot_config = ConfigLoader.prewarm()
     
     print("=" * 60)
     print("Gripper Limits Test")
@@ -26,10 +25,10 @@ def main():
     
     # Create robot controller
     robot = RobotController(
-        ip=robot_config.get('ip', '192.168.10.18'),
-        port=robot_config.get('port', 8080),
-        model=robot_config.get('model', 'R1D2'),
-        dof=robot_config.get('dof')
+        ip=robot_config.ip,
+        port=robot_config.port,
+        model=robot_config.model,
+        dof=robot_config.dof
     )
     
     # Connect to robot
@@ -68,15 +67,10 @@ def main():
         
         # Test a few intermediate positions
         print("--- Testing Intermediate Positions ---")
-        for pos in [250, 500, 750]:
-            print(f"Setting to position {pos}...")
-            robot.gripper_set_position(pos, block=True, timeout=5000)
-            time.sleep(0.5)
-            
-            state = robot.gripper_get_state()
-            if state:
-                actual = state.get('actpos', 'unknown')
-                print(f"  Target: {pos}, Actual: {actual}")
+        targets = [250, 500, 750]
+        actuals = robot.gripper_sweep(targets, timeout=5.0)
+        for target, actual in zip(targets, actuals):
+            print(f"  Target: {target}, Actual: {'unknown' if actual is None else actual}")
         print()
         
         # Summary
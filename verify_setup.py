@@ -6,23 +6,34 @@ Quick verification that the environment is correctly set up.
 """
 
 import sys
+import importlib.metadata
 import importlib.util
 
-def check_module(module_name, display_name=None):
-    """Check if a Python module is installed."""
+def check_module(module_name, display_name=None, dist_name=None):
+    """
+    Check if a Python module is installed.
+    
+    Locates the module and reads its version from the installed package
+    metadata without importing it, so heavy packages are not initialized.
+    """
     if display_name is None:
         display_name = module_name
+    if dist_name is None:
+        dist_name = module_name
+    
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError) as e:
+        print(f"✗ {display_name:20s} - import error: {e}")
+        return False
     
-    spec = importlib.util.find_spec(module_name)
     if spec is not None:
         try:
-            module = importlib.import_module(module_name)
-            version = getattr(module, '__version__', 'unknown')
-            print(f"✓ {display_name:20s} - installed (version: {version})")
-            return True
-        except ImportError as e:
-            print(f"✗ {display_name:20s} - import error: {e}")
-            return False
+            version = importlib.metadata.version(dist_name)
+        except importlib.metadata.PackageNotFoundError:
+            version = 'unknown'
+        print(f"✓ {display_name:20s} - installed (version: {version})")
+        return True
     else:
         print(f"✗ {display_name:20s} - not found")
         return False
@@ -45,7 +56,7 @@ def main():
     
     # Core dependencies
     all_ok &= check_module("numpy", "NumPy")
-    all_ok &= check_module("yaml", "PyYAML")
+    all_ok &= check_module("yaml", "PyYAML", "PyYAML")
     all_ok &= check_module("pygame", "Pygame")
     all_ok &= check_module("keyboard", "Keyboard")
     all_ok &= check_module("inputs", "Inputs")